@@ -12,6 +12,14 @@ from dotenv import load_dotenv
 from discord.ext import commands
 from discord import app_commands
 from services.blocked_commands import KEREVIZCRAFT_CATEGORY, KEREVIZCRAFT_COMMAND_NAMES
+from services.hypixel_client import (
+    close_profile_disk_cache,
+    create_hypixel_session,
+    hypixel_cache_stats,
+    hypixel_http_stats,
+    hypixel_rate_limit_status,
+    open_profile_disk_cache,
+)
 from services.hypixel_key_store import HypixelAPIKeyStore
 from services.youtube_store import YouTubeAnnouncementStore
 from services.youtube_utils import extract_youtube_subscriber_count, normalize_youtube_video_id
@@ -90,7 +98,28 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+class KerevizBot(commands.Bot):
+    hypixel_session: aiohttp.ClientSession | None = None
+
+    async def setup_hook(self) -> None:
+        self.hypixel_session = create_hypixel_session()
+        try:
+            warmed = await open_profile_disk_cache()
+            print(f"[HYPIXEL] Warm-loaded {warmed} cached Minecraft profile(s) from disk.")
+        except Exception as exc:
+            print(f"[HYPIXEL] Minecraft profile disk cache is unavailable: {exc}")
+
+    async def close(self) -> None:
+        await super().close()
+        if self.hypixel_session is not None and not self.hypixel_session.closed:
+            await self.hypixel_session.close()
+        try:
+            await close_profile_disk_cache()
+        except Exception as exc:
+            print(f"[HYPIXEL] Could not flush the Minecraft profile disk cache: {exc}")
+
+
+bot = KerevizBot(command_prefix="!", intents=intents, help_command=None)
 bot.HYPIXEL_API_KEY = HYPIXEL_API_KEY
 
 start_time       = time.time()
@@ -596,6 +625,34 @@ def build_stats_embed() -> discord.Embed:
         e.add_field(name="Memory",
                     value=f"{mem_used:.1f}/{mem_total:.1f} GB\n{progress_bar(pct)}",
                     inline=False)
+    http = hypixel_http_stats()
+    limits = hypixel_rate_limit_status()
+    if http.requests:
+        e.add_field(name="Hypixel HTTP",
+                    value=(f"{http.requests} requests, avg {http.average_request_ms:.0f} ms\n"
+                           f"Reused connections: {http.reused_connections}/{http.reused_connections + http.new_connections}"
+                           f" (~{http.estimated_saved_ms / 1000:.1f}s handshakes saved)\n"
+                           f"Quota: {limits['remaining']}/{limits['limit']}, queued: {limits['queue_depth']}"),
+                    inline=False)
+    caches = hypixel_cache_stats().values()
+    lookups = sum(cache["hits"] + cache["misses"] for cache in caches)
+    if lookups:
+        e.add_field(name="Hypixel Cache",
+                    value=(f"{sum(cache['hits'] for cache in caches)}/{lookups} hits, "
+                           f"{sum(cache['entries'] for cache in caches)} entries, "
+                           f"{sum(cache['bytes'] for cache in caches) / (1024 ** 2):.1f} MB, "
+                           f"{sum(cache['evictions'] for cache in caches)} evicted"),
+                    inline=False)
+    deleted_images = bot.get_cog("DeletedImageLogs")
+    if deleted_images is not None:
+        cache = deleted_images.cache_stats()
+        budget = f"/{cache['disk_max_bytes'] / (1024 ** 2):.0f}" if cache["disk_max_bytes"] else ""
+        e.add_field(name="Deleted Image Cache",
+                    value=(f"{cache['disk_blobs']} files, {cache['disk_bytes'] / (1024 ** 2):.1f}{budget} MB, "
+                           f"{cache['disk_evictions']} evicted\n"
+                           f"Memory: {cache['memory_entries']}/{cache['memory_max_entries']} entries, "
+                           f"{cache['memory_evictions']} evicted"),
+                    inline=False)
     e.add_field(name="Python",     value=py)
     e.add_field(name="discord.py", value=dpy)
     if bot.user and bot.user.avatar:
@@ -5,12 +5,15 @@ from typing import Any
 import discord
 from discord.ext import commands
 
+from services.auto_role_store import AutoRoleSyncStore
+from services.keyed_locks import KeyedLocks
 from services.reaction_role_store import ReactionRolePanelStore, normalize_panel
+from services.role_assignment import AssignmentProgress, ProgressCallback, assign_role_to_members, resolve_members
 
 
 MEMBER_ROLE_NAME = "Member"
 ROLE_COLOR = 0x57F287
-ASSIGN_DELAY_SECONDS = 0.35
+BACKFILL_BATCH_SIZE = 100
 
 PING_ROLES_CHANNEL_ID = 1521423149286162534
 YOUTUBE_PING_ROLE_ID = 1176193004361490577
@@ -28,6 +31,9 @@ class SyncResult:
     already_had_role: int = 0
     failed: int = 0
     checked: int = 0
+    skipped_checkpoint: int = 0
+    resumed_added: int = 0
+    resumed_failed: int = 0
     error: str | None = None
 
 
@@ -75,13 +81,15 @@ class AutoRole(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._sync_lock = asyncio.Lock()
+        self._sync_locks = KeyedLocks()
         self._panel_lock = asyncio.Lock()
         self._background_task: asyncio.Task | None = None
         self._panel_task: asyncio.Task | None = None
         self._panel_records: dict[int, dict[str, Any]] = {}
         self._panel_store = ReactionRolePanelStore()
         self._panel_store_available = True
+        self._sync_store = AutoRoleSyncStore()
+        self._sync_store_available = True
 
     def _bot_member(self, guild: discord.Guild) -> discord.Member | None:
         if guild.me:
@@ -313,6 +321,7 @@ class AutoRole(commands.Cog):
                     "created_by_id": created_by_id or record.get("created_by_id"),
                     "panel_type": "notification_roles",
                     "status": "active",
+                    "backfill": record.get("backfill") or {},
                 }
             )
             return message
@@ -406,11 +415,68 @@ class AutoRole(commands.Cog):
         except (discord.Forbidden, discord.HTTPException) as exc:
             print(f"[REACTION-ROLES] Could not update {option.label} for {member}: {exc}")
 
+    async def _save_backfill_checkpoint(self, guild_id: int, option_key: str, last_user_id: int | None) -> None:
+        record = self._panel_records.get(guild_id)
+        if record is not None:
+            backfill = record.setdefault("backfill", {})
+            if last_user_id is None:
+                backfill.pop(option_key, None)
+            else:
+                backfill[option_key] = last_user_id
+        if not self._panel_store_available:
+            return
+
+        try:
+            await self._panel_store.save_backfill_checkpoint(guild_id, option_key, last_user_id)
+        except Exception as exc:
+            self._panel_store_available = False
+            print(f"[REACTION-ROLES] Could not save backfill checkpoint: {exc}")
+
+    async def _backfill_reaction_batch(
+        self,
+        guild: discord.Guild,
+        role: discord.Role,
+        users: list[discord.abc.User],
+        result: PanelSyncResult,
+    ) -> None:
+        user_ids: list[int] = []
+        for user in users:
+            if self.bot.user and user.id == self.bot.user.id:
+                continue
+            if user.bot:
+                result.skipped_bots += 1
+                continue
+            user_ids.append(user.id)
+
+        members = await resolve_members(guild, user_ids, log_prefix="[REACTION-ROLES]")
+        pending: list[discord.Member] = []
+        for user_id in user_ids:
+            member = members.get(user_id)
+            if member is None:
+                result.missing_members += 1
+            elif role in member.roles:
+                result.already_had_role += 1
+            else:
+                pending.append(member)
+
+        progress = await assign_role_to_members(
+            pending,
+            role,
+            reason="KerevizBOT notification role reaction sync",
+        )
+        result.added += progress.added
+        result.failed += progress.failed
+
     async def _sync_members_from_reactions(
         self,
         guild: discord.Guild,
         message: discord.Message,
     ) -> PanelSyncResult:
+        """Backfills notification roles from panel reactions, one page of reaction users at a time.
+
+        After each page the last handled user id is checkpointed per option on the panel record,
+        so a restarted sync pages on from there instead of starting over.
+        """
         result = PanelSyncResult()
         roles_by_emoji: dict[str, discord.Role] = {}
         for option in REACTION_ROLE_OPTIONS:
@@ -423,34 +489,31 @@ class AutoRole(commands.Cog):
                 return result
             roles_by_emoji[option.emoji] = role
 
+        checkpoints = dict((await self._load_panel_record(guild.id)).get("backfill") or {})
         for reaction in message.reactions:
-            role = roles_by_emoji.get(str(reaction.emoji))
+            emoji = str(reaction.emoji)
+            role = roles_by_emoji.get(emoji)
             if role is None:
                 continue
 
+            option = REACTION_ROLE_BY_EMOJI[emoji]
             result.checked_reactions += 1
+            last_user_id = checkpoints.get(option.key)
+            after = discord.Object(id=last_user_id) if last_user_id else None
+            batch: list[discord.abc.User] = []
             try:
-                async for user in reaction.users(limit=None):
-                    if self.bot.user and user.id == self.bot.user.id:
-                        continue
-                    if user.bot:
-                        result.skipped_bots += 1
-                        continue
-                    member = await self._fetch_member(guild, user.id)
-                    if member is None:
-                        result.missing_members += 1
-                        continue
-                    if role in member.roles:
-                        result.already_had_role += 1
-                        continue
-                    try:
-                        await member.add_roles(role, reason="KerevizBOT notification role reaction sync")
-                        result.added += 1
-                        await asyncio.sleep(ASSIGN_DELAY_SECONDS)
-                    except (discord.Forbidden, discord.HTTPException):
-                        result.failed += 1
+                async for user in reaction.users(limit=None, after=after):
+                    batch.append(user)
+                    if len(batch) >= BACKFILL_BATCH_SIZE:
+                        await self._backfill_reaction_batch(guild, role, batch, result)
+                        await self._save_backfill_checkpoint(guild.id, option.key, batch[-1].id)
+                        batch = []
+                if batch:
+                    await self._backfill_reaction_batch(guild, role, batch, result)
             except discord.HTTPException:
                 result.failed += 1
+                continue
+            await self._save_backfill_checkpoint(guild.id, option.key, None)
 
         return result
 
@@ -518,16 +581,51 @@ class AutoRole(commands.Cog):
         except discord.HTTPException as exc:
             return None, f"Could not create Member role: {exc}"
 
-    async def _iter_members(self, guild: discord.Guild):
+    async def _collect_members(self, guild: discord.Guild) -> list[discord.Member]:
+        """Uses the gateway member cache, chunking the guild first; REST paging is the fallback."""
+        if not guild.chunked:
+            try:
+                await guild.chunk(cache=True)
+            except (asyncio.TimeoutError, discord.ClientException, discord.HTTPException) as exc:
+                print(f"[AUTO-ROLE] {guild.name}: member chunking failed: {exc}")
+        if guild.chunked:
+            return list(guild.members)
+
+        members: list[discord.Member] = []
         try:
             async for member in guild.fetch_members(limit=None):
-                yield member
-            return
+                members.append(member)
+            return members
         except (discord.Forbidden, discord.HTTPException):
-            pass
+            return list(guild.members)
 
-        for member in guild.members:
-            yield member
+    async def _load_sync_checkpoint(self, guild_id: int, role_id: int) -> dict[str, Any]:
+        if not self._sync_store_available:
+            return {}
+        try:
+            checkpoint = await self._sync_store.load_checkpoint(guild_id)
+        except Exception as exc:
+            self._sync_store_available = False
+            print(f"[AUTO-ROLE] Firestore sync checkpoints are unavailable: {exc}")
+            return {}
+        return checkpoint if checkpoint.get("role_id") == role_id else {}
+
+    async def _save_sync_checkpoint(self, record: dict[str, Any]) -> None:
+        if not self._sync_store_available:
+            return
+        try:
+            await self._sync_store.save_checkpoint(record)
+        except Exception as exc:
+            self._sync_store_available = False
+            print(f"[AUTO-ROLE] Could not save sync checkpoint: {exc}")
+
+    async def _clear_sync_checkpoint(self, guild_id: int) -> None:
+        if not self._sync_store_available:
+            return
+        try:
+            await self._sync_store.clear_checkpoint(guild_id)
+        except Exception as exc:
+            print(f"[AUTO-ROLE] Could not clear sync checkpoint: {exc}")
 
     async def _assign_role(self, member: discord.Member, role: discord.Role, reason: str) -> bool:
         if member.bot or role in member.roles:
@@ -538,32 +636,76 @@ class AutoRole(commands.Cog):
         except (discord.Forbidden, discord.HTTPException):
             return False
 
-    async def sync_guild(self, guild: discord.Guild, *, reason: str) -> SyncResult:
-        async with self._sync_lock:
+    async def sync_guild(
+        self,
+        guild: discord.Guild,
+        *,
+        reason: str,
+        on_progress: ProgressCallback | None = None,
+    ) -> SyncResult:
+        """Diffs members missing the Member role up front, then assigns it through a worker pool.
+
+        Progress is checkpointed per guild, so a sync interrupted by a restart resumes after the
+        last member it had handled instead of retrying everyone who failed before.
+        """
+        async with self._sync_locks.hold(guild.id):
             result = SyncResult()
             role, role_error = await self._ensure_member_role(guild)
             if role is None or role_error:
                 result.error = role_error or "Member role could not be prepared."
                 return result
 
-            async for member in self._iter_members(guild):
+            checkpoint = await self._load_sync_checkpoint(guild.id, role.id)
+            resume_after = checkpoint.get("last_member_id") or 0
+            # Counts from before the restart stay separate; members up to the watermark were
+            # handled by that run, so they are reported as skipped rather than re-classified.
+            result.resumed_added = checkpoint.get("added", 0)
+            result.resumed_failed = checkpoint.get("failed", 0)
+
+            pending: list[discord.Member] = []
+            for member in await self._collect_members(guild):
                 result.checked += 1
                 if member.bot:
                     result.skipped_bots += 1
-                    continue
-                if role in member.roles:
+                elif member.id <= resume_after:
+                    result.skipped_checkpoint += 1
+                elif role in member.roles:
                     result.already_had_role += 1
-                    continue
-
-                added = await self._assign_role(member, role, reason)
-                if added:
-                    result.added += 1
-                    await asyncio.sleep(ASSIGN_DELAY_SECONDS)
                 else:
-                    result.failed += 1
-
+                    pending.append(member)
+
+            base_added, base_failed = result.resumed_added, result.resumed_failed
+
+            async def checkpoint_progress(progress: AssignmentProgress) -> None:
+                if progress.last_member_id is not None:
+                    await self._save_sync_checkpoint(
+                        {
+                            "guild_id": guild.id,
+                            "role_id": role.id,
+                            "last_member_id": progress.last_member_id,
+                            "added": base_added + progress.added,
+                            "failed": base_failed + progress.failed,
+                        }
+                    )
+                if on_progress is not None:
+                    await on_progress(progress)
+
+            progress = await assign_role_to_members(pending, role, reason=reason, on_progress=checkpoint_progress)
+            result.added = progress.added
+            result.failed = progress.failed
+            if checkpoint or pending:
+                await self._clear_sync_checkpoint(guild.id)
             return result
 
+    @staticmethod
+    def _resume_summary(result: SyncResult) -> str:
+        if not result.skipped_checkpoint:
+            return ""
+        return (
+            f", resumed_skipped={result.skipped_checkpoint}, "
+            f"resumed_added={result.resumed_added}, resumed_failed={result.resumed_failed}"
+        )
+
     def _start_background_sync(self) -> None:
         if self._background_task and not self._background_task.done():
             return
@@ -579,6 +721,7 @@ class AutoRole(commands.Cog):
                 print(
                     f"[AUTO-ROLE] {guild.name}: checked={result.checked}, "
                     f"added={result.added}, already={result.already_had_role}, failed={result.failed}"
+                    + self._resume_summary(result)
                 )
 
     @commands.Cog.listener()
@@ -626,17 +769,40 @@ class AutoRole(commands.Cog):
     @commands.has_permissions(manage_roles=True)
     async def autorole_sync(self, ctx: commands.Context):
         message = await ctx.send("Syncing **Member** role for everyone missing it...")
-        result = await self.sync_guild(ctx.guild, reason=f"KerevizBOT Member auto-role sync by {ctx.author}")
+
+        async def report_progress(progress: AssignmentProgress) -> None:
+            if progress.processed >= progress.total:
+                return
+            try:
+                await message.edit(
+                    content=(
+                        "Syncing **Member** role for everyone missing it...\n"
+                        f"Progress: `{progress.processed}/{progress.total}` | "
+                        f"Added: `{progress.added}` | Failed: `{progress.failed}`"
+                    )
+                )
+            except discord.HTTPException:
+                pass
+
+        result = await self.sync_guild(
+            ctx.guild,
+            reason=f"KerevizBOT Member auto-role sync by {ctx.author}",
+            on_progress=report_progress,
+        )
         if result.error:
             return await message.edit(content=f"Auto-role sync failed: {result.error}")
 
-        await message.edit(
-            content=(
-                "**Member** auto-role sync complete.\n"
-                f"Checked: `{result.checked}` | Added: `{result.added}` | "
-                f"Already had role: `{result.already_had_role}` | Failed: `{result.failed}`"
-            )
+        content = (
+            "**Member** auto-role sync complete.\n"
+            f"Checked: `{result.checked}` | Added: `{result.added}` | "
+            f"Already had role: `{result.already_had_role}` | Failed: `{result.failed}`"
         )
+        if result.skipped_checkpoint:
+            content += (
+                f"\nResumed from checkpoint: `{result.skipped_checkpoint}` member(s) handled before the restart "
+                f"(Added: `{result.resumed_added}` | Failed: `{result.resumed_failed}`)"
+            )
+        await message.edit(content=content)
 
     @commands.group(
         name="reactionroles",
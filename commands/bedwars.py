@@ -1,7 +1,11 @@
+from typing import Any
+
 import discord
 from discord.ext import commands
 
+from commands.hypixel_compare import compare_usage, handle_compare_error, send_comparison
 from services.hypixel_client import (
+    MAX_COMPARE_PLAYERS,
     HypixelClientError,
     as_int,
     bedwars_pro_score,
@@ -12,6 +16,56 @@ from services.hypixel_client import (
 )
 
 
+BWCOMPARE_USAGE = compare_usage("bwcompare")
+
+
+def bedwars_summary(player: dict[str, Any]) -> dict[str, Any]:
+    stats = (player.get("stats", {}) or {}).get("Bedwars", {}) or {}
+    level = as_int(player.get("achievements", {}).get("bedwars_level", 0))
+    wins = as_int(stats.get("wins_bedwars", 0))
+    losses = as_int(stats.get("losses_bedwars", 0))
+    kills = as_int(stats.get("kills_bedwars", 0))
+    deaths = as_int(stats.get("deaths_bedwars", 1)) or 1
+    fkills = as_int(stats.get("final_kills_bedwars", 0))
+    fdeaths = as_int(stats.get("final_deaths_bedwars", 1)) or 1
+    beds_broken = as_int(stats.get("beds_broken_bedwars", 0))
+    beds_lost = as_int(stats.get("beds_lost_bedwars", 1)) or 1
+
+    return {
+        "level": level,
+        "wins": wins,
+        "losses": losses,
+        "kills": kills,
+        "deaths": deaths,
+        "final_kills": fkills,
+        "final_deaths": fdeaths,
+        "beds_broken": beds_broken,
+        "beds_lost": beds_lost,
+        "kdr": ratio(kills, deaths),
+        "fkdr": ratio(fkills, fdeaths),
+        "bblr": ratio(beds_broken, beds_lost),
+        "wlr": ratio(wins, losses),
+        "pro_score": bedwars_pro_score(
+            wins=wins,
+            losses=losses,
+            kills=kills,
+            deaths=deaths,
+            final_kills=fkills,
+            final_deaths=fdeaths,
+            beds_broken=beds_broken,
+            beds_lost=beds_lost,
+            level=level,
+        ),
+    }
+
+
+def bedwars_compare_lines(summary: dict[str, Any]) -> str:
+    return (
+        f"FKDR `{summary['fkdr']}` | W/L `{summary['wlr']}` | BBLR `{summary['bblr']}`\n"
+        f"Wins `{summary['wins']}` | Final Kills `{summary['final_kills']}`"
+    )
+
+
 class Bedwars(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -20,44 +74,34 @@ class Bedwars(commands.Cog):
     async def bedwars(self, ctx: commands.Context, username: str):
         async with ctx.typing():
             try:
-                bundle = await fetch_hypixel_player(self.bot.HYPIXEL_API_KEY, username)
+                bundle = await fetch_hypixel_player(
+                    self.bot.HYPIXEL_API_KEY,
+                    username,
+                    session=getattr(self.bot, "hypixel_session", None),
+                )
             except HypixelClientError as exc:
                 return await ctx.send(format_hypixel_error(exc))
 
         player = bundle.player
         uuid = bundle.uuid
-        stats = (player.get("stats", {}) or {}).get("Bedwars", {}) or {}
-
         displayname = player.get("displayname", bundle.username)
         rank = get_rank(player)
         color = self.get_rank_color(rank)
-        level = as_int(player.get("achievements", {}).get("bedwars_level", 0))
-
-        wins = as_int(stats.get("wins_bedwars", 0))
-        losses = as_int(stats.get("losses_bedwars", 0))
-        kills = as_int(stats.get("kills_bedwars", 0))
-        deaths = as_int(stats.get("deaths_bedwars", 1)) or 1
-        fkills = as_int(stats.get("final_kills_bedwars", 0))
-        fdeaths = as_int(stats.get("final_deaths_bedwars", 1)) or 1
-        beds_broken = as_int(stats.get("beds_broken_bedwars", 0))
-        beds_lost = as_int(stats.get("beds_lost_bedwars", 1)) or 1
-
-        kdr = ratio(kills, deaths)
-        fkdr = ratio(fkills, fdeaths)
-        bblr = ratio(beds_broken, beds_lost)
-        wlr = ratio(wins, losses)
-
-        pro_score = bedwars_pro_score(
-            wins=wins,
-            losses=losses,
-            kills=kills,
-            deaths=deaths,
-            final_kills=fkills,
-            final_deaths=fdeaths,
-            beds_broken=beds_broken,
-            beds_lost=beds_lost,
-            level=level,
-        )
+        summary = bedwars_summary(player)
+        level = summary["level"]
+        wins = summary["wins"]
+        losses = summary["losses"]
+        kills = summary["kills"]
+        deaths = summary["deaths"]
+        fkills = summary["final_kills"]
+        fdeaths = summary["final_deaths"]
+        beds_broken = summary["beds_broken"]
+        beds_lost = summary["beds_lost"]
+        kdr = summary["kdr"]
+        fkdr = summary["fkdr"]
+        bblr = summary["bblr"]
+        wlr = summary["wlr"]
+        pro_score = summary["pro_score"]
 
         embed = discord.Embed(
             title=f"**{displayname}** | {rank}",
@@ -92,6 +136,27 @@ class Bedwars(commands.Cog):
             return await ctx.send("Usage: `!bedwars <minecraft_username>`")
         raise error
 
+    @commands.command(
+        name="bwcompare",
+        aliases=["bwc"],
+        help=f"Compares BedWars statistics for 2-{MAX_COMPARE_PLAYERS} players.",
+    )
+    async def bedwars_compare(self, ctx: commands.Context, *usernames: str):
+        await send_comparison(
+            ctx,
+            self.bot,
+            usernames,
+            title="BedWars Comparison",
+            usage=BWCOMPARE_USAGE,
+            summarize=bedwars_summary,
+            stat_lines=bedwars_compare_lines,
+            rank_color=self.get_rank_color,
+        )
+
+    @bedwars_compare.error
+    async def bedwars_compare_error(self, ctx: commands.Context, error: commands.CommandError):
+        await handle_compare_error(ctx, error, BWCOMPARE_USAGE)
+
     def get_rank_color(self, rank: str) -> discord.Color:
         colors = {
             "MVP++": discord.Color.gold(),
@@ -1,6 +1,8 @@
 import asyncio
 import os
 import re
+import sqlite3
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -9,16 +11,27 @@ import discord
 from discord.ext import commands
 
 from services.deleted_image_store import DeletedImageStore
+from services.image_blob_store import ImageBlobStore, blob_digest
+from services.image_recompressor import CONTENT_TYPES, recompress_image_bytes
 
 
 DEFAULT_LOG_CHANNEL_ID = 1411317215579607132
 CACHE_DIR = Path("deleted_image_cache")
+BLOB_DIRNAME = "blobs"
 IMAGE_EXTENSIONS = {".apng", ".avif", ".bmp", ".gif", ".jpeg", ".jpg", ".png", ".webp"}
 MAX_IMAGE_BYTES = 25 * 1024 * 1024
 MAX_FILES_PER_MESSAGE = 10
 DEFAULT_CACHE_RETENTION_DAYS = 30
 DEFAULT_CACHE_CLEANUP_INTERVAL_SECONDS = 24 * 60 * 60
 DEFAULT_CACHE_CLEANUP_BATCH_SIZE = 200
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MEMORY_CACHE_MAX_ENTRIES = 500
+DEFAULT_DOWNLOAD_WORKERS = 3
+DEFAULT_DOWNLOAD_QUEUE_SIZE = 200
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+DEFAULT_RECOMPRESS_MAX_DIMENSION = 0
+DEFAULT_RECOMPRESS_MIN_BYTES = 1024 * 1024
+DEFAULT_RECOMPRESS_WORKERS = 1
 
 
 def deleted_image_log_channel_id() -> int:
@@ -58,7 +71,16 @@ class DeletedImageLogs(commands.Cog):
         self.bot = bot
         self.store = DeletedImageStore()
         self.log_channel_id = deleted_image_log_channel_id()
-        self._memory_cache: dict[int, dict[str, Any]] = {}
+        self._memory_cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self.memory_cache_max_entries = max(
+            1,
+            env_int("DELETED_IMAGE_MEMORY_CACHE_MAX_ENTRIES", DEFAULT_MEMORY_CACHE_MAX_ENTRIES),
+        )
+        self.memory_evictions = 0
+        self.blobs = ImageBlobStore(
+            CACHE_DIR / BLOB_DIRNAME,
+            max_bytes=env_int("DELETED_IMAGE_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES),
+        )
         self.retention_days = env_int("DELETED_IMAGE_CACHE_RETENTION_DAYS", DEFAULT_CACHE_RETENTION_DAYS)
         self.cleanup_interval = env_int(
             "DELETED_IMAGE_CACHE_CLEANUP_INTERVAL",
@@ -66,10 +88,41 @@ class DeletedImageLogs(commands.Cog):
         )
         self.cleanup_batch_size = env_int("DELETED_IMAGE_CACHE_CLEANUP_BATCH_SIZE", DEFAULT_CACHE_CLEANUP_BATCH_SIZE)
         self._cleanup_task: asyncio.Task | None = None
+        self.download_workers = max(1, env_int("DELETED_IMAGE_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS))
+        self.download_queue_size = max(1, env_int("DELETED_IMAGE_DOWNLOAD_QUEUE_SIZE", DEFAULT_DOWNLOAD_QUEUE_SIZE))
+        self.download_drops = 0
+        self._download_queue: OrderedDict[int, discord.Message] = OrderedDict()
+        self._download_ready = asyncio.Event()
+        self._downloading: dict[int, asyncio.Future] = {}
+        self._download_tasks: list[asyncio.Task] = []
+        # Workers fetch every attachment of a message at once; each read holds up to 25 MiB until stored.
+        self._download_slots = asyncio.Semaphore(
+            max(1, env_int("DELETED_IMAGE_DOWNLOAD_CONCURRENCY", DEFAULT_DOWNLOAD_CONCURRENCY))
+        )
+        self.recompress_max_dimension = max(
+            0,
+            env_int("DELETED_IMAGE_RECOMPRESS_MAX_DIMENSION", DEFAULT_RECOMPRESS_MAX_DIMENSION),
+        )
+        self.recompress_min_bytes = max(0, env_int("DELETED_IMAGE_RECOMPRESS_MIN_BYTES", DEFAULT_RECOMPRESS_MIN_BYTES))
+        self.recompressed_bytes_saved = 0
+        # Each decode can hold a full-size image in memory, so only a few run at a time.
+        self._recompress_slots = asyncio.Semaphore(
+            max(1, env_int("DELETED_IMAGE_RECOMPRESS_WORKERS", DEFAULT_RECOMPRESS_WORKERS))
+        )
+
+    async def cog_load(self) -> None:
+        try:
+            await self.blobs.run(self.blobs.open)
+        except (OSError, sqlite3.Error) as exc:
+            print(f"[DELETED-IMAGE-LOGS] Local image cache index is unavailable: {exc}")
 
     def cog_unload(self) -> None:
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
+        for task in self._download_tasks:
+            task.cancel()
+        self._download_tasks = []
+        self.blobs.close()
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -102,17 +155,11 @@ class DeletedImageLogs(commands.Cog):
         return [attachment for attachment in message.attachments if self._is_image_attachment(attachment)]
 
     @staticmethod
-    def _cache_path(message: discord.Message, attachment: discord.Attachment) -> Path:
-        filename = safe_filename(attachment.filename)
-        return CACHE_DIR / str(message.guild.id) / f"{message.id}_{attachment.id}_{filename}"
-
-    @staticmethod
-    async def _save_attachment(attachment: discord.Attachment, path: Path) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
+    async def _read_attachment(attachment: discord.Attachment) -> bytes:
         try:
-            await attachment.save(path, use_cached=True)
+            return await attachment.read(use_cached=True)
         except TypeError:
-            await attachment.save(path)
+            return await attachment.read()
 
     def _payload(self, message: discord.Message, images: list[dict[str, Any]]) -> dict[str, Any]:
         return {
@@ -125,41 +172,42 @@ class DeletedImageLogs(commands.Cog):
             "images": images,
         }
 
-    async def _cache_message_images(self, message: discord.Message, persist: bool = True) -> list[dict[str, Any]]:
-        images: list[dict[str, Any]] = []
-
-        for attachment in self._image_attachments(message):
-            image_info: dict[str, Any] = {
-                "attachment_id": str(attachment.id),
-                "filename": attachment.filename,
-                "content_type": attachment.content_type,
-                "size": int(attachment.size or 0),
-                "url": attachment.url,
-                "proxy_url": attachment.proxy_url,
-                "cached": False,
-                "cache_path": None,
-            }
-
-            if attachment.size and attachment.size > MAX_IMAGE_BYTES:
-                image_info["error"] = "Image is larger than the local cache limit."
-                images.append(image_info)
+    def _enqueue_download(self, message: discord.Message) -> None:
+        """Queues a message for the download workers, dropping the oldest queued one when full."""
+        self._download_queue[message.id] = message
+        while len(self._download_queue) > self.download_queue_size:
+            self._download_queue.popitem(last=False)
+            self.download_drops += 1
+        self._download_ready.set()
+        self._download_tasks = [task for task in self._download_tasks if not task.done()]
+        while len(self._download_tasks) < self.download_workers:
+            self._download_tasks.append(asyncio.create_task(self._download_worker()))
+
+    async def _download_worker(self) -> None:
+        while True:
+            if not self._download_queue:
+                self._download_ready.clear()
+                await self._download_ready.wait()
                 continue
-
-            path = self._cache_path(message, attachment)
+            message_id, message = self._download_queue.popitem(last=False)
+            done = asyncio.get_running_loop().create_future()
+            self._downloading[message_id] = done
             try:
-                await self._save_attachment(attachment, path)
-            except (discord.HTTPException, OSError):
-                image_info["error"] = "Could not cache image."
-                images.append(image_info)
-                continue
+                await self._cache_message_images(message)
+            except Exception as exc:
+                print(f"[DELETED-IMAGE-LOGS] Could not cache images for message {message_id}: {exc}")
+            finally:
+                self._downloading.pop(message_id, None)
+                done.set_result(None)
 
-            image_info["cached"] = True
-            image_info["cache_path"] = str(path)
-            images.append(image_info)
+    async def _cache_message_images(self, message: discord.Message, persist: bool = True) -> list[dict[str, Any]]:
+        """Downloads every image attachment of the message concurrently, then saves one payload."""
+        attachments = self._image_attachments(message)
+        images = list(await asyncio.gather(*(self._cache_attachment(message, attachment) for attachment in attachments)))
 
         if images:
             payload = self._payload(message, images)
-            self._memory_cache[message.id] = payload
+            self._remember_payload(message.id, payload)
             if persist:
                 try:
                     await self.store.save_message(message.id, payload)
@@ -167,6 +215,108 @@ class DeletedImageLogs(commands.Cog):
                     pass
         return images
 
+    async def _cache_attachment(self, message: discord.Message, attachment: discord.Attachment) -> dict[str, Any]:
+        image_info: dict[str, Any] = {
+            "attachment_id": str(attachment.id),
+            "filename": attachment.filename,
+            "content_type": attachment.content_type,
+            "size": int(attachment.size or 0),
+            "url": attachment.url,
+            "proxy_url": attachment.proxy_url,
+            "cached": False,
+            "blob": None,
+        }
+
+        if attachment.size and attachment.size > MAX_IMAGE_BYTES:
+            image_info["error"] = "Image is larger than the local cache limit."
+            return image_info
+
+        suffix = Path(safe_filename(attachment.filename)).suffix.lower()
+        try:
+            async with self._download_slots:
+                data = await self._read_attachment(attachment)
+                if self.recompress_max_dimension and len(data) > self.recompress_min_bytes:
+                    digest = await self._store_recompressed(message, attachment, data, suffix, image_info)
+                else:
+                    digest = await self.blobs.run(self.blobs.add, message.id, attachment.id, data, suffix)
+        except (discord.HTTPException, OSError, sqlite3.Error):
+            image_info["error"] = "Could not cache image."
+            return image_info
+        except Exception as exc:
+            # Attachments are gathered together; one unexpected failure must not drop its siblings.
+            print(f"[DELETED-IMAGE-LOGS] Could not cache attachment {attachment.id}: {exc!r}")
+            image_info["error"] = "Could not cache image."
+            return image_info
+
+        image_info["cached"] = True
+        image_info["blob"] = digest
+        return image_info
+
+    async def _store_recompressed(
+        self,
+        message: discord.Message,
+        attachment: discord.Attachment,
+        data: bytes,
+        suffix: str,
+        image_info: dict[str, Any],
+    ) -> str:
+        """Stores a large image as a smaller copy, reusing the copy made when it was posted before.
+
+        Falls back to the original bytes when recompression would not help.
+        """
+        source = await asyncio.to_thread(blob_digest, data)
+        stored = await self.blobs.run(self.blobs.add_reference, message.id, attachment.id, source)
+        if stored is None:
+            async with self._recompress_slots:
+                recompressed = await asyncio.to_thread(
+                    recompress_image_bytes,
+                    data,
+                    max_dimension=self.recompress_max_dimension,
+                )
+            if recompressed is None:
+                return await self.blobs.run(self.blobs.add, message.id, attachment.id, data, suffix, source)
+            digest = await self.blobs.run(
+                self.blobs.add,
+                message.id,
+                attachment.id,
+                recompressed.data,
+                recompressed.suffix,
+                source,
+            )
+            stored = (digest, recompressed.suffix, len(recompressed.data))
+
+        digest, stored_suffix, stored_size = stored
+        if digest != source:
+            self.recompressed_bytes_saved += len(data) - stored_size
+            image_info["stored_filename"] = f"{Path(attachment.filename).stem}{stored_suffix}"
+            image_info["stored_content_type"] = CONTENT_TYPES.get(stored_suffix)
+            image_info["stored_size"] = stored_size
+        return digest
+
+    def _remember_payload(self, message_id: int, payload: dict[str, Any]) -> None:
+        self._memory_cache[message_id] = payload
+        self._memory_cache.move_to_end(message_id)
+        while len(self._memory_cache) > self.memory_cache_max_entries:
+            self._memory_cache.popitem(last=False)
+            self.memory_evictions += 1
+
+    def cache_stats(self) -> dict[str, int]:
+        """Cache sizes and evictions, download queue backpressure, and bytes saved by recompression."""
+        disk = self.blobs.stats()
+        return {
+            "memory_entries": len(self._memory_cache),
+            "memory_max_entries": self.memory_cache_max_entries,
+            "memory_evictions": self.memory_evictions,
+            "disk_blobs": disk["blobs"],
+            "disk_bytes": disk["bytes"],
+            "disk_max_bytes": disk["max_bytes"],
+            "disk_evictions": disk["evictions"],
+            "disk_evicted_bytes": disk["evicted_bytes"],
+            "download_queue": len(self._download_queue),
+            "download_drops": self.download_drops,
+            "recompressed_bytes_saved": self.recompressed_bytes_saved,
+        }
+
     async def _log_channel(self):
         channel = self.bot.get_channel(self.log_channel_id)
         if channel is None:
@@ -200,10 +350,28 @@ class DeletedImageLogs(commands.Cog):
         embed.set_footer(text=f"Message ID: {data.get('message_id', message.id)}")
         return embed
 
-    @staticmethod
-    def _delete_cached_files(data: dict[str, Any]) -> None:
-        for image in data.get("images", []):
-            cache_path = image.get("cache_path") if isinstance(image, dict) else None
+    def _image_paths(self, images: list[dict[str, Any]]) -> list[Path | None]:
+        """Resolves each cached image to its shared blob, or the per-message file of older records."""
+        paths: list[Path | None] = []
+        for image in images:
+            path = None
+            if image.get("cached") and image.get("blob"):
+                path = self.blobs.path_for(str(image["blob"]))
+            elif image.get("cached") and image.get("cache_path"):
+                legacy_path = Path(str(image["cache_path"]))
+                path = legacy_path if legacy_path.is_file() else None
+            paths.append(path)
+        return paths
+
+    async def _delete_cached_files(self, data: dict[str, Any]) -> None:
+        images = [image for image in data.get("images", []) if isinstance(image, dict)]
+        if any(image.get("blob") for image in images) and data.get("message_id"):
+            try:
+                await self.blobs.run(self.blobs.release, str(data["message_id"]))
+            except sqlite3.Error as exc:
+                print(f"[DELETED-IMAGE-LOGS] Could not release cached images: {exc}")
+        for image in images:
+            cache_path = image.get("cache_path")
             if not cache_path:
                 continue
             path = Path(str(cache_path))
@@ -213,35 +381,33 @@ class DeletedImageLogs(commands.Cog):
             except OSError:
                 pass
 
-    @staticmethod
-    def _delete_empty_cache_dirs() -> None:
-        if not CACHE_DIR.exists():
-            return
-        for path in sorted(CACHE_DIR.rglob("*"), key=lambda item: len(item.parts), reverse=True):
-            if not path.is_dir():
-                continue
-            try:
-                path.rmdir()
-            except OSError:
-                pass
-
     @staticmethod
     def _delete_old_local_cache_files(cutoff: datetime) -> int:
+        """Expires per-message files from before the blob cache, which sit one level deep per guild.
+
+        Only the top level and those legacy guild directories are listed; the blob directory is
+        expired by bucket instead. Emptied guild directories are removed, so this stops costing
+        anything once the legacy files have aged out.
+        """
         if not CACHE_DIR.exists():
             return 0
 
         cutoff_ts = cutoff.timestamp()
         deleted = 0
-        for path in CACHE_DIR.rglob("*"):
-            if not path.is_file():
+        for directory in CACHE_DIR.iterdir():
+            if directory.name == BLOB_DIRNAME or not directory.is_dir():
                 continue
+            for path in directory.iterdir():
+                try:
+                    if path.is_file() and path.stat().st_mtime <= cutoff_ts:
+                        path.unlink()
+                        deleted += 1
+                except OSError:
+                    pass
             try:
-                if path.stat().st_mtime <= cutoff_ts:
-                    path.unlink()
-                    deleted += 1
+                directory.rmdir()
             except OSError:
                 pass
-        DeletedImageLogs._delete_empty_cache_dirs()
         return deleted
 
     async def cleanup_old_cache_entries(self) -> int:
@@ -254,7 +420,7 @@ class DeletedImageLogs(commands.Cog):
                 break
             deleted_docs += len(payloads)
             for payload in payloads:
-                self._delete_cached_files(payload)
+                await self._delete_cached_files(payload)
                 try:
                     self._memory_cache.pop(int(payload.get("message_id")), None)
                 except (TypeError, ValueError):
@@ -263,6 +429,8 @@ class DeletedImageLogs(commands.Cog):
                 break
 
         deleted_files = self._delete_old_local_cache_files(cutoff)
+        deleted_files += await self.blobs.run(self.blobs.expire_buckets, cutoff.timestamp())
+        deleted_files += await self.blobs.run(self.blobs.release_older_than, cutoff.timestamp())
         if deleted_docs or deleted_files:
             print(
                 "[DELETED-IMAGE-LOGS] Deleted "
@@ -276,11 +444,8 @@ class DeletedImageLogs(commands.Cog):
             return False
 
         images = [image for image in data.get("images", []) if isinstance(image, dict)]
-        file_images = [
-            image
-            for image in images
-            if image.get("cached") and image.get("cache_path") and Path(str(image["cache_path"])).is_file()
-        ]
+        paths = await self.blobs.run(self._image_paths, images)
+        file_images = [(image, path) for image, path in zip(images, paths) if path is not None]
         embed = self._build_embed(message, data, len(file_images))
 
         if not file_images:
@@ -291,8 +456,11 @@ class DeletedImageLogs(commands.Cog):
         for index in range(0, len(file_images), MAX_FILES_PER_MESSAGE):
             chunk = file_images[index : index + MAX_FILES_PER_MESSAGE]
             files = [
-                discord.File(str(image["cache_path"]), filename=safe_filename(str(image.get("filename") or "image")))
-                for image in chunk
+                discord.File(
+                    str(path),
+                    filename=safe_filename(str(image.get("stored_filename") or image.get("filename") or "image")),
+                )
+                for image, path in chunk
             ]
             try:
                 if index == 0:
@@ -313,13 +481,19 @@ class DeletedImageLogs(commands.Cog):
             return
         if not self._image_attachments(message):
             return
-        await self._cache_message_images(message)
+        self._enqueue_download(message)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
         if not message.guild or message.channel.id == self.log_channel_id:
             return
 
+        # Still queued: download it right away below. Already downloading: wait for that to finish.
+        self._download_queue.pop(message.id, None)
+        in_flight = self._downloading.get(message.id)
+        if in_flight is not None:
+            await asyncio.shield(in_flight)
+
         data = self._memory_cache.get(message.id)
         if data is None:
             data = await self.store.load_message(message.id)
@@ -340,7 +514,7 @@ class DeletedImageLogs(commands.Cog):
                 await self.store.delete_message(message.id)
             except Exception:
                 pass
-            self._delete_cached_files(data)
+            await self._delete_cached_files(data)
 
 
 async def setup(bot: commands.Bot):
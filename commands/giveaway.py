@@ -1,27 +1,38 @@
 import asyncio
+import heapq
 import json
 import os
 import random
 import re
 import secrets
 import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from services.giveaway_store import GiveawayStore, normalize_record
+from services.giveaway_store import EntrantSet, GiveawayStore, normalize_record
+from services.keyed_locks import KeyedLocks
+from services.role_assignment import resolve_members
+from services.write_behind import WriteBehindQueue
 
 
 DATA_FILE = "giveaways.json"
 CHECK_INTERVAL = 20
+DEFAULT_EMBED_REFRESH_SECONDS = 5
+DEFAULT_ARCHIVE_AFTER_DAYS = 7
+ARCHIVE_SWEEP_INTERVAL = 6 * 60 * 60
 MIN_DURATION_SECONDS = 60
 MAX_DURATION_SECONDS = 90 * 24 * 60 * 60
 DEFAULT_COLOR = discord.Color.green().value
 DURATION_RE = re.compile(r"(\d+)\s*([smhdw])", re.IGNORECASE)
 PARTICIPANT_PREVIEW_LIMIT = 50
+PARTICIPANT_PAGE_CACHE_SIZE = 256
+MAX_ENTRY_WEIGHT = 50
 ACTIVE_PARTICIPANTS_CUSTOM_ID = "kereviz_giveaway_participants_active"
 ENDED_PARTICIPANTS_CUSTOM_ID = "kereviz_giveaway_participants_ended"
 
@@ -41,6 +52,26 @@ def now_ts() -> int:
     return int(datetime.now(timezone.utc).timestamp())
 
 
+def embed_refresh_seconds() -> float:
+    raw_value = os.getenv("GIVEAWAY_EMBED_REFRESH_SECONDS")
+    if raw_value:
+        try:
+            return max(0.0, float(raw_value.strip().strip('"')))
+        except ValueError:
+            pass
+    return float(DEFAULT_EMBED_REFRESH_SECONDS)
+
+
+def archive_after_seconds() -> int:
+    raw_value = os.getenv("GIVEAWAY_ARCHIVE_AFTER_DAYS")
+    if raw_value:
+        try:
+            return max(0, int(float(raw_value.strip().strip('"')) * 24 * 60 * 60))
+        except ValueError:
+            pass
+    return DEFAULT_ARCHIVE_AFTER_DAYS * 24 * 60 * 60
+
+
 def parse_duration(value: str) -> int:
     raw = value.strip().lower()
     if not raw:
@@ -105,7 +136,9 @@ def valid_url(value: str | None) -> str | None:
     raise ValueError("Image URLs must start with http:// or https://.")
 
 
-def normalize_entrant_ids(raw_entrants: list[Any] | tuple[Any, ...] | None) -> list[int]:
+def normalize_entrant_ids(raw_entrants: list[Any] | tuple[Any, ...] | EntrantSet | None) -> list[int]:
+    if isinstance(raw_entrants, EntrantSet):
+        return raw_entrants.to_list()
     entrant_ids: list[int] = []
     seen: set[int] = set()
     for entry in raw_entrants or []:
@@ -120,7 +153,26 @@ def normalize_entrant_ids(raw_entrants: list[Any] | tuple[Any, ...] | None) -> l
     return entrant_ids
 
 
-def format_participants_preview(raw_entrants: list[Any] | tuple[Any, ...] | None) -> tuple[str, int, bool]:
+def weighted_sample(
+    weighted_ids: Iterable[tuple[int, int]],
+    count: int,
+    rng: random.Random | None = None,
+) -> list[int]:
+    """Draws `count` distinct ids, each pick proportional to weight among those not yet picked.
+
+    Uses Efraimidis-Spirakis keys (u ** (1 / weight)) and keeps the largest ones, so the draw is a
+    single O(n log k) pass instead of rebuilding a ticket pool after every winner.
+    """
+    rng = rng or random.SystemRandom()
+    keyed = (
+        (rng.random() ** (1.0 / weight), user_id)
+        for user_id, weight in weighted_ids
+        if weight > 0
+    )
+    return [user_id for _key, user_id in heapq.nlargest(max(0, count), keyed)]
+
+
+def format_participants_preview(raw_entrants: list[Any] | tuple[Any, ...] | EntrantSet | None) -> tuple[str, int, bool]:
     entrant_ids = normalize_entrant_ids(raw_entrants)
     total = len(entrant_ids)
     if not entrant_ids:
@@ -134,7 +186,7 @@ def format_participants_preview(raw_entrants: list[Any] | tuple[Any, ...] | None
     return "\n".join(lines), total, truncated
 
 
-def participant_pages(raw_entrants: list[Any] | tuple[Any, ...] | None) -> tuple[list[str], int]:
+def participant_pages(raw_entrants: list[Any] | tuple[Any, ...] | EntrantSet | None) -> tuple[list[str], int]:
     entrant_ids = normalize_entrant_ids(raw_entrants)
     total = len(entrant_ids)
     if not entrant_ids:
@@ -151,6 +203,132 @@ def participant_pages(raw_entrants: list[Any] | tuple[Any, ...] | None) -> tuple
     return pages, total
 
 
+class GiveawayIndex:
+    """Secondary lookups over giveaway records by message id, guild and status."""
+
+    def __init__(self):
+        self.by_message: dict[int, str] = {}
+        self.by_guild: dict[int, set[str]] = {}
+        self.by_status: dict[str, set[str]] = {}
+        self._keys: dict[str, tuple[int | None, int | None, str]] = {}
+
+    def rebuild(self, records: dict[str, dict[str, Any]]) -> None:
+        self.by_message.clear()
+        self.by_guild.clear()
+        self.by_status.clear()
+        self._keys.clear()
+        for record in records.values():
+            self.update(record)
+
+    def update(self, record: dict[str, Any]) -> None:
+        giveaway_id = str(record["id"])
+        message_id = record.get("message_id")
+        keys = (
+            int(message_id) if message_id is not None else None,
+            int(record["guild_id"]) if record.get("guild_id") is not None else None,
+            str(record.get("status") or "active"),
+        )
+        if self._keys.get(giveaway_id) == keys:
+            return
+        self.remove(giveaway_id)
+        self._keys[giveaway_id] = keys
+        message_id, guild_id, status = keys
+        if message_id is not None:
+            self.by_message[message_id] = giveaway_id
+        if guild_id is not None:
+            self.by_guild.setdefault(guild_id, set()).add(giveaway_id)
+        self.by_status.setdefault(status, set()).add(giveaway_id)
+
+    def remove(self, giveaway_id: str) -> None:
+        keys = self._keys.pop(giveaway_id, None)
+        if keys is None:
+            return
+        message_id, guild_id, status = keys
+        if message_id is not None and self.by_message.get(message_id) == giveaway_id:
+            del self.by_message[message_id]
+        for index, key in ((self.by_guild, guild_id), (self.by_status, status)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(giveaway_id)
+                if not ids:
+                    del index[key]
+
+    def guild_ids(self, guild_id: int, status: str | None = None) -> set[str]:
+        ids = self.by_guild.get(guild_id, set())
+        if status is None:
+            return set(ids)
+        return ids & self.by_status.get(status, set())
+
+
+class ParticipantPages:
+    __slots__ = ("version", "pages", "total", "summary")
+
+    def __init__(self, version: int, pages: list[str], total: int, summary: dict[str, Any]):
+        self.version = version
+        self.pages = pages
+        self.total = total
+        self.summary = summary
+
+
+class ParticipantPageIndex:
+    """Rendered participant pages per giveaway, rebuilt only after its entrants change.
+
+    Every entry change bumps the giveaway's version; cached pages are reused while the version
+    still matches, so paging through participants is a list lookup.
+    """
+
+    def __init__(self, max_entries: int = PARTICIPANT_PAGE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._versions: dict[str, int] = {}
+        self._entries: OrderedDict[str, ParticipantPages] = OrderedDict()
+        self._by_message: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, giveaway_id: str) -> None:
+        self._versions[giveaway_id] = self._versions.get(giveaway_id, 0) + 1
+
+    def remove(self, giveaway_id: str) -> None:
+        self._versions.pop(giveaway_id, None)
+        self._drop(giveaway_id)
+
+    def _drop(self, giveaway_id: str) -> None:
+        entry = self._entries.pop(giveaway_id, None)
+        message_id = entry.summary.get("message_id") if entry is not None else None
+        if message_id is not None and self._by_message.get(message_id) == giveaway_id:
+            del self._by_message[message_id]
+
+    def find_by_message(self, message_id: int, guild_id: int | None = None) -> str | None:
+        """Returns the giveaway id of cached pages for a message, so archived giveaways skip a reload."""
+        giveaway_id = self._by_message.get(message_id)
+        entry = self._entries.get(giveaway_id) if giveaway_id is not None else None
+        if entry is None or (guild_id is not None and entry.summary.get("guild_id") != guild_id):
+            return None
+        return giveaway_id
+
+    def get(self, giveaway_id: str, record: dict[str, Any] | None = None) -> ParticipantPages | None:
+        """Returns current pages for `record`, or whatever is cached when the record is unknown."""
+        entry = self._entries.get(giveaway_id)
+        if record is not None:
+            version = self._versions.get(giveaway_id, 0)
+            if entry is None or entry.version != version:
+                pages, total = participant_pages(record.get("entrants", []))
+                entry = ParticipantPages(version, pages, total, {})
+                self._entries[giveaway_id] = entry
+            entry.summary = {
+                key: record.get(key) for key in ("id", "guild_id", "message_id", "prize", "status", "color")
+            }
+            if entry.summary["message_id"] is not None:
+                self._by_message[entry.summary["message_id"]] = giveaway_id
+        if entry is None:
+            return None
+        self._entries.move_to_end(giveaway_id)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+        return entry
+
+
 class GiveawayJoinView(discord.ui.View):
     def __init__(self, cog: "Giveaway"):
         super().__init__(timeout=None)
@@ -180,18 +358,14 @@ class GiveawayEndedView(discord.ui.View):
 
 
 class GiveawayParticipantsView(discord.ui.View):
-    def __init__(self, cog: "Giveaway", record: dict[str, Any], requester_id: int):
+    """Holds only the giveaway id and page number; pages come from the cog's page index."""
+
+    def __init__(self, cog: "Giveaway", giveaway_id: str, requester_id: int):
         super().__init__(timeout=180)
         self.cog = cog
-        self.record = dict(record)
+        self.giveaway_id = giveaway_id
         self.requester_id = requester_id
-        self.pages, self.total = participant_pages(record.get("entrants", []))
         self.page_index = 0
-        self._update_buttons()
-
-    @property
-    def needs_pagination(self) -> bool:
-        return len(self.pages) > 1
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id == self.requester_id:
@@ -199,38 +373,48 @@ class GiveawayParticipantsView(discord.ui.View):
         await interaction.response.send_message("This participant list is not yours.", ephemeral=True)
         return False
 
-    def _update_buttons(self) -> None:
+    def render(self) -> tuple[discord.Embed, bool] | None:
+        """Builds the current page embed and whether paging buttons are needed."""
+        entry = self.cog._participant_pages(self.giveaway_id)
+        if entry is None:
+            return None
+        page_count = len(entry.pages)
+        self.page_index = min(max(0, self.page_index), page_count - 1)
         self.previous_page.disabled = self.page_index <= 0
-        self.next_page.disabled = self.page_index >= len(self.pages) - 1
+        self.next_page.disabled = self.page_index >= page_count - 1
 
-    def embed(self) -> discord.Embed:
-        status = str(self.record.get("status", "active")).title()
+        summary = entry.summary
         embed = discord.Embed(
-            title=f"Participants: {self.record.get('prize', 'Unknown Prize')}",
-            description=self.pages[self.page_index],
-            color=int(self.record.get("color") or DEFAULT_COLOR),
+            title=f"Participants: {summary.get('prize') or 'Unknown Prize'}",
+            description=entry.pages[self.page_index],
+            color=int(summary.get("color") or DEFAULT_COLOR),
             timestamp=discord.utils.utcnow(),
         )
-        embed.add_field(name="Total Entries", value=str(self.total), inline=True)
-        embed.add_field(name="Status", value=status, inline=True)
-        embed.add_field(name="Giveaway ID", value=f"`{self.record.get('id', 'unknown')}`", inline=True)
-        if self.needs_pagination:
-            embed.set_footer(text=f"Page {self.page_index + 1}/{len(self.pages)}")
+        embed.add_field(name="Total Entries", value=str(entry.total), inline=True)
+        embed.add_field(name="Status", value=str(summary.get("status") or "active").title(), inline=True)
+        embed.add_field(name="Giveaway ID", value=f"`{summary.get('id') or 'unknown'}`", inline=True)
+        if page_count > 1:
+            embed.set_footer(text=f"Page {self.page_index + 1}/{page_count}")
         else:
             embed.set_footer(text="Participants are shown privately to you.")
-        return embed
+        return embed, page_count > 1
+
+    async def _show_page(self, interaction: discord.Interaction) -> None:
+        rendered = self.render()
+        if rendered is None:
+            self.stop()
+            return await interaction.response.edit_message(content="This giveaway is no longer available.", embed=None, view=None)
+        await interaction.response.edit_message(embed=rendered[0], view=self)
 
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
     async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):  # noqa: ARG002
-        self.page_index = max(0, self.page_index - 1)
-        self._update_buttons()
-        await interaction.response.edit_message(embed=self.embed(), view=self)
+        self.page_index -= 1
+        await self._show_page(interaction)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
     async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):  # noqa: ARG002
-        self.page_index = min(len(self.pages) - 1, self.page_index + 1)
-        self._update_buttons()
-        await interaction.response.edit_message(embed=self.embed(), view=self)
+        self.page_index += 1
+        await self._show_page(interaction)
 
 
 class Giveaway(commands.Cog):
@@ -240,22 +424,67 @@ class Giveaway(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self._lock = asyncio.Lock()
+        self._locks = KeyedLocks()
         self.store = GiveawayStore()
         self._giveaways: dict[str, dict[str, Any]] = {}
+        self._index = GiveawayIndex()
         self._runner: asyncio.Task | None = None
+        self._deadlines: list[tuple[int, str]] = []
+        self._scheduled: dict[str, int] = {}
+        self._pending_announcements: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._entrant_changes: dict[str, dict[int, bool]] = {}
+        self._refresh_interval = embed_refresh_seconds()
+        self._refresh_pending: dict[str, discord.Message] = {}
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        self._participant_index = ParticipantPageIndex()
+        self._archive_after = archive_after_seconds()
+        self._next_archive_at = 0.0
+        self._writer = WriteBehindQueue("giveaways", self._giveaways_get, self._flush_giveaways)
 
     async def initialize(self) -> None:
         self._giveaways = await self.store.load_all()
+        self._index.rebuild(self._giveaways)
+        for giveaway_id, record in self._giveaways.items():
+            if record.get("status") == "ending":
+                self._schedule_deadline(giveaway_id, 0)
+            else:
+                self._track_schedule(record, retry_at=0)
         await self._migrate_legacy_file()
 
     def start_runner(self) -> None:
         if self._runner is None or self._runner.done():
             self._runner = asyncio.create_task(self._run_due_giveaways())
 
-    def cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         if self._runner and not self._runner.done():
             self._runner.cancel()
+        for giveaway_id in list(self._refresh_tasks):
+            self._cancel_entry_refresh(giveaway_id)
+        await self._writer.close()
+
+    def _giveaways_get(self, giveaway_id: str) -> dict[str, Any] | None:
+        return self._giveaways.get(giveaway_id)
+
+    async def _flush_giveaways(self, records: dict[str, dict[str, Any]]) -> None:
+        changes = {
+            giveaway_id: self._entrant_changes.pop(giveaway_id)
+            for giveaway_id in records
+            if giveaway_id in self._entrant_changes
+        }
+        try:
+            await self.store.save_giveaways(records, changes)
+        except Exception:
+            for giveaway_id, pending in changes.items():
+                newer = self._entrant_changes.setdefault(giveaway_id, {})
+                for user_id, joined in pending.items():
+                    newer.setdefault(user_id, joined)
+            raise
+
+    def _queue_entrant_change(self, giveaway_id: str, user_id: int, joined: bool) -> None:
+        self._entrant_changes.setdefault(giveaway_id, {})[user_id] = joined
+        self._participant_index.invalidate(giveaway_id)
+        self._writer.mark_dirty(giveaway_id)
 
     @commands.command(name="giveaway", aliases=["gw"], help="Show the giveaway command guide.")
     @commands.guild_only()
@@ -396,7 +625,7 @@ class Giveaway(commands.Cog):
             return await interaction.followup.send("Discord rejected the giveaway message. Please try again.", ephemeral=True)
 
         record["message_id"] = message.id
-        async with self._lock:
+        async with self._locks.hold(giveaway_id):
             self._giveaways[giveaway_id] = record
             await self._save_giveaway(record)
 
@@ -447,6 +676,10 @@ class Giveaway(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
         record = self._find_giveaway(identifier, interaction.guild.id)
+        archived = False
+        if not record:
+            record = await self.store.load_archived(identifier, interaction.guild.id)
+            archived = record is not None
         if not record:
             return await interaction.followup.send("I could not find that giveaway.", ephemeral=True)
         if record["status"] not in {"ended", "ending"}:
@@ -457,7 +690,11 @@ class Giveaway(commands.Cog):
         if not new_winners:
             return await interaction.followup.send("No eligible entries were available for a reroll.", ephemeral=True)
 
-        async with self._lock:
+        if archived:
+            await self._reroll_archived(record, new_winners, interaction.user.id)
+            return await interaction.followup.send("Giveaway rerolled.", ephemeral=True)
+
+        async with self._locks.hold(record["id"]):
             stored = self._giveaways.get(record["id"])
             if not stored:
                 return await interaction.followup.send("I could not find that giveaway anymore.", ephemeral=True)
@@ -473,6 +710,20 @@ class Giveaway(commands.Cog):
             await self._mark_announcement_sent(record["id"])
         await interaction.followup.send("Giveaway rerolled.", ephemeral=True)
 
+    async def _reroll_archived(self, record: dict[str, Any], new_winners: list[int], rerolled_by: int) -> None:
+        """Rerolls an archived giveaway in place; it stays in the archive rather than the working set."""
+        async with self._locks.hold(record["id"]):
+            record["winner_ids"] = new_winners
+            record["winner_announcement_sent"] = False
+            record["rerolled_at"] = now_ts()
+            record["rerolled_by_id"] = rerolled_by
+            await self.store.save_archived(record)
+
+        await self._update_message(record)
+        if await self._announce_winners(record, rerolled=True):
+            record["winner_announcement_sent"] = True
+            await self.store.save_archived(record)
+
     @giveaway.command(name="cancel", description="Cancel an active giveaway without drawing winners.")
     @app_commands.describe(identifier="Giveaway message ID or giveaway ID.")
     @app_commands.checks.has_permissions(manage_guild=True)
@@ -487,7 +738,7 @@ class Giveaway(commands.Cog):
         if record["status"] != "active":
             return await interaction.followup.send("That giveaway is not active.", ephemeral=True)
 
-        async with self._lock:
+        async with self._locks.hold(record["id"]):
             stored = self._giveaways.get(record["id"])
             if not stored:
                 return await interaction.followup.send("I could not find that giveaway anymore.", ephemeral=True)
@@ -497,6 +748,7 @@ class Giveaway(commands.Cog):
             await self._save_giveaway(stored)
             updated = dict(stored)
 
+        self._cancel_entry_refresh(record["id"])
         await self._update_message(updated)
         await interaction.followup.send("Giveaway cancelled.", ephemeral=True)
 
@@ -517,11 +769,16 @@ class Giveaway(commands.Cog):
                 ephemeral=True,
             )
 
-        async with self._lock:
+        async with self._locks.hold(record["id"]):
             stored = self._giveaways.get(record["id"])
             if not stored:
                 return await interaction.followup.send("I could not find that giveaway anymore.", ephemeral=True)
             del self._giveaways[record["id"]]
+            self._index.remove(record["id"])
+            self._participant_index.remove(record["id"])
+            self._entrant_changes.pop(record["id"], None)
+            self._pending_announcements.pop(record["id"], None)
+            await self._writer.discard(record["id"])
             await self.store.delete_giveaway(record["id"])
 
         await interaction.followup.send("Giveaway permanently deleted from storage.", ephemeral=True)
@@ -533,13 +790,8 @@ class Giveaway(commands.Cog):
         if not interaction.guild:
             return await interaction.response.send_message("This command can only be used in a server.", ephemeral=True)
 
-        rows = []
-        for record in self._giveaways.values():
-            if record.get("guild_id") != interaction.guild.id:
-                continue
-            if active_only and record.get("status") != "active":
-                continue
-            rows.append(record)
+        giveaway_ids = self._index.guild_ids(interaction.guild.id, "active" if active_only else None)
+        rows = [self._giveaways[giveaway_id] for giveaway_id in giveaway_ids if giveaway_id in self._giveaways]
         rows.sort(key=lambda item: item.get("ends_at", 0), reverse=not active_only)
 
         embed = discord.Embed(title="Giveaways", color=discord.Color.green())
@@ -583,8 +835,12 @@ class Giveaway(commands.Cog):
         message_id = interaction.message.id
         user_id = interaction.user.id
 
-        async with self._lock:
-            record = self._find_giveaway(str(message_id), interaction.guild.id)
+        found = self._find_giveaway(str(message_id), interaction.guild.id)
+        if not found:
+            return await interaction.followup.send("I could not find this giveaway.", ephemeral=True)
+
+        async with self._locks.hold(found["id"]):
+            record = self._giveaways.get(found["id"])
             if not record:
                 return await interaction.followup.send("I could not find this giveaway.", ephemeral=True)
             if record["status"] != "active" or now_ts() >= int(record["ends_at"]):
@@ -600,52 +856,189 @@ class Giveaway(commands.Cog):
             if required_role_id and not any(role.id == required_role_id for role in member.roles):
                 return await interaction.followup.send(f"You need <@&{required_role_id}> to enter this giveaway.", ephemeral=True)
 
-            entrants = [int(entry) for entry in record.get("entrants", [])]
-            if user_id in entrants:
-                entrants.remove(user_id)
+            entrants = record["entrants"]
+            if entrants.discard(user_id):
+                joined = False
                 action_text = "You have left the giveaway."
             else:
-                entrants.append(user_id)
+                entrants.add(user_id)
+                joined = True
                 action_text = "You are now entered in the giveaway."
-            record["entrants"] = entrants
-            await self._save_giveaway(record)
-            updated = dict(record)
+            self._queue_entrant_change(record["id"], user_id, joined)
 
-        try:
-            await interaction.message.edit(embed=self._build_embed(updated), view=GiveawayJoinView(self))
-        except discord.HTTPException:
-            pass
+        self._schedule_entry_refresh(found["id"], interaction.message)
         await interaction.followup.send(action_text, ephemeral=True)
 
+    def _schedule_entry_refresh(self, giveaway_id: str, message: discord.Message) -> None:
+        self._refresh_pending[giveaway_id] = message
+        task = self._refresh_tasks.get(giveaway_id)
+        if task is None or task.done():
+            self._refresh_tasks[giveaway_id] = asyncio.create_task(self._refresh_entry_embed(giveaway_id))
+
+    def _cancel_entry_refresh(self, giveaway_id: str) -> None:
+        self._refresh_pending.pop(giveaway_id, None)
+        task = self._refresh_tasks.pop(giveaway_id, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _refresh_entry_embed(self, giveaway_id: str) -> None:
+        """Edits the giveaway message with the latest entry count at most once per refresh interval."""
+        try:
+            while True:
+                message = self._refresh_pending.pop(giveaway_id, None)
+                if message is None:
+                    return
+                record = self._giveaways.get(giveaway_id)
+                if record and record.get("status") == "active":
+                    try:
+                        await message.edit(embed=self._build_embed(record), view=GiveawayJoinView(self))
+                    except discord.HTTPException:
+                        pass
+                await asyncio.sleep(self._refresh_interval)
+        finally:
+            if self._refresh_tasks.get(giveaway_id) is asyncio.current_task():
+                del self._refresh_tasks[giveaway_id]
+
     async def handle_participants(self, interaction: discord.Interaction) -> None:
         if not interaction.guild or not interaction.message:
             return await interaction.response.send_message("This giveaway is not available here.", ephemeral=True)
 
         record = self._find_giveaway(str(interaction.message.id), interaction.guild.id)
-        if not record:
-            return await interaction.response.send_message("I could not find this giveaway.", ephemeral=True)
-
-        view = GiveawayParticipantsView(self, record, interaction.user.id)
-        await interaction.response.send_message(
-            embed=view.embed(),
-            view=view if view.needs_pagination else None,
+        if record:
+            giveaway_id = record["id"]
+            self._participant_index.get(giveaway_id, record)
+        else:
+            # Archived giveaways never change, so pages cached by an earlier click stay valid.
+            giveaway_id = self._participant_index.find_by_message(interaction.message.id, interaction.guild.id)
+        send = interaction.response.send_message
+        if giveaway_id is None:
+            # The Firestore lookup can outlast the 3-second interaction window.
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            send = interaction.followup.send
+            record = await self.store.load_archived(str(interaction.message.id), interaction.guild.id)
+            if not record:
+                return await send("I could not find this giveaway.", ephemeral=True)
+            giveaway_id = record["id"]
+            self._participant_index.get(giveaway_id, record)
+
+        view = GiveawayParticipantsView(self, giveaway_id, interaction.user.id)
+        embed, paginated = view.render()
+        send_kwargs = {}
+        if paginated:
+            # Followup webhooks reject view=None, so only pass a view when there is one.
+            send_kwargs["view"] = view
+        await send(
+            embed=embed,
             ephemeral=True,
             allowed_mentions=discord.AllowedMentions.none(),
+            **send_kwargs,
         )
 
     async def _run_due_giveaways(self) -> None:
+        """Sleeps until the earliest giveaway deadline, announcement retry or archive sweep; create/end/cancel re-arm it."""
         await self.bot.wait_until_ready()
         while not self.bot.is_closed():
-            due_ids = [
-                record["id"]
-                for record in list(self._giveaways.values())
-                if record.get("status") == "ending"
-                or (record.get("status") == "active" and int(record.get("ends_at", 0)) <= now_ts())
-            ]
-            for giveaway_id in due_ids:
+            self._wakeup.clear()
+            for giveaway_id in self._pop_due_deadlines(now_ts()):
                 await self._finish_giveaway(giveaway_id)
             await self._retry_missing_announcements()
-            await asyncio.sleep(CHECK_INTERVAL)
+            if time.time() >= self._next_archive_at:
+                self._next_archive_at = time.time() + ARCHIVE_SWEEP_INTERVAL
+                try:
+                    await self._archive_expired()
+                except Exception as exc:
+                    print(f"[GIVEAWAY] Archiving ended giveaways failed: {exc}")
+
+            wake_at = self._next_wake_at()
+            wake_at = self._next_archive_at if wake_at is None else min(wake_at, self._next_archive_at)
+            timeout = max(0.0, wake_at - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _schedule_deadline(self, giveaway_id: str, ends_at: int) -> None:
+        if self._scheduled.get(giveaway_id) == ends_at:
+            return
+        self._scheduled[giveaway_id] = ends_at
+        heapq.heappush(self._deadlines, (ends_at, giveaway_id))
+        self._wakeup.set()
+
+    def _pop_due_deadlines(self, current_time: int) -> list[str]:
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= current_time:
+            ends_at, giveaway_id = heapq.heappop(self._deadlines)
+            if self._scheduled.get(giveaway_id) != ends_at:
+                continue
+            del self._scheduled[giveaway_id]
+            record = self._giveaways.get(giveaway_id)
+            if record and record.get("status") in {"active", "ending"}:
+                due.append(giveaway_id)
+        return due
+
+    def _next_wake_at(self) -> float | None:
+        while self._deadlines and self._scheduled.get(self._deadlines[0][1]) != self._deadlines[0][0]:
+            heapq.heappop(self._deadlines)
+        candidates = list(self._pending_announcements.values())
+        if self._deadlines:
+            candidates.append(float(self._deadlines[0][0]))
+        return min(candidates, default=None)
+
+    def _track_schedule(self, record: dict[str, Any], retry_at: float | None = None) -> None:
+        giveaway_id = str(record["id"])
+        status = record.get("status")
+        if status == "active":
+            self._schedule_deadline(giveaway_id, int(record.get("ends_at") or 0))
+        elif status != "ending" and self._scheduled.pop(giveaway_id, None) is not None:
+            self._wakeup.set()
+
+        if status == "ended" and not record.get("winner_announcement_sent"):
+            if giveaway_id not in self._pending_announcements:
+                self._pending_announcements[giveaway_id] = time.time() + CHECK_INTERVAL if retry_at is None else retry_at
+                self._wakeup.set()
+        else:
+            self._pending_announcements.pop(giveaway_id, None)
+
+    def _archive_candidates(self, current_time: int) -> list[str]:
+        cutoff = current_time - self._archive_after
+        return [
+            giveaway_id
+            for giveaway_id, record in self._giveaways.items()
+            if int(record.get("ended_at") or current_time) <= cutoff
+            and (
+                record.get("status") == "cancelled"
+                or (record.get("status") == "ended" and record.get("winner_announcement_sent"))
+            )
+        ]
+
+    async def _archive_expired(self) -> int:
+        """Moves ended giveaways past the retention window out of memory and into the archive."""
+        candidates = sorted(self._archive_candidates(now_ts()))
+        if not candidates:
+            return 0
+
+        async with AsyncExitStack() as stack:
+            for giveaway_id in candidates:
+                await stack.enter_async_context(self._locks.hold(giveaway_id))
+            expired = set(self._archive_candidates(now_ts()))
+            records = [self._giveaways[giveaway_id] for giveaway_id in candidates if giveaway_id in expired]
+            for record in records:
+                await self._writer.discard(record["id"])
+            try:
+                await self.store.archive_giveaways(records)
+            except Exception:
+                for record in records:
+                    self._writer.mark_dirty(record["id"])
+                raise
+            for record in records:
+                giveaway_id = record["id"]
+                del self._giveaways[giveaway_id]
+                self._index.remove(giveaway_id)
+                self._participant_index.remove(giveaway_id)
+                self._entrant_changes.pop(giveaway_id, None)
+                self._pending_announcements.pop(giveaway_id, None)
+                self._scheduled.pop(giveaway_id, None)
+        return len(records)
 
     async def _finish_giveaway(
         self,
@@ -653,7 +1046,7 @@ class Giveaway(commands.Cog):
         winner_count: int | None = None,
         ended_by: int | None = None,
     ) -> dict[str, Any] | None:
-        async with self._lock:
+        async with self._locks.hold(giveaway_id):
             record = self._giveaways.get(giveaway_id)
             if not record or record.get("status") not in {"active", "ending"}:
                 return None
@@ -667,7 +1060,7 @@ class Giveaway(commands.Cog):
 
         winners = await self._draw_winners(snapshot, winner_count=winner_count)
 
-        async with self._lock:
+        async with self._locks.hold(giveaway_id):
             record = self._giveaways.get(giveaway_id)
             if not record:
                 return None
@@ -680,23 +1073,27 @@ class Giveaway(commands.Cog):
             await self._save_giveaway(record)
             final_record = dict(record)
 
+        self._cancel_entry_refresh(giveaway_id)
         await self._update_message(final_record)
         if await self._announce_winners(final_record):
             await self._mark_announcement_sent(giveaway_id)
         return final_record
 
     async def _retry_missing_announcements(self) -> None:
-        records = [
-            dict(record)
-            for record in self._giveaways.values()
-            if record.get("status") == "ended" and not record.get("winner_announcement_sent")
-        ]
-        for record in records:
-            if await self._announce_winners(record):
-                await self._mark_announcement_sent(record["id"])
+        current_time = time.time()
+        due_ids = [giveaway_id for giveaway_id, retry_at in self._pending_announcements.items() if retry_at <= current_time]
+        for giveaway_id in due_ids:
+            record = self._giveaways.get(giveaway_id)
+            if not record:
+                self._pending_announcements.pop(giveaway_id, None)
+                continue
+            if await self._announce_winners(dict(record)):
+                await self._mark_announcement_sent(giveaway_id)
+            elif giveaway_id in self._pending_announcements:
+                self._pending_announcements[giveaway_id] = time.time() + CHECK_INTERVAL
 
     async def _mark_announcement_sent(self, giveaway_id: str) -> None:
-        async with self._lock:
+        async with self._locks.hold(giveaway_id):
             record = self._giveaways.get(giveaway_id)
             if record:
                 record["winner_announcement_sent"] = True
@@ -716,31 +1113,23 @@ class Giveaway(commands.Cog):
         bonus_role_id = record.get("bonus_role_id")
         bonus_entries = max(1, int(record.get("bonus_entries", 1)))
         excluded = exclude or set()
-        weighted_pool: list[int] = []
+        entrant_ids = [int(entry) for entry in list(record.get("entrants", [])) if int(entry) not in excluded]
 
-        for entry in record.get("entrants", []):
-            user_id = int(entry)
-            if user_id in excluded:
-                continue
-            member = guild.get_member(user_id)
+        members = await resolve_members(guild, entrant_ids, log_prefix="[GIVEAWAY]")
+
+        weighted_ids: list[tuple[int, int]] = []
+        for user_id in entrant_ids:
+            member = members.get(user_id)
             if member is None:
-                try:
-                    member = await guild.fetch_member(user_id)
-                except discord.HTTPException:
-                    continue
-            if required_role_id and not any(role.id == required_role_id for role in member.roles):
                 continue
-            weight = bonus_entries if bonus_role_id and any(role.id == bonus_role_id for role in member.roles) else 1
-            weighted_pool.extend([user_id] * min(weight, 50))
+            role_ids = {role.id for role in member.roles}
+            if required_role_id and required_role_id not in role_ids:
+                continue
+            weight = bonus_entries if bonus_role_id and bonus_role_id in role_ids else 1
+            weighted_ids.append((user_id, min(weight, MAX_ENTRY_WEIGHT)))
 
         target = winner_count or int(record.get("winners_count", 1))
-        rng = random.SystemRandom()
-        winners: list[int] = []
-        while weighted_pool and len(winners) < target:
-            picked = rng.choice(weighted_pool)
-            winners.append(picked)
-            weighted_pool = [user_id for user_id in weighted_pool if user_id != picked]
-        return winners
+        return weighted_sample(weighted_ids, target)
 
     async def _update_message(self, record: dict[str, Any]) -> None:
         channel = self.bot.get_channel(int(record["channel_id"]))
@@ -876,19 +1265,19 @@ class Giveaway(commands.Cog):
         embed.set_footer(text=footer)
         return embed
 
-    def _participants_embed(self, record: dict[str, Any]) -> discord.Embed:
-        return GiveawayParticipantsView(self, record, requester_id=0).embed()
+    def _participant_pages(self, giveaway_id: str) -> ParticipantPages | None:
+        return self._participant_index.get(giveaway_id, self._giveaways.get(giveaway_id))
 
     def _find_giveaway(self, identifier: str, guild_id: int | None = None) -> dict[str, Any] | None:
         ident = identifier.strip()
         record = self._giveaways.get(ident)
         if record and (guild_id is None or record.get("guild_id") == guild_id):
             return record
-        for item in self._giveaways.values():
-            if guild_id is not None and item.get("guild_id") != guild_id:
-                continue
-            if str(item.get("message_id")) == ident:
-                return item
+        if not ident.isdigit():
+            return None
+        record = self._giveaways.get(self._index.by_message.get(int(ident), ""))
+        if record and (guild_id is None or record.get("guild_id") == guild_id):
+            return record
         return None
 
     def _new_id(self) -> str:
@@ -901,7 +1290,9 @@ class Giveaway(commands.Cog):
         snapshot = normalize_record(record)
         giveaway_id = str(snapshot["id"])
         self._giveaways[giveaway_id] = snapshot
-        await self.store.save_giveaway(snapshot)
+        self._index.update(snapshot)
+        self._track_schedule(snapshot)
+        self._writer.mark_dirty(giveaway_id)
 
     def _load_legacy_file(self) -> dict[str, dict[str, Any]]:
         if not os.path.exists(DATA_FILE):
@@ -926,14 +1317,16 @@ class Giveaway(commands.Cog):
             return
 
         migrated = 0
-        async with self._lock:
-            for key, record in legacy_giveaways.items():
-                if not isinstance(record, dict):
-                    continue
-                record["id"] = str(record.get("id") or key)
+        for key, record in legacy_giveaways.items():
+            if not isinstance(record, dict):
+                continue
+            record["id"] = str(record.get("id") or key)
+            async with self._locks.hold(record["id"]):
                 if record["id"] in self._giveaways:
                     continue
                 await self._save_giveaway(record)
+                for user_id in self._giveaways[record["id"]]["entrants"]:
+                    self._queue_entrant_change(record["id"], user_id, True)
                 migrated += 1
 
         if migrated:
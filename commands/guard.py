@@ -7,6 +7,7 @@ import discord
 from discord.ext import commands
 
 from services.guard_store import GuardStore, normalize_config
+from services.write_behind import WriteBehindQueue
 
 
 DISCORD_INVITE_RE = re.compile(
@@ -33,10 +34,17 @@ class Guard(commands.Cog):
         self.store = GuardStore()
         self._data: dict[str, Any] = {"version": 1, "guilds": {}}
         self._bot_deleted_message_ids: set[int] = set()
+        self._writer = WriteBehindQueue("guard", self._data_for_guild, self.store.save_guilds)
 
     async def initialize(self) -> None:
         self._data = await self.store.load_all()
 
+    async def cog_unload(self) -> None:
+        await self._writer.close()
+
+    def _data_for_guild(self, guild_id: str) -> dict[str, Any] | None:
+        return self._data.get("guilds", {}).get(guild_id)
+
     def _config(self, guild_id: int) -> dict[str, Any]:
         guilds = self._data.setdefault("guilds", {})
         key = str(guild_id)
@@ -46,7 +54,8 @@ class Guard(commands.Cog):
         return guilds[key]
 
     async def _save_guild(self, guild_id: int) -> None:
-        await self.store.save_guild(guild_id, deepcopy(self._config(guild_id)))
+        self._config(guild_id)
+        self._writer.mark_dirty(guild_id)
 
     @staticmethod
     def _is_exempt(member: discord.Member) -> bool:
@@ -0,0 +1,94 @@
+from typing import Any, Callable
+
+import discord
+from discord.ext import commands
+
+from services.hypixel_client import (
+    MAX_COMPARE_PLAYERS,
+    PRIORITY_BACKGROUND,
+    HypixelClientError,
+    fetch_hypixel_players,
+    format_hypixel_error,
+    get_rank,
+    unique_usernames,
+)
+
+
+def compare_usage(command: str) -> str:
+    return f"Usage: `!{command} <player1> <player2> ...` (2-{MAX_COMPARE_PLAYERS} players)"
+
+
+async def send_comparison(
+    ctx: commands.Context,
+    bot: commands.Bot,
+    usernames: tuple[str, ...],
+    *,
+    title: str,
+    usage: str,
+    summarize: Callable[[dict[str, Any]], dict[str, Any]],
+    stat_lines: Callable[[dict[str, Any]], str],
+    rank_color: Callable[[str], discord.Color],
+):
+    """Fetches every player, ranks them by the Pro Score in `summarize`, and sends one embed.
+
+    `stat_lines` renders the mode-specific lines shown under each player's level and Pro Score.
+    """
+    usernames = unique_usernames(usernames)
+    if not 2 <= len(usernames) <= MAX_COMPARE_PLAYERS:
+        return await ctx.send(usage)
+
+    async with ctx.typing():
+        try:
+            # A compare fans out into many lookups; let single-player commands go first.
+            results = await fetch_hypixel_players(
+                bot.HYPIXEL_API_KEY,
+                usernames,
+                session=getattr(bot, "hypixel_session", None),
+                priority=PRIORITY_BACKGROUND,
+            )
+        except HypixelClientError as exc:
+            return await ctx.send(format_hypixel_error(exc))
+
+    players = [result for result in results if not isinstance(result, HypixelClientError)]
+    errors = [result for result in results if isinstance(result, HypixelClientError)]
+    if not players:
+        return await ctx.send(format_hypixel_error(errors[0]))
+
+    rows = sorted(
+        ((bundle, summarize(bundle.player)) for bundle in players),
+        key=lambda row: row[1]["pro_score"].score,
+        reverse=True,
+    )
+    leader = rows[0][0].player
+    embed = discord.Embed(
+        title=title,
+        description=f"{len(rows)} players ranked by Pro Score.",
+        color=rank_color(get_rank(leader)),
+    )
+    for index, (bundle, summary) in enumerate(rows, start=1):
+        pro_score = summary["pro_score"]
+        displayname = bundle.player.get("displayname", bundle.username)
+        embed.add_field(
+            name=f"{index}. {displayname} | {get_rank(bundle.player)}",
+            value=(
+                f"Level `{summary['level']}` \u2B50 | Pro Score `{pro_score.score}%` - **{pro_score.tier}**\n"
+                f"{stat_lines(summary)}"
+            ),
+            inline=False,
+        )
+    if errors:
+        embed.add_field(
+            name="Skipped",
+            value="\n".join(format_hypixel_error(error) for error in errors)[:1024],
+            inline=False,
+        )
+    embed.set_thumbnail(url=f"https://visage.surgeplay.com/head/{rows[0][0].uuid}.png")
+    embed.set_footer(text="Data fetched from the official Hypixel API.")
+
+    await ctx.send(embed=embed)
+
+
+async def handle_compare_error(ctx: commands.Context, error: commands.CommandError, usage: str):
+    if isinstance(error, commands.UserInputError):
+        return await ctx.send(usage)
+    raise error
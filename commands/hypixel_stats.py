@@ -33,7 +33,11 @@ class HypixelStats(commands.Cog):
     async def hypixel_stats(self, ctx: commands.Context, username: str):
         async with ctx.typing():
             try:
-                bundle = await fetch_hypixel_player(self.bot.HYPIXEL_API_KEY, username)
+                bundle = await fetch_hypixel_player(
+                    self.bot.HYPIXEL_API_KEY,
+                    username,
+                    session=getattr(self.bot, "hypixel_session", None),
+                )
             except HypixelClientError as exc:
                 return await ctx.send(format_hypixel_error(exc))
 
@@ -9,6 +9,7 @@ import discord
 from discord.ext import commands
 
 from services.invite_store import InviteTrackerStore, normalize_config
+from services.write_behind import WriteBehindQueue
 
 
 DATA_FILE = "invite_tracker.json"
@@ -35,11 +36,18 @@ class InviteTracker(commands.Cog):
         self._lock = asyncio.Lock()
         self.store = InviteTrackerStore()
         self._data: dict[str, Any] = {"version": 1, "guilds": {}}
+        self._writer = WriteBehindQueue("invite tracker", self._data_for_guild, self.store.save_guilds)
 
     async def initialize(self) -> None:
         self._data = await self.store.load_all()
         await self._migrate_legacy_file()
 
+    async def cog_unload(self) -> None:
+        await self._writer.close()
+
+    def _data_for_guild(self, guild_id: str) -> dict[str, Any] | None:
+        return self._data.get("guilds", {}).get(guild_id)
+
     def _load_legacy_file(self) -> dict[str, Any]:
         if not os.path.exists(DATA_FILE):
             return {"version": 1, "guilds": {}}
@@ -81,9 +89,13 @@ class InviteTracker(commands.Cog):
             except OSError:
                 pass
 
-    async def _save_guild(self, guild_id: int) -> None:
-        config = deepcopy(self._config(guild_id))
-        await self.store.save_guild(guild_id, config)
+    async def _save_guild(self, guild_id: int, *, full_rewrite: bool = False) -> None:
+        self._config(guild_id)
+        if full_rewrite:
+            self.store.request_full_rewrite(guild_id)
+        self._writer.mark_dirty(guild_id)
+        if full_rewrite:
+            await self._writer.flush()
 
     def _config(self, guild_id: int) -> dict[str, Any]:
         guilds = self._data.setdefault("guilds", {})
@@ -140,7 +152,7 @@ class InviteTracker(commands.Cog):
         except (discord.Forbidden, discord.HTTPException):
             return None
 
-    async def _resync_guild(self, guild: discord.Guild) -> tuple[bool, str]:
+    async def _resync_guild(self, guild: discord.Guild, *, full_rewrite: bool = False) -> tuple[bool, str]:
         invites = await self._fetch_invites(guild)
         if invites is None:
             return False, "I could not fetch invites. Make sure I have Manage Server permission."
@@ -151,7 +163,7 @@ class InviteTracker(commands.Cog):
             config["invite_cache"] = invites
             config["vanity_uses"] = vanity_uses
             config["last_sync_ts"] = current_ts()
-            await self._save_guild(guild.id)
+            await self._save_guild(guild.id, full_rewrite=full_rewrite)
         return True, f"Invite cache synced with {len(invites)} invite(s)."
 
     def _detect_used_invite(
@@ -316,7 +328,7 @@ class InviteTracker(commands.Cog):
     @invite_group.command(name="resync", help="Refresh the invite cache from Discord.")
     @commands.has_permissions(manage_guild=True)
     async def invite_resync(self, ctx: commands.Context):
-        ok, message = await self._resync_guild(ctx.guild)
+        ok, message = await self._resync_guild(ctx.guild, full_rewrite=True)
         await ctx.send(message)
 
     @invite_group.command(name="reset", help="Set a member's invite total manually.")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any
 
 import discord
@@ -133,6 +135,15 @@ DUNGEON_XP_STEPS = [
     116250000,
 ]
 
+SLAYER_XP_THRESHOLDS = {
+    "zombie": [5, 15, 200, 1000, 5000, 20000, 100000, 400000, 1000000],
+    "spider": [5, 25, 200, 1000, 5000, 20000, 100000, 400000, 1000000],
+    "wolf": [10, 30, 250, 1500, 5000, 20000, 100000, 400000, 1000000],
+    "enderman": [10, 30, 250, 1500, 5000, 20000, 100000, 400000, 1000000],
+    "blaze": [10, 30, 250, 1500, 5000, 20000, 100000, 400000, 1000000],
+    "vampire": [20, 75, 240, 840, 2400],
+}
+
 CORE_SKILLS = [
     ("Farming", "farming", "SKILL_FARMING"),
     ("Mining", "mining", "SKILL_MINING"),
@@ -199,16 +210,40 @@ def trim(value: str, limit: int = 1024) -> str:
     return value[: limit - 3].rstrip() + "..."
 
 
-def level_from_xp(xp: Any, steps: list[int], cap: int | None = None) -> float:
-    remaining = as_float(xp)
-    level = 0
-    max_level = cap or len(steps)
-    for required in steps[:max_level]:
-        if remaining < required:
-            return round(level + (remaining / required), 2)
-        remaining -= required
-        level += 1
-    return float(max_level)
+class XPTable:
+    """Cumulative XP thresholds for a level curve, looked up with bisect instead of walking each step."""
+
+    __slots__ = ("steps", "cumulative")
+
+    def __init__(self, steps: list[int]):
+        self.steps = tuple(steps)
+        self.cumulative = tuple(accumulate(self.steps))
+
+    @classmethod
+    def from_thresholds(cls, thresholds: list[int]) -> XPTable:
+        return cls([current - previous for previous, current in zip([0, *thresholds], thresholds)])
+
+    def whole_level(self, xp: Any, cap: int | None = None) -> int:
+        max_level = min(cap or len(self.steps), len(self.steps))
+        return bisect_right(self.cumulative, as_float(xp), 0, max_level)
+
+    def level(self, xp: Any, cap: int | None = None) -> float:
+        total = as_float(xp)
+        max_level = min(cap or len(self.steps), len(self.steps))
+        level = bisect_right(self.cumulative, total, 0, max_level)
+        if level >= max_level:
+            return float(max_level)
+        floor_xp = self.cumulative[level - 1] if level else 0
+        return round(level + (total - floor_xp) / self.steps[level], 2)
+
+
+SKILL_XP_TABLE = XPTable(SKILL_XP_STEPS)
+DUNGEON_XP_TABLE = XPTable(DUNGEON_XP_STEPS)
+SLAYER_XP_TABLES = {boss: XPTable.from_thresholds(thresholds) for boss, thresholds in SLAYER_XP_THRESHOLDS.items()}
+
+
+def level_from_xp(xp: Any, table: XPTable, cap: int | None = None) -> float:
+    return table.level(xp, cap)
 
 
 def skyblock_level(member: dict[str, Any]) -> float:
@@ -243,7 +278,7 @@ def skill_rows(member: dict[str, Any], skills: list[tuple[str, str, str]]) -> li
         xp = skill_experience(member, legacy_name, api_name)
         if xp is None:
             continue
-        rows.append((label, level_from_xp(xp, SKILL_XP_STEPS, 60), xp))
+        rows.append((label, level_from_xp(xp, SKILL_XP_TABLE, 60), xp))
     return rows
 
 
@@ -283,11 +318,12 @@ def total_slayer_xp(member: dict[str, Any]) -> int:
     return sum(as_int(data.get("xp")) for data in bosses.values() if isinstance(data, dict))
 
 
-def slayer_level(data: dict[str, Any]) -> int:
+def slayer_level(data: dict[str, Any], boss: str | None = None) -> int:
     claimed = data.get("claimed_levels") or {}
-    if not isinstance(claimed, dict):
-        return 0
-    return sum(1 for value in claimed.values() if value)
+    if isinstance(claimed, dict) and claimed:
+        return sum(1 for value in claimed.values() if value)
+    table = SLAYER_XP_TABLES.get(boss or "")
+    return table.whole_level(data.get("xp")) if table else 0
 
 
 def catacombs_data(member: dict[str, Any]) -> dict[str, Any]:
@@ -316,6 +352,240 @@ def minion_count(member: dict[str, Any]) -> int:
     return len(set(crafted)) if isinstance(crafted, list) else 0
 
 
+class SkyBlockPage:
+    """Pre-rendered embed fields for one page, so open views do not pin the raw profile JSON."""
+
+    __slots__ = ("title_suffix", "fields")
+
+    def __init__(self, title_suffix: str):
+        self.title_suffix = title_suffix
+        self.fields: list[tuple[str, str, bool]] = []
+
+    def add_field(self, *, name: str, value: Any, inline: bool = True) -> None:
+        self.fields.append((name, str(value), inline))
+
+
+def skyblock_description(bundle) -> str:
+    selected = "Selected" if bundle.profile.get("selected") is True else "Best available"
+    return (
+        f"Profile: `{bundle.profile_name}` | Mode: `{bundle.game_mode}` | {selected}\n"
+        f"SkyBlock Level: `{skyblock_level(bundle.member):.2f}`"
+    )
+
+
+def overview_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    profile = bundle.profile
+    catacombs = catacombs_data(member)
+    catacombs_xp = as_float(catacombs.get("experience"))
+
+    page = SkyBlockPage("Overview")
+    page.add_field(name="Purse", value=purse(member), inline=True)
+    page.add_field(name="Bank", value=profile_bank(profile), inline=True)
+    page.add_field(name="Co-op Members", value=str(len(profile.get("members") or {})), inline=True)
+    page.add_field(name="Core Skill Avg", value=core_skill_average(member), inline=True)
+    page.add_field(name="Total Slayer XP", value=format_number(total_slayer_xp(member)), inline=True)
+    page.add_field(name="Catacombs", value=f"Level `{level_from_xp(catacombs_xp, DUNGEON_XP_TABLE, 50):.2f}`", inline=True)
+    page.add_field(name="Active/Best Pet", value=active_or_best_pet(member), inline=True)
+    page.add_field(name="Unique Minions", value=format_number(minion_count(member)), inline=True)
+    page.add_field(name="Fairy Souls", value=format_number(member.get("fairy_souls_collected", member.get("fairy_souls", 0))), inline=True)
+    page.add_field(name="First Join", value=format_timestamp(member.get("first_join")), inline=True)
+    page.add_field(name="Last Save", value=format_timestamp(member.get("last_save")), inline=True)
+    page.add_field(name="Profile ID", value=f"`{bundle.profile_id}`", inline=False)
+    return page
+
+
+def skills_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    page = SkyBlockPage("Skills")
+    core_rows = skill_rows(member, CORE_SKILLS)
+    extra_rows = skill_rows(member, EXTRA_SKILLS)
+
+    if core_rows:
+        page.add_field(
+            name="Core Skills",
+            value=trim("\n".join(f"{name}: `{level:.2f}` ({compact_number(xp)} XP)" for name, level, xp in core_rows)),
+            inline=False,
+        )
+        page.add_field(name="Core Average", value=f"`{sum(row[1] for row in core_rows) / len(core_rows):.2f}`", inline=True)
+    else:
+        page.add_field(name="Core Skills", value="Skill API data is hidden or unavailable.", inline=False)
+
+    if extra_rows:
+        page.add_field(
+            name="Cosmetic / Extra Skills",
+            value=trim("\n".join(f"{name}: `{level:.2f}` ({compact_number(xp)} XP)" for name, level, xp in extra_rows)),
+            inline=False,
+        )
+
+    kills = stat_value(member, ("player_stats", "kills"), ("stats", "kills"))
+    deaths = stat_value(member, ("player_stats", "deaths"), ("stats", "deaths"))
+    if kills is not None or deaths is not None:
+        page.add_field(
+            name="Combat Snapshot",
+            value=f"Kills: `{format_number(kills or 0)}`\nDeaths: `{format_number(deaths or 0)}`",
+            inline=True,
+        )
+    return page
+
+
+def slayer_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    bosses = member.get("slayer_bosses") or {}
+    page = SkyBlockPage("Slayer")
+
+    lines = []
+    for label, key in SLAYERS:
+        data = bosses.get(key) if isinstance(bosses, dict) else None
+        if not isinstance(data, dict):
+            lines.append(f"{label}: `No data`")
+            continue
+        lines.append(f"{label}: `L{slayer_level(data, key)}` | `{format_number(data.get('xp', 0))}` XP")
+
+    page.add_field(name="Boss Progress", value=trim("\n".join(lines)), inline=False)
+    page.add_field(name="Total Slayer XP", value=format_number(total_slayer_xp(member)), inline=True)
+    return page
+
+
+def dungeons_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    dungeons = member.get("dungeons") or {}
+    catacombs = catacombs_data(member)
+    page = SkyBlockPage("Dungeons")
+
+    catacombs_xp = as_float(catacombs.get("experience"))
+    page.add_field(
+        name="Catacombs",
+        value=f"Level: `{level_from_xp(catacombs_xp, DUNGEON_XP_TABLE, 50):.2f}`\nXP: `{compact_number(catacombs_xp)}`",
+        inline=True,
+    )
+
+    completions = catacombs.get("tier_completions") or {}
+    if isinstance(completions, dict) and completions:
+        completion_lines = [
+            f"{floor_label(floor)}: `{format_number(count)}`"
+            for floor, count in sorted(completions.items(), key=lambda item: str(item[0]))
+            if as_int(count) > 0
+        ]
+        page.add_field(name="Floor Completions", value=trim("\n".join(completion_lines) or "No completions found."), inline=True)
+
+    classes = dungeons.get("player_classes") or dungeons.get("classes") or {}
+    class_lines = []
+    if isinstance(classes, dict):
+        for label, key in CLASS_NAMES:
+            data = classes.get(key) or {}
+            xp = as_float(data.get("experience")) if isinstance(data, dict) else 0
+            if xp:
+                class_lines.append(f"{label}: `{level_from_xp(xp, DUNGEON_XP_TABLE, 50):.2f}` ({compact_number(xp)} XP)")
+    page.add_field(name="Classes", value=trim("\n".join(class_lines) or "Class API data is hidden or unavailable."), inline=False)
+    secrets = stat_value(member, ("dungeons", "secrets"), ("player_stats", "dungeons", "secrets"))
+    if secrets is not None:
+        page.add_field(name="Secrets", value=format_number(secrets), inline=True)
+    return page
+
+
+def mining_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    mining_core = member.get("mining_core") or {}
+    page = SkyBlockPage("Mining & Rift")
+
+    if isinstance(mining_core, dict) and mining_core:
+        page.add_field(
+            name="Heart of the Mountain",
+            value=(
+                f"HotM XP: `{compact_number(mining_core.get('experience', 0))}`\n"
+                f"Selected Ability: `{titleize_id(mining_core.get('selected_pickaxe_ability') or 'None')}`"
+            ),
+            inline=False,
+        )
+        page.add_field(
+            name="Powder",
+            value=(
+                f"Mithril: `{compact_number(mining_core.get('powder_mithril', 0))}`\n"
+                f"Gemstone: `{compact_number(mining_core.get('powder_gemstone', 0))}`\n"
+                f"Glacite: `{compact_number(mining_core.get('powder_glacite', 0))}`"
+            ),
+            inline=True,
+        )
+        nodes = mining_core.get("nodes") or {}
+        if isinstance(nodes, dict) and nodes:
+            top_nodes = sorted(nodes.items(), key=lambda item: as_int(item[1]), reverse=True)[:8]
+            page.add_field(
+                name="Top HotM Nodes",
+                value=trim("\n".join(f"{titleize_id(name)}: `{value}`" for name, value in top_nodes)),
+                inline=True,
+            )
+    else:
+        page.add_field(name="Mining", value="Mining API data is hidden or unavailable.", inline=False)
+
+    rift = member.get("rift") or {}
+    if isinstance(rift, dict) and rift:
+        visited = nested_value(rift, ("village_plaza", "murder", "step_index"))
+        page.add_field(
+            name="Rift",
+            value=(
+                f"Data: `Available`\n"
+                f"Murder Progress: `{visited if visited is not None else 'Unknown'}`"
+            ),
+            inline=True,
+        )
+    else:
+        page.add_field(name="Rift", value="Rift API data is hidden or unavailable.", inline=True)
+    return page
+
+
+def collections_page(bundle) -> SkyBlockPage:
+    member = bundle.member
+    page = SkyBlockPage("Collections & Pets")
+
+    collection = member.get("collection") or {}
+    if isinstance(collection, dict) and collection:
+        top_collections = sorted(collection.items(), key=lambda item: as_float(item[1]), reverse=True)[:10]
+        page.add_field(
+            name="Top Collections",
+            value=trim("\n".join(f"{titleize_id(name)}: `{compact_number(amount)}`" for name, amount in top_collections)),
+            inline=False,
+        )
+    else:
+        page.add_field(name="Top Collections", value="Collection API data is hidden or unavailable.", inline=False)
+
+    crafted = member.get("crafted_generators") or []
+    if isinstance(crafted, list) and crafted:
+        page.add_field(
+            name="Minion Crafts",
+            value=trim(f"Unique crafted minions: `{len(set(crafted))}`\n" + ", ".join(titleize_id(item) for item in crafted[:12])),
+            inline=False,
+        )
+
+    pets = member.get("pets") or []
+    if isinstance(pets, list) and pets:
+        sorted_pets = sorted(
+            [pet for pet in pets if isinstance(pet, dict)],
+            key=lambda pet: as_float(pet.get("exp")),
+            reverse=True,
+        )[:5]
+        pet_lines = [
+            f"{str(pet.get('tier') or '').replace('_', ' ').title()} {titleize_id(pet.get('type'))}: `{compact_number(pet.get('exp', 0))}` XP"
+            for pet in sorted_pets
+        ]
+        page.add_field(name="Top Pets", value=trim("\n".join(pet_lines)), inline=False)
+    else:
+        page.add_field(name="Pets", value="Pet API data is hidden or unavailable.", inline=False)
+    return page
+
+
+def build_skyblock_pages(bundle) -> dict[str, SkyBlockPage]:
+    builders = {
+        "overview": overview_page,
+        "skills": skills_page,
+        "slayer": slayer_page,
+        "dungeons": dungeons_page,
+        "mining": mining_page,
+        "collections": collections_page,
+    }
+    return {page: builder(bundle) for page, builder in builders.items()}
+
+
 class SkyBlockPageSelect(discord.ui.Select):
     def __init__(self, view: "SkyBlockView"):
         self.skyblock_view = view
@@ -345,7 +615,10 @@ class SkyBlockView(discord.ui.View):
     def __init__(self, owner_id: int, bundle):
         super().__init__(timeout=180)
         self.owner_id = owner_id
-        self.bundle = bundle
+        self.username = bundle.username
+        self.uuid = bundle.uuid
+        self.description = skyblock_description(bundle)
+        self.pages = build_skyblock_pages(bundle)
         self.page = "overview"
         self.refresh_items()
 
@@ -354,227 +627,18 @@ class SkyBlockView(discord.ui.View):
         self.add_item(SkyBlockPageSelect(self))
 
     def build_embed(self) -> discord.Embed:
-        builders = {
-            "overview": self._overview_embed,
-            "skills": self._skills_embed,
-            "slayer": self._slayer_embed,
-            "dungeons": self._dungeons_embed,
-            "mining": self._mining_embed,
-            "collections": self._collections_embed,
-        }
-        return builders.get(self.page, self._overview_embed)()
-
-    def _base_embed(self, title_suffix: str) -> discord.Embed:
-        profile = self.bundle.profile
-        member = self.bundle.member
-        selected = "Selected" if profile.get("selected") is True else "Best available"
+        page = self.pages.get(self.page) or self.pages["overview"]
         embed = discord.Embed(
-            title=f"{self.bundle.username} | SkyBlock - {title_suffix}",
-            description=(
-                f"Profile: `{self.bundle.profile_name}` | Mode: `{self.bundle.game_mode}` | {selected}\n"
-                f"SkyBlock Level: `{skyblock_level(member):.2f}`"
-            ),
+            title=f"{self.username} | SkyBlock - {page.title_suffix}",
+            description=self.description,
             color=discord.Color.gold(),
         )
-        embed.set_thumbnail(url=f"https://visage.surgeplay.com/head/{self.bundle.uuid}.png")
+        for name, value, inline in page.fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        embed.set_thumbnail(url=f"https://visage.surgeplay.com/head/{self.uuid}.png")
         embed.set_footer(text="Official Hypixel SkyBlock API. Some fields can be hidden by player API settings.")
         return embed
 
-    def _overview_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        profile = self.bundle.profile
-        catacombs = catacombs_data(member)
-        catacombs_xp = as_float(catacombs.get("experience"))
-
-        embed = self._base_embed("Overview")
-        embed.add_field(name="Purse", value=purse(member), inline=True)
-        embed.add_field(name="Bank", value=profile_bank(profile), inline=True)
-        embed.add_field(name="Co-op Members", value=str(len(profile.get("members") or {})), inline=True)
-        embed.add_field(name="Core Skill Avg", value=core_skill_average(member), inline=True)
-        embed.add_field(name="Total Slayer XP", value=format_number(total_slayer_xp(member)), inline=True)
-        embed.add_field(name="Catacombs", value=f"Level `{level_from_xp(catacombs_xp, DUNGEON_XP_STEPS, 50):.2f}`", inline=True)
-        embed.add_field(name="Active/Best Pet", value=active_or_best_pet(member), inline=True)
-        embed.add_field(name="Unique Minions", value=format_number(minion_count(member)), inline=True)
-        embed.add_field(name="Fairy Souls", value=format_number(member.get("fairy_souls_collected", member.get("fairy_souls", 0))), inline=True)
-        embed.add_field(name="First Join", value=format_timestamp(member.get("first_join")), inline=True)
-        embed.add_field(name="Last Save", value=format_timestamp(member.get("last_save")), inline=True)
-        embed.add_field(name="Profile ID", value=f"`{self.bundle.profile_id}`", inline=False)
-        return embed
-
-    def _skills_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        embed = self._base_embed("Skills")
-        core_rows = skill_rows(member, CORE_SKILLS)
-        extra_rows = skill_rows(member, EXTRA_SKILLS)
-
-        if core_rows:
-            embed.add_field(
-                name="Core Skills",
-                value=trim("\n".join(f"{name}: `{level:.2f}` ({compact_number(xp)} XP)" for name, level, xp in core_rows)),
-                inline=False,
-            )
-            embed.add_field(name="Core Average", value=f"`{sum(row[1] for row in core_rows) / len(core_rows):.2f}`", inline=True)
-        else:
-            embed.add_field(name="Core Skills", value="Skill API data is hidden or unavailable.", inline=False)
-
-        if extra_rows:
-            embed.add_field(
-                name="Cosmetic / Extra Skills",
-                value=trim("\n".join(f"{name}: `{level:.2f}` ({compact_number(xp)} XP)" for name, level, xp in extra_rows)),
-                inline=False,
-            )
-
-        kills = stat_value(member, ("player_stats", "kills"), ("stats", "kills"))
-        deaths = stat_value(member, ("player_stats", "deaths"), ("stats", "deaths"))
-        if kills is not None or deaths is not None:
-            embed.add_field(
-                name="Combat Snapshot",
-                value=f"Kills: `{format_number(kills or 0)}`\nDeaths: `{format_number(deaths or 0)}`",
-                inline=True,
-            )
-        return embed
-
-    def _slayer_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        bosses = member.get("slayer_bosses") or {}
-        embed = self._base_embed("Slayer")
-
-        lines = []
-        for label, key in SLAYERS:
-            data = bosses.get(key) if isinstance(bosses, dict) else None
-            if not isinstance(data, dict):
-                lines.append(f"{label}: `No data`")
-                continue
-            lines.append(f"{label}: `L{slayer_level(data)}` | `{format_number(data.get('xp', 0))}` XP")
-
-        embed.add_field(name="Boss Progress", value=trim("\n".join(lines)), inline=False)
-        embed.add_field(name="Total Slayer XP", value=format_number(total_slayer_xp(member)), inline=True)
-        return embed
-
-    def _dungeons_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        dungeons = member.get("dungeons") or {}
-        catacombs = catacombs_data(member)
-        embed = self._base_embed("Dungeons")
-
-        catacombs_xp = as_float(catacombs.get("experience"))
-        embed.add_field(
-            name="Catacombs",
-            value=f"Level: `{level_from_xp(catacombs_xp, DUNGEON_XP_STEPS, 50):.2f}`\nXP: `{compact_number(catacombs_xp)}`",
-            inline=True,
-        )
-
-        completions = catacombs.get("tier_completions") or {}
-        if isinstance(completions, dict) and completions:
-            completion_lines = [
-                f"{floor_label(floor)}: `{format_number(count)}`"
-                for floor, count in sorted(completions.items(), key=lambda item: str(item[0]))
-                if as_int(count) > 0
-            ]
-            embed.add_field(name="Floor Completions", value=trim("\n".join(completion_lines) or "No completions found."), inline=True)
-
-        classes = dungeons.get("player_classes") or dungeons.get("classes") or {}
-        class_lines = []
-        if isinstance(classes, dict):
-            for label, key in CLASS_NAMES:
-                data = classes.get(key) or {}
-                xp = as_float(data.get("experience")) if isinstance(data, dict) else 0
-                if xp:
-                    class_lines.append(f"{label}: `{level_from_xp(xp, DUNGEON_XP_STEPS, 50):.2f}` ({compact_number(xp)} XP)")
-        embed.add_field(name="Classes", value=trim("\n".join(class_lines) or "Class API data is hidden or unavailable."), inline=False)
-        secrets = stat_value(member, ("dungeons", "secrets"), ("player_stats", "dungeons", "secrets"))
-        if secrets is not None:
-            embed.add_field(name="Secrets", value=format_number(secrets), inline=True)
-        return embed
-
-    def _mining_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        mining_core = member.get("mining_core") or {}
-        embed = self._base_embed("Mining & Rift")
-
-        if isinstance(mining_core, dict) and mining_core:
-            embed.add_field(
-                name="Heart of the Mountain",
-                value=(
-                    f"HotM XP: `{compact_number(mining_core.get('experience', 0))}`\n"
-                    f"Selected Ability: `{titleize_id(mining_core.get('selected_pickaxe_ability') or 'None')}`"
-                ),
-                inline=False,
-            )
-            embed.add_field(
-                name="Powder",
-                value=(
-                    f"Mithril: `{compact_number(mining_core.get('powder_mithril', 0))}`\n"
-                    f"Gemstone: `{compact_number(mining_core.get('powder_gemstone', 0))}`\n"
-                    f"Glacite: `{compact_number(mining_core.get('powder_glacite', 0))}`"
-                ),
-                inline=True,
-            )
-            nodes = mining_core.get("nodes") or {}
-            if isinstance(nodes, dict) and nodes:
-                top_nodes = sorted(nodes.items(), key=lambda item: as_int(item[1]), reverse=True)[:8]
-                embed.add_field(
-                    name="Top HotM Nodes",
-                    value=trim("\n".join(f"{titleize_id(name)}: `{value}`" for name, value in top_nodes)),
-                    inline=True,
-                )
-        else:
-            embed.add_field(name="Mining", value="Mining API data is hidden or unavailable.", inline=False)
-
-        rift = member.get("rift") or {}
-        if isinstance(rift, dict) and rift:
-            visited = nested_value(rift, ("village_plaza", "murder", "step_index"))
-            embed.add_field(
-                name="Rift",
-                value=(
-                    f"Data: `Available`\n"
-                    f"Murder Progress: `{visited if visited is not None else 'Unknown'}`"
-                ),
-                inline=True,
-            )
-        else:
-            embed.add_field(name="Rift", value="Rift API data is hidden or unavailable.", inline=True)
-        return embed
-
-    def _collections_embed(self) -> discord.Embed:
-        member = self.bundle.member
-        embed = self._base_embed("Collections & Pets")
-
-        collection = member.get("collection") or {}
-        if isinstance(collection, dict) and collection:
-            top_collections = sorted(collection.items(), key=lambda item: as_float(item[1]), reverse=True)[:10]
-            embed.add_field(
-                name="Top Collections",
-                value=trim("\n".join(f"{titleize_id(name)}: `{compact_number(amount)}`" for name, amount in top_collections)),
-                inline=False,
-            )
-        else:
-            embed.add_field(name="Top Collections", value="Collection API data is hidden or unavailable.", inline=False)
-
-        crafted = member.get("crafted_generators") or []
-        if isinstance(crafted, list) and crafted:
-            embed.add_field(
-                name="Minion Crafts",
-                value=trim(f"Unique crafted minions: `{len(set(crafted))}`\n" + ", ".join(titleize_id(item) for item in crafted[:12])),
-                inline=False,
-            )
-
-        pets = member.get("pets") or []
-        if isinstance(pets, list) and pets:
-            sorted_pets = sorted(
-                [pet for pet in pets if isinstance(pet, dict)],
-                key=lambda pet: as_float(pet.get("exp")),
-                reverse=True,
-            )[:5]
-            pet_lines = [
-                f"{str(pet.get('tier') or '').replace('_', ' ').title()} {titleize_id(pet.get('type'))}: `{compact_number(pet.get('exp', 0))}` XP"
-                for pet in sorted_pets
-            ]
-            embed.add_field(name="Top Pets", value=trim("\n".join(pet_lines)), inline=False)
-        else:
-            embed.add_field(name="Pets", value="Pet API data is hidden or unavailable.", inline=False)
-        return embed
-
 
 class SkyBlock(commands.Cog):
     def __init__(self, bot):
@@ -584,7 +648,11 @@ class SkyBlock(commands.Cog):
     async def skyblock(self, ctx: commands.Context, username: str):
         async with ctx.typing():
             try:
-                bundle = await fetch_skyblock_profile(self.bot.HYPIXEL_API_KEY, username)
+                bundle = await fetch_skyblock_profile(
+                    self.bot.HYPIXEL_API_KEY,
+                    username,
+                    session=getattr(self.bot, "hypixel_session", None),
+                )
             except HypixelClientError as exc:
                 return await ctx.send(format_hypixel_error(exc))
 
@@ -1,9 +1,12 @@
 import re
+from typing import Any
 
 import discord
 from discord.ext import commands
 
+from commands.hypixel_compare import compare_usage, handle_compare_error, send_comparison
 from services.hypixel_client import (
+    MAX_COMPARE_PLAYERS,
     HypixelClientError,
     as_int,
     fetch_hypixel_player,
@@ -14,6 +17,53 @@ from services.hypixel_client import (
 )
 
 
+SWCOMPARE_USAGE = compare_usage("swcompare")
+
+
+def skywars_summary(player: dict[str, Any]) -> dict[str, Any]:
+    sw = (player.get("stats", {}) or {}).get("SkyWars", {}) or {}
+    level_fmt = sw.get("levelFormatted") or sw.get("level_formatted") or ""
+    level = 0
+    match = re.search(r"\[(\d+)", str(level_fmt))
+    if match:
+        level = int(match.group(1))
+    else:
+        exp = as_int(sw.get("skywars_experience", 0))
+        level = min(60, exp // 1000)
+
+    wins = as_int(sw.get("wins", 0))
+    losses = as_int(sw.get("losses", 0))
+    kills = as_int(sw.get("kills", 0))
+    deaths = as_int(sw.get("deaths", 1)) or 1
+
+    return {
+        "level": level,
+        "wins": wins,
+        "losses": losses,
+        "kills": kills,
+        "deaths": deaths,
+        "assists": as_int(sw.get("assists", 0)),
+        "coins": as_int(sw.get("coins", 0)),
+        "souls": as_int(sw.get("souls", 0)),
+        "kdr": ratio(kills, deaths),
+        "wlr": ratio(wins, losses),
+        "pro_score": skywars_pro_score(
+            wins=wins,
+            losses=losses,
+            kills=kills,
+            deaths=deaths,
+            level=level,
+        ),
+    }
+
+
+def skywars_compare_lines(summary: dict[str, Any]) -> str:
+    return (
+        f"KDR `{summary['kdr']}` | W/L `{summary['wlr']}`\n"
+        f"Wins `{summary['wins']}` | Kills `{summary['kills']}`"
+    )
+
+
 class Skywars(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -22,45 +72,31 @@ class Skywars(commands.Cog):
     async def skywars(self, ctx: commands.Context, username: str):
         async with ctx.typing():
             try:
-                bundle = await fetch_hypixel_player(self.bot.HYPIXEL_API_KEY, username)
+                bundle = await fetch_hypixel_player(
+                    self.bot.HYPIXEL_API_KEY,
+                    username,
+                    session=getattr(self.bot, "hypixel_session", None),
+                )
             except HypixelClientError as exc:
                 return await ctx.send(format_hypixel_error(exc))
 
         player = bundle.player
         uuid = bundle.uuid
-        sw = (player.get("stats", {}) or {}).get("SkyWars", {}) or {}
-
         displayname = player.get("displayname", bundle.username)
         rank = get_rank(player)
         color = self.get_rank_color(rank)
-
-        level_fmt = sw.get("levelFormatted") or sw.get("level_formatted") or ""
-        level = 0
-        match = re.search(r"\[(\d+)", str(level_fmt))
-        if match:
-            level = int(match.group(1))
-        else:
-            exp = as_int(sw.get("skywars_experience", 0))
-            level = min(60, exp // 1000)
-
-        wins = as_int(sw.get("wins", 0))
-        losses = as_int(sw.get("losses", 0))
-        kills = as_int(sw.get("kills", 0))
-        deaths = as_int(sw.get("deaths", 1)) or 1
-        assists = as_int(sw.get("assists", 0))
-        coins = as_int(sw.get("coins", 0))
-        souls = as_int(sw.get("souls", 0))
-
-        kdr = ratio(kills, deaths)
-        wlr = ratio(wins, losses)
-
-        pro_score = skywars_pro_score(
-            wins=wins,
-            losses=losses,
-            kills=kills,
-            deaths=deaths,
-            level=level,
-        )
+        summary = skywars_summary(player)
+        level = summary["level"]
+        wins = summary["wins"]
+        losses = summary["losses"]
+        kills = summary["kills"]
+        deaths = summary["deaths"]
+        assists = summary["assists"]
+        coins = summary["coins"]
+        souls = summary["souls"]
+        kdr = summary["kdr"]
+        wlr = summary["wlr"]
+        pro_score = summary["pro_score"]
 
         embed = discord.Embed(
             title=f"**{displayname}** | {rank}",
@@ -92,6 +128,27 @@ class Skywars(commands.Cog):
             return await ctx.send("Usage: `!skywars <minecraft_username>`")
         raise error
 
+    @commands.command(
+        name="swcompare",
+        aliases=["swc"],
+        help=f"Compares SkyWars statistics for 2-{MAX_COMPARE_PLAYERS} players.",
+    )
+    async def skywars_compare(self, ctx: commands.Context, *usernames: str):
+        await send_comparison(
+            ctx,
+            self.bot,
+            usernames,
+            title="SkyWars Comparison",
+            usage=SWCOMPARE_USAGE,
+            summarize=skywars_summary,
+            stat_lines=skywars_compare_lines,
+            rank_color=self.get_rank_color,
+        )
+
+    @skywars_compare.error
+    async def skywars_compare_error(self, ctx: commands.Context, error: commands.CommandError):
+        await handle_compare_error(ctx, error, SWCOMPARE_USAGE)
+
     def get_rank_color(self, rank: str) -> discord.Color:
         colors = {
             "MVP++": discord.Color.gold(),
@@ -14,6 +14,7 @@ from services.subscriber_verification_store import (
     normalize_panel,
     normalize_request,
 )
+from services.write_behind import WriteBehindQueue
 
 
 SUBSCRIBER_ROLE_ID = 1356275389592502513
@@ -230,6 +231,7 @@ class SubscriberVerification(commands.Cog):
         self._request_lock = asyncio.Lock()
         self._proof_channel_lock = asyncio.Lock()
         self._pending_proof_channels: dict[int, dict[str, Any]] = {}
+        self._request_writer = WriteBehindQueue("subscriber requests", self._request_for_id, self._flush_requests)
 
     async def initialize(self) -> None:
         try:
@@ -239,13 +241,17 @@ class SubscriberVerification(commands.Cog):
             self._store_available = False
             print(f"[SUB-VERIFY] Firestore state is unavailable: {exc}")
 
-    def cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         if self._panel_task and not self._panel_task.done():
             self._panel_task.cancel()
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
         if self._proof_channel_cleanup_task and not self._proof_channel_cleanup_task.done():
             self._proof_channel_cleanup_task.cancel()
+        await self._request_writer.close()
+
+    def _request_for_id(self, request_id: str) -> dict[str, Any] | None:
+        return self._requests.get(request_id)
 
     async def _fetch_text_channel(self, channel_id: int) -> discord.TextChannel | None:
         channel = self.bot.get_channel(channel_id)
@@ -591,10 +597,15 @@ class SubscriberVerification(commands.Cog):
         if not request_id:
             return
         self._requests[str(request_id)] = normalized
+        if not self._store_available:
+            return
+        self._request_writer.mark_dirty(request_id)
+
+    async def _flush_requests(self, records: dict[str, dict[str, Any]]) -> None:
         if not self._store_available:
             return
         try:
-            await self.store.save_request(normalized)
+            await self.store.save_requests(records)
         except Exception as exc:
             self._store_available = False
             print(f"[SUB-VERIFY] Could not save request state: {exc}")
@@ -694,6 +705,7 @@ class SubscriberVerification(commands.Cog):
                 if should_delete_request(record)
             ]
             for request_id in request_ids:
+                await self._request_writer.discard(request_id)
                 try:
                     await self.store.delete_request(request_id)
                 except Exception as exc:
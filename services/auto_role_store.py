@@ -0,0 +1,61 @@
+from typing import Any
+
+from services.firebase_client import get_firestore_client, get_firestore_module, run_firestore
+
+
+COLLECTION_NAME = "auto_role_sync"
+
+
+def normalize_checkpoint(record: dict[str, Any] | None) -> dict[str, Any]:
+    if not isinstance(record, dict):
+        return {}
+
+    normalized = dict(record)
+    for key in ("guild_id", "role_id", "last_member_id"):
+        value = normalized.get(key)
+        normalized[key] = int(value) if value is not None else None
+    for key in ("added", "failed"):
+        normalized[key] = int(normalized.get(key) or 0)
+    return normalized
+
+
+class AutoRoleSyncStore:
+    """Resume checkpoints for Member role syncs that were interrupted by a restart."""
+
+    def _checkpoint_ref(self, guild_id: int | str):
+        return get_firestore_client().collection(COLLECTION_NAME).document(str(guild_id))
+
+    async def load_checkpoint(self, guild_id: int | str) -> dict[str, Any]:
+        return await run_firestore(self._load_checkpoint_sync, str(guild_id))
+
+    def _load_checkpoint_sync(self, guild_id: str) -> dict[str, Any]:
+        doc = self._checkpoint_ref(guild_id).get()
+        if not doc.exists:
+            return {}
+        record = normalize_checkpoint(doc.to_dict() or {})
+        record["guild_id"] = record.get("guild_id") or int(guild_id)
+        return record
+
+    async def save_checkpoint(self, record: dict[str, Any]) -> None:
+        snapshot = normalize_checkpoint(record)
+        guild_id = snapshot.get("guild_id")
+        if guild_id is None:
+            raise ValueError("Auto-role checkpoint is missing a guild_id.")
+        await run_firestore(self._save_checkpoint_sync, str(guild_id), snapshot)
+
+    def _save_checkpoint_sync(self, guild_id: str, record: dict[str, Any]) -> None:
+        firestore = get_firestore_module()
+        self._checkpoint_ref(guild_id).set(
+            {
+                **record,
+                "version": 1,
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            },
+            merge=True,
+        )
+
+    async def clear_checkpoint(self, guild_id: int | str) -> None:
+        await run_firestore(self._clear_checkpoint_sync, str(guild_id))
+
+    def _clear_checkpoint_sync(self, guild_id: str) -> None:
+        self._checkpoint_ref(guild_id).delete()
@@ -1,10 +1,11 @@
 import asyncio
 import os
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Iterable, TypeVar
 
 
 T = TypeVar("T")
+FIRESTORE_BATCH_LIMIT = 450
 
 _db = None
 _firestore_module = None
@@ -72,3 +73,34 @@ def get_firestore_module():
 
 async def run_firestore(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def set_documents_in_batches(documents: Iterable[tuple[Any, dict[str, Any]]], *, merge: bool = False) -> int:
+    mode = "merge" if merge else "set"
+    return write_documents_in_batches((mode, document_ref, data) for document_ref, data in documents)
+
+
+def write_documents_in_batches(writes: Iterable[tuple[str, Any, dict[str, Any] | None]]) -> int:
+    """Commits `("set" | "merge" | "update" | "delete", document_ref, data)` writes in Firestore-sized batches."""
+    db = get_firestore_client()
+    batch = db.batch()
+    pending = 0
+    written = 0
+    for mode, document_ref, data in writes:
+        if mode == "update":
+            batch.update(document_ref, data)
+        elif mode == "delete":
+            batch.delete(document_ref)
+        elif mode == "merge":
+            batch.set(document_ref, data, merge=True)
+        else:
+            batch.set(document_ref, data)
+        pending += 1
+        written += 1
+        if pending >= FIRESTORE_BATCH_LIMIT:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+    if pending:
+        batch.commit()
+    return written
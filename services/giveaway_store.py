@@ -1,17 +1,103 @@
 from copy import deepcopy
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from services.firebase_client import get_firestore_client, get_firestore_module, run_firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from services.firebase_client import (
+    FIRESTORE_BATCH_LIMIT,
+    get_firestore_client,
+    get_firestore_module,
+    run_firestore,
+    write_documents_in_batches,
+)
 
 
 COLLECTION_NAME = "giveaways"
+ARCHIVE_COLLECTION_NAME = "giveaway_archive"
+ARCHIVE_ENTRANTS_COLLECTION_NAME = "giveaway_archive_entrants"
+# Each archived giveaway is three writes (summary, entrants, live delete) that must share a batch.
+ARCHIVE_BATCH_SIZE = FIRESTORE_BATCH_LIMIT // 3
+ARCHIVE_SUMMARY_KEYS = (
+    "id",
+    "guild_id",
+    "channel_id",
+    "message_id",
+    "host_id",
+    "prize",
+    "description",
+    "image_url",
+    "thumbnail_url",
+    "ping_role_id",
+    "ping_everyone",
+    "status",
+    "winners_count",
+    "winner_ids",
+    "winner_announcement_sent",
+    "required_role_id",
+    "bonus_role_id",
+    "bonus_entries",
+    "color",
+    "created_at",
+    "ends_at",
+    "ended_at",
+    "rerolled_at",
+    "rerolled_by_id",
+)
+
+
+class EntrantSet:
+    """Entrant ids in join order with O(1) membership, add and remove."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, user_ids: Iterable[Any] | None = None):
+        self._ids: dict[int, None] = {}
+        for entry in user_ids or ():
+            try:
+                self._ids[int(entry)] = None
+            except (TypeError, ValueError):
+                continue
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._ids
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EntrantSet):
+            return list(self._ids) == list(other._ids)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EntrantSet({list(self._ids)!r})"
+
+    def add(self, user_id: int) -> bool:
+        if user_id in self._ids:
+            return False
+        self._ids[user_id] = None
+        return True
+
+    def discard(self, user_id: int) -> bool:
+        if user_id not in self._ids:
+            return False
+        del self._ids[user_id]
+        return True
+
+    def to_list(self) -> list[int]:
+        return list(self._ids)
 
 
 def normalize_record(record: dict[str, Any] | None) -> dict[str, Any]:
+    """Normalizes ids and flags; an existing EntrantSet is shared rather than copied."""
     if not isinstance(record, dict):
         return {}
 
-    normalized = deepcopy(record)
+    entrants = record.get("entrants")
+    normalized = deepcopy({key: value for key, value in record.items() if key != "entrants"})
     if normalized.get("id") is not None:
         normalized["id"] = str(normalized["id"])
 
@@ -39,13 +125,21 @@ def normalize_record(record: dict[str, Any] | None) -> dict[str, Any]:
         normalized[key] = int(value) if value is not None else None
 
     normalized["winner_ids"] = [int(user_id) for user_id in normalized.get("winner_ids") or []]
-    normalized["entrants"] = [int(user_id) for user_id in normalized.get("entrants") or []]
+    normalized["entrants"] = entrants if isinstance(entrants, EntrantSet) else EntrantSet(entrants)
     normalized["winner_announcement_sent"] = bool(normalized.get("winner_announcement_sent", False))
     normalized["ping_everyone"] = bool(normalized.get("ping_everyone", False))
     normalized["status"] = str(normalized.get("status") or "active")
     return normalized
 
 
+def archive_summary(record: dict[str, Any]) -> dict[str, Any]:
+    """The compact archive document: winners and counts, without the entrant list."""
+    summary = {key: record.get(key) for key in ARCHIVE_SUMMARY_KEYS}
+    summary["winner_ids"] = list(summary["winner_ids"] or [])
+    summary["entry_count"] = len(record.get("entrants") or ())
+    return summary
+
+
 class GiveawayStore:
     def _collection_ref(self):
         return get_firestore_client().collection(COLLECTION_NAME)
@@ -53,6 +147,12 @@ class GiveawayStore:
     def _giveaway_ref(self, giveaway_id: int | str):
         return self._collection_ref().document(str(giveaway_id))
 
+    def _archive_ref(self, giveaway_id: int | str):
+        return get_firestore_client().collection(ARCHIVE_COLLECTION_NAME).document(str(giveaway_id))
+
+    def _archive_entrants_ref(self, giveaway_id: int | str):
+        return get_firestore_client().collection(ARCHIVE_ENTRANTS_COLLECTION_NAME).document(str(giveaway_id))
+
     async def load_all(self) -> dict[str, dict[str, Any]]:
         return await run_firestore(self._load_all_sync)
 
@@ -65,22 +165,127 @@ class GiveawayStore:
         return giveaways
 
     async def save_giveaway(self, record: dict[str, Any]) -> None:
+        """Writes the whole document, including the full entrant list."""
         snapshot = normalize_record(record)
         giveaway_id = snapshot.get("id")
         if not giveaway_id:
             raise ValueError("Giveaway record is missing an id.")
-        await run_firestore(self._save_giveaway_sync, str(giveaway_id), snapshot)
+        entrants = snapshot["entrants"].to_list()
+        await run_firestore(self._save_giveaway_sync, str(giveaway_id), snapshot, entrants)
+
+    def _save_giveaway_sync(self, giveaway_id: str, record: dict[str, Any], entrants: list[int]) -> None:
+        self._giveaway_ref(giveaway_id).set({**self._document_payload(record), "entrants": entrants}, merge=True)
+
+    async def save_giveaways(
+        self,
+        records: dict[str, dict[str, Any]],
+        entrant_changes: dict[str, dict[int, bool]] | None = None,
+    ) -> None:
+        """Saves giveaway fields and applies entrant joins/leaves as ArrayUnion/ArrayRemove.
+
+        `entrant_changes` maps a giveaway id to `{user_id: joined}`; the entrant list itself is
+        never rewritten here, so an entry click costs a constant-size write.
+        """
+        snapshots = {}
+        for record in records.values():
+            snapshot = normalize_record(record)
+            if snapshot.get("id"):
+                snapshots[str(snapshot["id"])] = snapshot
+        changes = {
+            str(giveaway_id): dict(pending)
+            for giveaway_id, pending in (entrant_changes or {}).items()
+            if str(giveaway_id) in snapshots and pending
+        }
+        if snapshots:
+            await run_firestore(self._save_giveaways_sync, snapshots, changes)
+
+    def _save_giveaways_sync(
+        self,
+        records: dict[str, dict[str, Any]],
+        entrant_changes: dict[str, dict[int, bool]],
+    ) -> None:
+        firestore = get_firestore_module()
+        writes = []
+        for giveaway_id, record in records.items():
+            ref = self._giveaway_ref(giveaway_id)
+            writes.append(("merge", ref, self._document_payload(record)))
+            pending = entrant_changes.get(giveaway_id) or {}
+            joined = [user_id for user_id, is_entered in pending.items() if is_entered]
+            left = [user_id for user_id, is_entered in pending.items() if not is_entered]
+            if joined:
+                writes.append(("update", ref, {"entrants": firestore.ArrayUnion(joined)}))
+            if left:
+                writes.append(("update", ref, {"entrants": firestore.ArrayRemove(left)}))
+        write_documents_in_batches(writes)
+
+    @staticmethod
+    def _document_payload(record: dict[str, Any]) -> dict[str, Any]:
+        firestore = get_firestore_module()
+        return {
+            **{key: value for key, value in record.items() if key != "entrants"},
+            "version": 1,
+            "updated_at": firestore.SERVER_TIMESTAMP,
+        }
 
-    def _save_giveaway_sync(self, giveaway_id: str, record: dict[str, Any]) -> None:
+    async def archive_giveaways(self, records: Iterable[dict[str, Any]]) -> None:
+        """Moves giveaways to the archive: a compact summary plus a side document for entrants.
+
+        The live document is deleted in the same batch as its archive copies, so startup no longer
+        loads it and a failed batch never leaves a giveaway half moved.
+        """
+        archived = []
+        for record in records:
+            snapshot = normalize_record(record)
+            if snapshot.get("id"):
+                archived.append((archive_summary(snapshot), snapshot["entrants"].to_list()))
+        if archived:
+            await run_firestore(self._archive_giveaways_sync, archived)
+
+    def _archive_giveaways_sync(self, archived: list[tuple[dict[str, Any], list[int]]]) -> None:
         firestore = get_firestore_module()
-        self._giveaway_ref(giveaway_id).set(
-            {
-                **record,
-                "version": 1,
-                "updated_at": firestore.SERVER_TIMESTAMP,
-            },
-            merge=True,
-        )
+        for start in range(0, len(archived), ARCHIVE_BATCH_SIZE):
+            writes = []
+            for summary, entrants in archived[start : start + ARCHIVE_BATCH_SIZE]:
+                giveaway_id = summary["id"]
+                writes.append(("set", self._archive_ref(giveaway_id), {**summary, "archived_at": firestore.SERVER_TIMESTAMP}))
+                writes.append(("set", self._archive_entrants_ref(giveaway_id), {"entrants": entrants}))
+                writes.append(("delete", self._giveaway_ref(giveaway_id), None))
+            write_documents_in_batches(writes)
+
+    async def load_archived(self, identifier: str, guild_id: int | None = None) -> dict[str, Any] | None:
+        """Loads an archived giveaway by id or message id, fetching its entrants on demand."""
+        return await run_firestore(self._load_archived_sync, identifier.strip(), guild_id)
+
+    def _load_archived_sync(self, identifier: str, guild_id: int | None) -> dict[str, Any] | None:
+        if not identifier:
+            return None
+        snapshot = self._archive_ref(identifier).get()
+        if not snapshot.exists and identifier.isdigit():
+            collection = get_firestore_client().collection(ARCHIVE_COLLECTION_NAME)
+            query = collection.where(filter=FieldFilter("message_id", "==", int(identifier)))
+            snapshot = next(iter(query.limit(1).stream()), None)
+        if snapshot is None or not snapshot.exists:
+            return None
+
+        summary = snapshot.to_dict() or {}
+        summary.setdefault("id", snapshot.id)
+        if guild_id is not None and summary.get("guild_id") != guild_id:
+            return None
+        entrants_snapshot = self._archive_entrants_ref(summary["id"]).get()
+        entrants_doc = (entrants_snapshot.to_dict() or {}) if entrants_snapshot.exists else {}
+        summary.pop("archived_at", None)
+        summary["entrants"] = entrants_doc.get("entrants") or []
+        return normalize_record(summary)
+
+    async def save_archived(self, record: dict[str, Any]) -> None:
+        """Updates the archive summary after a reroll; the entrant side document is left as is."""
+        summary = archive_summary(normalize_record(record))
+        if not summary.get("id"):
+            raise ValueError("Giveaway record is missing an id.")
+        await run_firestore(self._save_archived_sync, summary)
+
+    def _save_archived_sync(self, summary: dict[str, Any]) -> None:
+        self._archive_ref(summary["id"]).set(summary, merge=True)
 
     async def delete_giveaway(self, giveaway_id: int | str) -> None:
         await run_firestore(self._delete_giveaway_sync, str(giveaway_id))
@@ -1,6 +1,11 @@
 from typing import Any
 
-from services.firebase_client import get_firestore_client, get_firestore_module, run_firestore
+from services.firebase_client import (
+    get_firestore_client,
+    get_firestore_module,
+    run_firestore,
+    set_documents_in_batches,
+)
 
 
 COLLECTION_NAME = "guard_configs"
@@ -39,12 +44,23 @@ class GuardStore:
         await run_firestore(self._save_guild_sync, str(guild_id), snapshot)
 
     def _save_guild_sync(self, guild_id: str, config: dict[str, Any]) -> None:
-        firestore = get_firestore_module()
-        self._config_ref(guild_id).set(
-            {
-                "anti_ad_enabled": bool(config.get("anti_ad_enabled", False)),
-                "anti_ghost_ping_enabled": bool(config.get("anti_ghost_ping_enabled", False)),
-                "updated_at": firestore.SERVER_TIMESTAMP,
-            },
+        self._config_ref(guild_id).set(self._document_payload(config), merge=True)
+
+    async def save_guilds(self, configs: dict[str, dict[str, Any]]) -> None:
+        snapshots = {str(guild_id): normalize_config(config) for guild_id, config in configs.items()}
+        await run_firestore(self._save_guilds_sync, snapshots)
+
+    def _save_guilds_sync(self, configs: dict[str, dict[str, Any]]) -> None:
+        set_documents_in_batches(
+            ((self._config_ref(guild_id), self._document_payload(config)) for guild_id, config in configs.items()),
             merge=True,
         )
+
+    @staticmethod
+    def _document_payload(config: dict[str, Any]) -> dict[str, Any]:
+        firestore = get_firestore_module()
+        return {
+            "anti_ad_enabled": bool(config.get("anti_ad_enabled", False)),
+            "anti_ghost_ping_enabled": bool(config.get("anti_ghost_ping_enabled", False)),
+            "updated_at": firestore.SERVER_TIMESTAMP,
+        }
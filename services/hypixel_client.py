@@ -2,22 +2,35 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import heapq
 import math
 import os
 import re
+import sqlite3
+import sys
 import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 
 import aiohttp
 
+from services.minecraft_profile_cache import MinecraftProfileDiskCache
+from services.write_behind import WriteBehindQueue
+
 
 HTTP_TIMEOUT = aiohttp.ClientTimeout(total=12)
 MOJANG_PROFILE_URL = "https://api.mojang.com/users/profiles/minecraft/{username}"
+MOJANG_BULK_PROFILES_URL = "https://api.minecraftservices.com/minecraft/profile/lookup/bulk/byname"
+MOJANG_BULK_LIMIT = 10
+MAX_COMPARE_PLAYERS = 10
 HYPIXEL_PLAYER_URL = "https://api.hypixel.net/v2/player"
 HYPIXEL_SKYBLOCK_PROFILES_URL = "https://api.hypixel.net/v2/skyblock/profiles"
 MINECRAFT_USERNAME_RE = re.compile(r"^[A-Za-z0-9_]{3,16}$")
+SKYBLOCK_MEMBER_SKIPPED_KEYS = frozenset({"inventory", "shared_inventory"})
 
 
 def _positive_int_env(name: str, default: int) -> int:
@@ -31,6 +44,24 @@ PROFILE_CACHE_SECONDS = _positive_int_env("HYPIXEL_PROFILE_CACHE_SECONDS", 24 *
 PLAYER_CACHE_SECONDS = _positive_int_env("HYPIXEL_PLAYER_CACHE_SECONDS", 90)
 SKYBLOCK_PROFILE_CACHE_SECONDS = _positive_int_env("HYPIXEL_SKYBLOCK_PROFILE_CACHE_SECONDS", 120)
 RATE_LIMIT_RETRY_MAX_SECONDS = _positive_int_env("HYPIXEL_RATE_LIMIT_RETRY_MAX_SECONDS", 5)
+PROFILE_CACHE_MAX_ENTRIES = _positive_int_env("HYPIXEL_PROFILE_CACHE_MAX_ENTRIES", 10000)
+PROFILE_CACHE_MAX_BYTES = _positive_int_env("HYPIXEL_PROFILE_CACHE_MAX_BYTES", 4 * 1024 * 1024)
+PLAYER_CACHE_MAX_ENTRIES = _positive_int_env("HYPIXEL_PLAYER_CACHE_MAX_ENTRIES", 500)
+PLAYER_CACHE_MAX_BYTES = _positive_int_env("HYPIXEL_PLAYER_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+SKYBLOCK_PROFILE_CACHE_MAX_ENTRIES = _positive_int_env("HYPIXEL_SKYBLOCK_PROFILE_CACHE_MAX_ENTRIES", 50)
+SKYBLOCK_PROFILE_CACHE_MAX_BYTES = _positive_int_env("HYPIXEL_SKYBLOCK_PROFILE_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+CACHE_SWEEP_INTERVAL_SECONDS = 30
+PROFILE_DISK_FLUSH_SECONDS = _positive_int_env("HYPIXEL_PROFILE_DISK_FLUSH_SECONDS", 5)
+RATE_LIMIT_DEFAULT_LIMIT = _positive_int_env("HYPIXEL_RATE_LIMIT_DEFAULT_LIMIT", 300)
+RATE_LIMIT_DEFAULT_WINDOW_SECONDS = _positive_int_env("HYPIXEL_RATE_LIMIT_DEFAULT_WINDOW_SECONDS", 300)
+RATE_LIMIT_BURST = _positive_int_env("HYPIXEL_RATE_LIMIT_BURST", 10)
+RATE_LIMIT_MAX_QUEUE_SECONDS = _positive_int_env("HYPIXEL_RATE_LIMIT_MAX_QUEUE_SECONDS", 10)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+HTTP_POOL_LIMIT = _positive_int_env("HYPIXEL_HTTP_POOL_LIMIT", 20)
+HTTP_POOL_PER_HOST_LIMIT = _positive_int_env("HYPIXEL_HTTP_PER_HOST_LIMIT", 8)
+HTTP_KEEPALIVE_SECONDS = _positive_int_env("HYPIXEL_HTTP_KEEPALIVE_SECONDS", 60)
+HTTP_DNS_CACHE_SECONDS = _positive_int_env("HYPIXEL_HTTP_DNS_CACHE_SECONDS", 300)
 
 
 class HypixelClientError(RuntimeError):
@@ -100,10 +131,186 @@ class ProScore:
     bar: str
 
 
+@dataclass(slots=True)
+class HypixelHTTPStats:
+    requests: int = 0
+    failed_requests: int = 0
+    request_seconds: float = 0.0
+    new_connections: int = 0
+    reused_connections: int = 0
+    connect_seconds: float = 0.0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def average_request_ms(self) -> float:
+        return (self.request_seconds / self.requests) * 1000 if self.requests else 0.0
+
+    @property
+    def average_connect_ms(self) -> float:
+        return (self.connect_seconds / self.new_connections) * 1000 if self.new_connections else 0.0
+
+    @property
+    def estimated_saved_ms(self) -> float:
+        return self.reused_connections * self.average_connect_ms
+
+
 @dataclass(slots=True)
 class _CacheEntry:
     expires_at: float
     value: Any
+    size: int = 0
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Cached Hypixel data is read-only. Copy it before modifying.")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Cached Hypixel data is read-only. Copy it before modifying.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze_value(value: Any) -> tuple[Any, int]:
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        items = {}
+        for key, item in value.items():
+            frozen, item_size = freeze_value(item)
+            items[key] = frozen
+            size += sys.getsizeof(key) + item_size
+        return FrozenDict(items), size
+    if isinstance(value, (list, tuple)):
+        size = sys.getsizeof(value)
+        items = []
+        for item in value:
+            frozen, item_size = freeze_value(item)
+            items.append(frozen)
+            size += item_size
+        return (FrozenList(items) if isinstance(value, list) else tuple(items)), size
+    return value, sys.getsizeof(value)
+
+
+class _TTLCache:
+    def __init__(self, name: str, *, max_entries: int, max_bytes: int):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._next_sweep_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        now = time.monotonic()
+        self._sweep_if_due(now)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: int) -> Any:
+        frozen, size = freeze_value(value)
+        if ttl <= 0 or (self.max_bytes and size > self.max_bytes):
+            return frozen
+
+        now = time.monotonic()
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(now + ttl, frozen, size)
+        self.total_bytes += size
+        self._sweep_if_due(now)
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self.total_bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+        return frozen
+
+    def sweep(self, now: float | None = None) -> int:
+        current = time.monotonic() if now is None else now
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= current]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        self._next_sweep_at = current + CACHE_SWEEP_INTERVAL_SECONDS
+        return len(expired)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._next_sweep_at = 0.0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _sweep_if_due(self, now: float) -> None:
+        if now >= self._next_sweep_at:
+            self.sweep(now)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
 
 
 @dataclass(slots=True)
@@ -113,11 +320,152 @@ class _RateLimitHeaders:
     reset_after: int | None = None
 
 
-_cache_lock = asyncio.Lock()
-_profile_cache: dict[str, _CacheEntry] = {}
-_player_cache: dict[str, _CacheEntry] = {}
-_skyblock_profiles_cache: dict[str, _CacheEntry] = {}
+class HypixelRateLimiter:
+    def __init__(
+        self,
+        *,
+        burst: int = RATE_LIMIT_BURST,
+        max_wait: float = RATE_LIMIT_MAX_QUEUE_SECONDS,
+        default_limit: int = RATE_LIMIT_DEFAULT_LIMIT,
+        window_seconds: int = RATE_LIMIT_DEFAULT_WINDOW_SECONDS,
+    ):
+        self.burst = max(1, int(burst))
+        self.max_wait = max(0.0, float(max_wait))
+        self.window_seconds = max(1, int(window_seconds))
+        self.limit = max(1, int(default_limit))
+        self.reset()
+
+    def reset(self) -> None:
+        self.quota_remaining = self.limit
+        self.reset_at = 0.0
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.granted = 0
+        self.queued = 0
+        self.rejected = 0
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = 0
+        self._dispatcher: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    def status(self) -> dict[str, int]:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "limit": self.limit,
+            "remaining": max(0, self.quota_remaining),
+            "reset_in": max(0, math.ceil(self.reset_at - now)) if self.reset_at else 0,
+            "queue_depth": self.queue_depth,
+            "granted": self.granted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+        }
+
+    def update(self, limits: _RateLimitHeaders) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        if limits.limit:
+            self.limit = limits.limit
+        if limits.remaining is not None:
+            self.quota_remaining = limits.remaining
+        if limits.reset_after is not None:
+            self.reset_at = now + limits.reset_after
+        self.tokens = min(self.tokens, float(max(0, self.quota_remaining)))
+
+    def wait_seconds(self, now: float | None = None) -> float:
+        current = time.monotonic() if now is None else now
+        self._refill(current)
+        backoff = max(0.0, _rate_limited_until - current)
+        if self.quota_remaining <= 0:
+            return max(backoff, self._window_left(current))
+        if self.tokens >= 1:
+            return backoff
+        rate = self._refill_rate(current)
+        token_wait = (1 - self.tokens) / rate if rate > 0 else self._window_left(current)
+        return max(backoff, token_wait)
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        wait = self.wait_seconds()
+        if not self._queue and wait <= 0:
+            self._grant()
+            return
+        if wait > self.max_wait:
+            self.rejected += 1
+            raise self._limit_error(wait)
+
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(self._queue, (int(priority), self._sequence, future))
+        self.queued += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self) -> None:
+        while self._queue:
+            if self._queue[0][2].done():
+                heapq.heappop(self._queue)
+                continue
+            wait = self.wait_seconds()
+            if wait > self.max_wait:
+                error = self._limit_error(wait)
+                while self._queue:
+                    _, _, future = heapq.heappop(self._queue)
+                    if not future.done():
+                        self.rejected += 1
+                        future.set_exception(error)
+                return
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self._grant()
+                future.set_result(None)
+
+    def _grant(self) -> None:
+        self.tokens -= 1
+        self.quota_remaining -= 1
+        self.granted += 1
+
+    def _refill(self, now: float) -> None:
+        if self.reset_at and now >= self.reset_at:
+            self.quota_remaining = self.limit
+            self.reset_at = now + self.window_seconds
+        elapsed = max(0.0, now - self.updated_at)
+        ceiling = float(min(self.burst, max(0, self.quota_remaining)))
+        self.tokens = min(ceiling, self.tokens + elapsed * self._refill_rate(now))
+        self.updated_at = now
+
+    def _refill_rate(self, now: float) -> float:
+        return max(0, self.quota_remaining) / max(1.0, self._window_left(now))
+
+    def _window_left(self, now: float) -> float:
+        return self.reset_at - now if self.reset_at > now else float(self.window_seconds)
+
+    def _limit_error(self, wait: float) -> HypixelRateLimit:
+        return _rate_limit_error(math.ceil(wait), limit=self.limit, remaining=max(0, self.quota_remaining))
+
+
+_profile_cache = _TTLCache("profiles", max_entries=PROFILE_CACHE_MAX_ENTRIES, max_bytes=PROFILE_CACHE_MAX_BYTES)
+_player_cache = _TTLCache("players", max_entries=PLAYER_CACHE_MAX_ENTRIES, max_bytes=PLAYER_CACHE_MAX_BYTES)
+_skyblock_profiles_cache = _TTLCache(
+    "skyblock_profiles",
+    max_entries=SKYBLOCK_PROFILE_CACHE_MAX_ENTRIES,
+    max_bytes=SKYBLOCK_PROFILE_CACHE_MAX_BYTES,
+)
 _rate_limited_until = 0.0
+_http_stats = HypixelHTTPStats()
+_inflight_requests: dict[tuple[str, str], asyncio.Task] = {}
+_owned_session_flights: dict[aiohttp.ClientSession, set[asyncio.Task]] = {}
+_session_closers: set[asyncio.Task] = set()
+_rate_limiter = HypixelRateLimiter()
+_profile_disk_cache: MinecraftProfileDiskCache | None = None
+_profile_disk_writer: WriteBehindQueue | None = None
+_profile_disk_pending: dict[str, tuple[str, str, str, float]] = {}
 
 GAME_TYPE_NAMES = {
     "QUAKECRAFT": "Quake",
@@ -158,9 +506,172 @@ def clear_hypixel_cache() -> None:
     _profile_cache.clear()
     _player_cache.clear()
     _skyblock_profiles_cache.clear()
+    _inflight_requests.clear()
+    _rate_limiter.reset()
     _rate_limited_until = 0.0
 
 
+async def open_profile_disk_cache(path: str | None = None) -> int:
+    global _profile_disk_cache, _profile_disk_writer
+    if _profile_disk_cache is not None:
+        return 0
+
+    disk_cache = MinecraftProfileDiskCache(path)
+    await disk_cache.run(disk_cache.open)
+    rows = await disk_cache.run(disk_cache.load_fresh, PROFILE_CACHE_MAX_ENTRIES)
+    now = time.time()
+    for username_key, uuid, name, expires_at in reversed(rows):
+        _profile_cache.set(username_key, (uuid, name), math.ceil(expires_at - now))
+
+    _profile_disk_cache = disk_cache
+    _profile_disk_writer = WriteBehindQueue(
+        "minecraft profiles",
+        _profile_disk_pending.get,
+        _flush_profile_rows,
+        delay=PROFILE_DISK_FLUSH_SECONDS,
+    )
+    return len(rows)
+
+
+async def close_profile_disk_cache() -> None:
+    global _profile_disk_cache, _profile_disk_writer
+    if _profile_disk_writer is not None:
+        await _profile_disk_writer.close()
+    if _profile_disk_cache is not None:
+        await _profile_disk_cache.run(_profile_disk_cache.close)
+    _profile_disk_cache = None
+    _profile_disk_writer = None
+    _profile_disk_pending.clear()
+
+
+async def _flush_profile_rows(rows: dict[str, tuple[str, str, str, float]]) -> None:
+    disk_cache = _profile_disk_cache
+    if disk_cache is None:
+        return
+    await disk_cache.run(disk_cache.save_many, list(rows.values()))
+    for username_key, row in rows.items():
+        if _profile_disk_pending.get(username_key) is row:
+            _profile_disk_pending.pop(username_key, None)
+
+
+async def _get_disk_profile(username_key: str) -> tuple[str, str] | None:
+    disk_cache = _profile_disk_cache
+    if disk_cache is None:
+        return None
+    try:
+        stored = await disk_cache.run(disk_cache.get, username_key)
+    except sqlite3.Error:
+        return None
+    if stored is None:
+        return None
+    uuid, name, expires_at = stored
+    return _profile_cache.set(username_key, (uuid, name), max(1, math.ceil(expires_at - time.time())))
+
+
+def _queue_profile_write(username_key: str, uuid: str, name: str) -> None:
+    if _profile_disk_writer is None or PROFILE_CACHE_SECONDS <= 0:
+        return
+    _profile_disk_pending[username_key] = (username_key, uuid, name, time.time() + PROFILE_CACHE_SECONDS)
+    _profile_disk_writer.mark_dirty(username_key)
+
+
+def hypixel_cache_stats() -> dict[str, dict[str, int]]:
+    return {cache.name: cache.stats() for cache in (_profile_cache, _player_cache, _skyblock_profiles_cache)}
+
+
+def hypixel_rate_limit_status() -> dict[str, int]:
+    return _rate_limiter.status()
+
+
+def hypixel_http_stats() -> HypixelHTTPStats:
+    return _http_stats
+
+
+def reset_hypixel_http_stats() -> None:
+    global _http_stats
+    _http_stats = HypixelHTTPStats()
+
+
+def create_hypixel_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_PER_HOST_LIMIT,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+        use_dns_cache=True,
+    )
+    return aiohttp.ClientSession(
+        timeout=HTTP_TIMEOUT,
+        connector=connector,
+        trace_configs=[_http_trace_config()],
+    )
+
+
+def _http_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(_session, context: SimpleNamespace, _params) -> None:
+        context.request_started = time.perf_counter()
+
+    async def on_request_end(_session, context: SimpleNamespace, _params) -> None:
+        _http_stats.requests += 1
+        _http_stats.request_seconds += time.perf_counter() - getattr(context, "request_started", time.perf_counter())
+
+    async def on_request_exception(_session, _context: SimpleNamespace, _params) -> None:
+        _http_stats.failed_requests += 1
+
+    async def on_connection_create_start(_session, context: SimpleNamespace, _params) -> None:
+        context.connect_started = time.perf_counter()
+
+    async def on_connection_create_end(_session, context: SimpleNamespace, _params) -> None:
+        _http_stats.new_connections += 1
+        _http_stats.connect_seconds += time.perf_counter() - getattr(context, "connect_started", time.perf_counter())
+
+    async def on_connection_reuseconn(_session, _context: SimpleNamespace, _params) -> None:
+        _http_stats.reused_connections += 1
+
+    async def on_dns_cache_hit(_session, _context: SimpleNamespace, _params) -> None:
+        _http_stats.dns_cache_hits += 1
+
+    async def on_dns_cache_miss(_session, _context: SimpleNamespace, _params) -> None:
+        _http_stats.dns_cache_misses += 1
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+    return trace_config
+
+
+@asynccontextmanager
+async def _session_scope(session: aiohttp.ClientSession | None) -> AsyncIterator[aiohttp.ClientSession]:
+    if session is not None and not session.closed:
+        yield session
+        return
+    owned_session = aiohttp.ClientSession(timeout=HTTP_TIMEOUT)
+    _owned_session_flights[owned_session] = set()
+    try:
+        yield owned_session
+    finally:
+        flights = {task for task in _owned_session_flights.pop(owned_session) if not task.done()}
+        if flights:
+            # Shared requests started on this session still serve other waiters; close it after them.
+            closer = asyncio.create_task(_close_after_flights(owned_session, flights))
+            _session_closers.add(closer)
+            closer.add_done_callback(_session_closers.discard)
+        else:
+            await owned_session.close()
+
+
+async def _close_after_flights(session: aiohttp.ClientSession, flights: set[asyncio.Task]) -> None:
+    await asyncio.wait(flights)
+    await session.close()
+
+
 def clean_username(username: str) -> str:
     cleaned = str(username or "").strip()
     if not MINECRAFT_USERNAME_RE.fullmatch(cleaned):
@@ -168,26 +679,78 @@ def clean_username(username: str) -> str:
     return cleaned
 
 
-async def fetch_hypixel_player(api_key: str | None, username: str) -> HypixelPlayerBundle:
+def unique_usernames(usernames: Iterable[str]) -> list[str]:
+    seen: set[str] = set()
+    unique: list[str] = []
+    for username in usernames:
+        cleaned = str(username or "").strip()
+        if cleaned and cleaned.casefold() not in seen:
+            seen.add(cleaned.casefold())
+            unique.append(cleaned)
+    return unique
+
+
+async def fetch_hypixel_player(
+    api_key: str | None,
+    username: str,
+    *,
+    session: aiohttp.ClientSession | None = None,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> HypixelPlayerBundle:
     if not api_key:
         raise HypixelConfigError("Hypixel API key is not configured.")
 
     cleaned = clean_username(username)
-    async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
+    async with _session_scope(session) as session:
         uuid, resolved_name = await resolve_minecraft_profile(session, cleaned)
-        player = await fetch_player_data(session, api_key, uuid)
+        player = await fetch_player_data(session, api_key, uuid, priority=priority)
 
     return HypixelPlayerBundle(username=resolved_name, uuid=uuid, player=player)
 
 
-async def fetch_skyblock_profile(api_key: str | None, username: str) -> SkyBlockProfileBundle:
+async def fetch_hypixel_players(
+    api_key: str | None,
+    usernames: Iterable[str],
+    *,
+    session: aiohttp.ClientSession | None = None,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> list[HypixelPlayerBundle | HypixelClientError]:
+    if not api_key:
+        raise HypixelConfigError("Hypixel API key is not configured.")
+
+    requested = [str(username or "").strip() for username in usernames]
+    valid_names = [username for username in requested if MINECRAFT_USERNAME_RE.fullmatch(username)]
+    async with _session_scope(session) as session:
+        profiles = await resolve_minecraft_profiles(session, valid_names)
+
+        async def load(username: str) -> HypixelPlayerBundle | HypixelClientError:
+            profile = profiles.get(username.casefold())
+            if profile is None:
+                return MinecraftPlayerNotFound(f"Player `{username}` was not found.")
+            uuid, resolved_name = profile
+            try:
+                player = await fetch_player_data(session, api_key, uuid, priority=priority)
+            except HypixelClientError as exc:
+                return exc
+            return HypixelPlayerBundle(username=resolved_name, uuid=uuid, player=player)
+
+        return list(await asyncio.gather(*(load(username) for username in requested)))
+
+
+async def fetch_skyblock_profile(
+    api_key: str | None,
+    username: str,
+    *,
+    session: aiohttp.ClientSession | None = None,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> SkyBlockProfileBundle:
     if not api_key:
         raise HypixelConfigError("Hypixel API key is not configured.")
 
     cleaned = clean_username(username)
-    async with aiohttp.ClientSession(timeout=HTTP_TIMEOUT) as session:
+    async with _session_scope(session) as session:
         uuid, resolved_name = await resolve_minecraft_profile(session, cleaned)
-        profiles = await fetch_skyblock_profiles(session, api_key, uuid)
+        profiles = await fetch_skyblock_profiles(session, api_key, uuid, priority=priority)
 
     profile, member = choose_skyblock_profile(profiles, uuid)
     return SkyBlockProfileBundle(username=resolved_name, uuid=uuid, profile=profile, member=member)
@@ -200,6 +763,79 @@ async def resolve_minecraft_profile(session: aiohttp.ClientSession, username: st
     if cached:
         return cached
 
+    stored = await _get_disk_profile(cache_key)
+    if stored:
+        return stored
+
+    return await _single_flight(
+        ("mojang_profile", cache_key),
+        lambda: _request_minecraft_profile(session, cleaned, cache_key),
+        session=session,
+    )
+
+
+async def resolve_minecraft_profiles(
+    session: aiohttp.ClientSession,
+    usernames: Iterable[str],
+) -> dict[str, tuple[str, str]]:
+    wanted: dict[str, str] = {}
+    for username in usernames:
+        cleaned = clean_username(username)
+        wanted.setdefault(cleaned.casefold(), cleaned)
+
+    resolved: dict[str, tuple[str, str]] = {}
+    missing: list[str] = []
+    for cache_key, cleaned in wanted.items():
+        cached = await _get_cache(_profile_cache, cache_key) or await _get_disk_profile(cache_key)
+        if cached:
+            resolved[cache_key] = cached
+        else:
+            missing.append(cleaned)
+
+    chunks = [missing[index:index + MOJANG_BULK_LIMIT] for index in range(0, len(missing), MOJANG_BULK_LIMIT)]
+    for found in await asyncio.gather(*(_resolve_profile_chunk(session, chunk) for chunk in chunks)):
+        resolved.update(found)
+    return {cache_key: resolved[cache_key] for cache_key in wanted if cache_key in resolved}
+
+
+async def _resolve_profile_chunk(session: aiohttp.ClientSession, usernames: list[str]) -> dict[str, tuple[str, str]]:
+    flight_key = ",".join(sorted(username.casefold() for username in usernames))
+    return await _single_flight(
+        ("mojang_bulk_profiles", flight_key),
+        lambda: _request_minecraft_profiles_bulk(session, usernames),
+        session=session,
+    )
+
+
+async def _request_minecraft_profiles_bulk(
+    session: aiohttp.ClientSession,
+    usernames: list[str],
+) -> dict[str, tuple[str, str]]:
+    try:
+        async with session.post(MOJANG_BULK_PROFILES_URL, json=usernames) as response:
+            if response.status == 429:
+                raise HypixelUnavailable("Mojang is rate-limiting username lookups. Please try again shortly.")
+            if response.status != 200:
+                raise HypixelUnavailable(f"Mojang bulk username lookup returned HTTP {response.status}.")
+            data = await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        raise HypixelUnavailable("Failed to contact Mojang. Please try again shortly.") from exc
+
+    found: dict[str, tuple[str, str]] = {}
+    for item in data if isinstance(data, list) else []:
+        if not isinstance(item, dict):
+            continue
+        uuid = str(item.get("id") or "").strip()
+        name = str(item.get("name") or "").strip()
+        if not uuid or not name:
+            continue
+        cache_key = name.casefold()
+        _queue_profile_write(cache_key, uuid, name)
+        found[cache_key] = await _set_cache(_profile_cache, cache_key, (uuid, name), PROFILE_CACHE_SECONDS)
+    return found
+
+
+async def _request_minecraft_profile(session: aiohttp.ClientSession, cleaned: str, cache_key: str) -> tuple[str, str]:
     try:
         async with session.get(MOJANG_PROFILE_URL.format(username=cleaned.lower())) as response:
             if response.status == 429:
@@ -215,17 +851,35 @@ async def resolve_minecraft_profile(session: aiohttp.ClientSession, username: st
     if not uuid:
         raise MinecraftPlayerNotFound("Player not found. Check the Minecraft username spelling.")
 
-    value = (uuid, name)
-    await _set_cache(_profile_cache, cache_key, value, PROFILE_CACHE_SECONDS)
-    return value
+    _queue_profile_write(cache_key, uuid, name)
+    return await _set_cache(_profile_cache, cache_key, (uuid, name), PROFILE_CACHE_SECONDS)
 
 
-async def fetch_skyblock_profiles(session: aiohttp.ClientSession, api_key: str, uuid: str) -> list[dict[str, Any]]:
+async def fetch_skyblock_profiles(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    uuid: str,
+    *,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> list[dict[str, Any]]:
     normalized_uuid = str(uuid or "").replace("-", "").strip().lower()
     cached = await _get_cache(_skyblock_profiles_cache, normalized_uuid)
     if cached is not None:
         return cached
 
+    return await _single_flight(
+        ("skyblock_profiles", normalized_uuid),
+        lambda: _request_skyblock_profiles(session, api_key, normalized_uuid, priority),
+        session=session,
+    )
+
+
+async def _request_skyblock_profiles(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    normalized_uuid: str,
+    priority: int,
+) -> list[dict[str, Any]]:
     active_wait = _active_rate_limit_seconds()
     if active_wait > 0:
         raise _rate_limit_error(active_wait)
@@ -235,9 +889,11 @@ async def fetch_skyblock_profiles(session: aiohttp.ClientSession, api_key: str,
     data: dict[str, Any] | None = None
 
     for attempt in range(2):
+        await _rate_limiter.acquire(priority)
         try:
             async with session.get(HYPIXEL_SKYBLOCK_PROFILES_URL, headers=headers, params=params) as response:
                 limits = parse_rate_limit_headers(response.headers)
+                _rate_limiter.update(limits)
                 if response.status == 403:
                     raise HypixelConfigError("Hypixel API key is invalid or forbidden.")
                 if response.status == 429:
@@ -276,8 +932,32 @@ async def fetch_skyblock_profiles(session: aiohttp.ClientSession, api_key: str,
     if not isinstance(profiles, list) or not profiles:
         raise MinecraftPlayerNotFound("No SkyBlock profiles were found for this player.")
 
-    await _set_cache(_skyblock_profiles_cache, normalized_uuid, profiles, SKYBLOCK_PROFILE_CACHE_SECONDS)
-    return copy.deepcopy(profiles)
+    profiles = project_skyblock_profiles(profiles, normalized_uuid)
+    return await _set_cache(_skyblock_profiles_cache, normalized_uuid, profiles, SKYBLOCK_PROFILE_CACHE_SECONDS)
+
+
+def project_skyblock_profiles(profiles: list[Any], uuid: str) -> list[dict[str, Any]]:
+    """Keeps only `uuid`'s member subtree, minus inventory blobs, so co-op payloads are never cached.
+
+    Other members stay as empty dicts so the co-op member count is still available.
+    """
+    projected = []
+    for profile in profiles:
+        if not isinstance(profile, dict):
+            continue
+        member = skyblock_member(profile, uuid)
+        members = profile.get("members") or {}
+        trimmed = {key: value for key, value in profile.items() if key != "members"}
+        trimmed["members"] = {
+            str(key): (
+                {field: data for field, data in value.items() if field not in SKYBLOCK_MEMBER_SKIPPED_KEYS}
+                if value is member
+                else {}
+            )
+            for key, value in (members.items() if isinstance(members, dict) else ())
+        }
+        projected.append(trimmed)
+    return projected
 
 
 def choose_skyblock_profile(profiles: list[dict[str, Any]], uuid: str) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -297,7 +977,7 @@ def choose_skyblock_profile(profiles: list[dict[str, Any]], uuid: str) -> tuple[
         raise MinecraftPlayerNotFound("No SkyBlock profile data was found for this player.")
     candidates.sort(key=lambda item: item[0], reverse=True)
     _, profile, member = candidates[0]
-    return copy.deepcopy(profile), copy.deepcopy(member)
+    return profile, member
 
 
 def skyblock_member(profile: dict[str, Any], uuid: str) -> dict[str, Any] | None:
@@ -318,12 +998,31 @@ def skyblock_member(profile: dict[str, Any], uuid: str) -> dict[str, Any] | None
     return None
 
 
-async def fetch_player_data(session: aiohttp.ClientSession, api_key: str, uuid: str) -> dict[str, Any]:
+async def fetch_player_data(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    uuid: str,
+    *,
+    priority: int = PRIORITY_INTERACTIVE,
+) -> dict[str, Any]:
     normalized_uuid = str(uuid or "").replace("-", "").strip().lower()
     cached = await _get_cache(_player_cache, normalized_uuid)
     if cached:
         return cached
 
+    return await _single_flight(
+        ("hypixel_player", normalized_uuid),
+        lambda: _request_player_data(session, api_key, normalized_uuid, priority),
+        session=session,
+    )
+
+
+async def _request_player_data(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    normalized_uuid: str,
+    priority: int,
+) -> dict[str, Any]:
     active_wait = _active_rate_limit_seconds()
     if active_wait > 0:
         raise _rate_limit_error(active_wait)
@@ -333,9 +1032,11 @@ async def fetch_player_data(session: aiohttp.ClientSession, api_key: str, uuid:
     data: dict[str, Any] | None = None
 
     for attempt in range(2):
+        await _rate_limiter.acquire(priority)
         try:
             async with session.get(HYPIXEL_PLAYER_URL, headers=headers, params=params) as response:
                 limits = parse_rate_limit_headers(response.headers)
+                _rate_limiter.update(limits)
                 if response.status == 403:
                     raise HypixelConfigError("Hypixel API key is invalid or forbidden.")
                 if response.status == 429:
@@ -374,8 +1075,7 @@ async def fetch_player_data(session: aiohttp.ClientSession, api_key: str, uuid:
     if not isinstance(player, dict):
         raise MinecraftPlayerNotFound("This player has never joined Hypixel.")
 
-    await _set_cache(_player_cache, normalized_uuid, player, PLAYER_CACHE_SECONDS)
-    return copy.deepcopy(player)
+    return await _set_cache(_player_cache, normalized_uuid, player, PLAYER_CACHE_SECONDS)
 
 
 def parse_rate_limit_headers(headers: Any) -> _RateLimitHeaders:
@@ -578,24 +1278,41 @@ def _build_pro_score(score: float) -> ProScore:
     )
 
 
-async def _get_cache(cache: dict[str, _CacheEntry], key: str) -> Any | None:
+async def _single_flight(
+    key: tuple[str, str],
+    request: Callable[[], Awaitable[Any]],
+    *,
+    session: aiohttp.ClientSession | None = None,
+) -> Any:
+    """Joins the in-flight request for `key`, or starts `request` on `session` for everyone to share."""
+    task = _inflight_requests.get(key)
+    if task is None or task.done():
+        task = asyncio.create_task(request())
+        _inflight_requests[key] = task
+        task.add_done_callback(lambda finished: _finish_flight(key, finished))
+        flights = _owned_session_flights.get(session) if session is not None else None
+        if flights is not None:
+            flights.add(task)
+    return await asyncio.shield(task)
+
+
+def _finish_flight(key: tuple[str, str], task: asyncio.Task) -> None:
+    if _inflight_requests.get(key) is task:
+        _inflight_requests.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _get_cache(cache: _TTLCache, key: str) -> Any | None:
     if not key:
         return None
-    async with _cache_lock:
-        entry = cache.get(key)
-        if entry is None:
-            return None
-        if entry.expires_at <= time.monotonic():
-            cache.pop(key, None)
-            return None
-        return copy.deepcopy(entry.value)
+    return cache.get(key)
 
 
-async def _set_cache(cache: dict[str, _CacheEntry], key: str, value: Any, ttl: int) -> None:
-    if not key or ttl <= 0:
-        return
-    async with _cache_lock:
-        cache[key] = _CacheEntry(time.monotonic() + ttl, copy.deepcopy(value))
+async def _set_cache(cache: _TTLCache, key: str, value: Any, ttl: int) -> Any:
+    if not key:
+        return freeze_value(value)[0]
+    return cache.set(key, value, ttl)
 
 
 def _header_int(headers: Any, name: str) -> int | None:
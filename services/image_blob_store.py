@@ -0,0 +1,371 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+INDEX_FILENAME = "index.sqlite3"
+
+
+def blob_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def bucket_for(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+
+
+def bucket_end(bucket: str) -> float | None:
+    """Returns the UTC timestamp at which the day bucket ends, or None for non-bucket names."""
+    try:
+        day = date.fromisoformat(bucket)
+    except ValueError:
+        return None
+    return datetime.combine(day + timedelta(days=1), datetime.min.time(), timezone.utc).timestamp()
+
+
+class ImageBlobStore:
+    """Content-addressed image files shared by every message that posted the same bytes.
+
+    Each blob lives once under `<root>/<YYYY-MM-DD>/<aa>/<sha256><suffix>`, in the day bucket of
+    its newest reference; a SQLite index maps `(message_id, attachment_id)` references to blobs,
+    and a blob file is unlinked only when its last reference is released. Because a bucket only
+    holds blobs whose references are all from that day or earlier, expiry removes whole bucket
+    directories. With `max_bytes` set, the least recently used blobs (and the references to them)
+    are evicted whenever the total size goes over budget.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = 0):
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._total_bytes = 0
+        self._blob_count = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "blobs": self._blob_count,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+        }
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.to_thread(func, *args)
+
+    def open(self) -> None:
+        with self._lock:
+            self._open_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.close()
+            self._connection = None
+
+    def _open_locked(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        self.root.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.root / INDEX_FILENAME), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                suffix TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                bucket TEXT NOT NULL
+            )
+            """
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS blobs_last_access ON blobs (last_access)")
+        connection.execute("CREATE INDEX IF NOT EXISTS blobs_bucket ON blobs (bucket)")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blob_refs (
+                message_id TEXT NOT NULL,
+                attachment_id TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (message_id, attachment_id)
+            )
+            """
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS blob_refs_digest ON blob_refs (digest)")
+        connection.execute("CREATE INDEX IF NOT EXISTS blob_refs_created_at ON blob_refs (created_at)")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blob_sources (
+                source TEXT PRIMARY KEY,
+                digest TEXT NOT NULL
+            )
+            """
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS blob_sources_digest ON blob_sources (digest)")
+        connection.commit()
+        count, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        self._blob_count, self._total_bytes = int(count), int(total)
+        self._connection = connection
+        return connection
+
+    def blob_path(self, digest: str, suffix: str, bucket: str) -> Path:
+        return self.root / bucket / digest[:2] / f"{digest}{suffix}"
+
+    def path_for(self, digest: str) -> Path | None:
+        """Returns the blob's file path while the blob is still indexed and on disk; counts as a use."""
+        with self._lock:
+            connection = self._open_locked()
+            row = connection.execute("SELECT suffix, bucket FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), digest))
+                connection.commit()
+        if row is None:
+            return None
+        path = self.blob_path(digest, str(row[0]), str(row[1]))
+        return path if path.is_file() else None
+
+    def add(
+        self,
+        message_id: int | str,
+        attachment_id: int | str,
+        data: bytes,
+        suffix: str = "",
+        source: str | None = None,
+    ) -> str:
+        """Stores `data` once and records a reference from the message attachment; returns the digest.
+
+        `source` is the digest of the bytes `data` was derived from (e.g. before recompression), so a
+        later `add_reference` for the same original can reuse this blob without re-encoding it.
+        """
+        digest = blob_digest(data)
+        now = time.time()
+        bucket = bucket_for(now)
+        with self._lock:
+            connection = self._open_locked()
+            row = connection.execute("SELECT suffix, bucket FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                suffix = str(row[0])
+            path = self.blob_path(digest, suffix, bucket)
+            if row is not None and str(row[1]) != bucket:
+                self._move_blob(digest, suffix, str(row[1]), bucket)
+            if not path.is_file():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                temp_path.write_bytes(data)
+                os.replace(temp_path, path)
+            if row is None:
+                connection.execute(
+                    "INSERT INTO blobs (digest, suffix, size, last_access, bucket) VALUES (?, ?, ?, ?, ?)",
+                    (digest, suffix, len(data), now, bucket),
+                )
+                self._blob_count += 1
+                self._total_bytes += len(data)
+            else:
+                connection.execute(
+                    "UPDATE blobs SET last_access = ?, bucket = ? WHERE digest = ?",
+                    (now, bucket, digest),
+                )
+            if source is not None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO blob_sources (source, digest) VALUES (?, ?)",
+                    (source, digest),
+                )
+            self._insert_ref_locked(connection, message_id, attachment_id, digest, now)
+            self._evict_over_budget_locked(connection, keep=digest)
+            connection.commit()
+        return digest
+
+    def add_reference(
+        self,
+        message_id: int | str,
+        attachment_id: int | str,
+        source: str,
+    ) -> tuple[str, str, int] | None:
+        """References the blob stored for original bytes with digest `source`.
+
+        Returns `(digest, suffix, size)` of that blob, or None when nothing is stored for `source`
+        yet and the caller has to produce and `add` it.
+        """
+        now = time.time()
+        bucket = bucket_for(now)
+        with self._lock:
+            connection = self._open_locked()
+            row = connection.execute(
+                """
+                SELECT blobs.digest, blobs.suffix, blobs.size, blobs.bucket
+                FROM blob_sources JOIN blobs ON blobs.digest = blob_sources.digest
+                WHERE blob_sources.source = ?
+                """,
+                (source,),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, suffix, size, old_bucket = str(row[0]), str(row[1]), int(row[2]), str(row[3])
+            path = self.blob_path(digest, suffix, bucket)
+            if old_bucket != bucket:
+                self._move_blob(digest, suffix, old_bucket, bucket)
+            if not path.is_file():
+                connection.execute("DELETE FROM blob_sources WHERE source = ?", (source,))
+                connection.commit()
+                return None
+            connection.execute(
+                "UPDATE blobs SET last_access = ?, bucket = ? WHERE digest = ?",
+                (now, bucket, digest),
+            )
+            self._insert_ref_locked(connection, message_id, attachment_id, digest, now)
+            connection.commit()
+        return digest, suffix, size
+
+    @staticmethod
+    def _insert_ref_locked(
+        connection: sqlite3.Connection,
+        message_id: int | str,
+        attachment_id: int | str,
+        digest: str,
+        now: float,
+    ) -> None:
+        connection.execute(
+            """
+            INSERT INTO blob_refs (message_id, attachment_id, digest, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(message_id, attachment_id) DO NOTHING
+            """,
+            (str(message_id), str(attachment_id), digest, now),
+        )
+
+    def release(self, message_id: int | str) -> int:
+        """Drops a message's references; returns how many blob files were unlinked."""
+        with self._lock:
+            connection = self._open_locked()
+            digests = {
+                str(row[0])
+                for row in connection.execute("SELECT digest FROM blob_refs WHERE message_id = ?", (str(message_id),))
+            }
+            connection.execute("DELETE FROM blob_refs WHERE message_id = ?", (str(message_id),))
+            removed = self._drop_unreferenced_locked(connection, digests)
+            connection.commit()
+        return removed
+
+    def release_older_than(self, cutoff: float) -> int:
+        """Drops references created before `cutoff`, e.g. for messages whose metadata expired."""
+        with self._lock:
+            connection = self._open_locked()
+            digests = {
+                str(row[0])
+                for row in connection.execute("SELECT digest FROM blob_refs WHERE created_at <= ?", (float(cutoff),))
+            }
+            connection.execute("DELETE FROM blob_refs WHERE created_at <= ?", (float(cutoff),))
+            removed = self._drop_unreferenced_locked(connection, digests)
+            connection.commit()
+        return removed
+
+    def expire_buckets(self, cutoff: float) -> int:
+        """Removes every day bucket that ended by `cutoff` as a whole; returns how many blobs it held.
+
+        Only the top level of the cache directory is listed, so the cost follows the number of
+        days kept rather than the number of cached files.
+        """
+        if not self.root.is_dir():
+            return 0
+        removed = 0
+        with self._lock:
+            connection = self._open_locked()
+            for entry in self.root.iterdir():
+                end = bucket_end(entry.name)
+                if end is None or end > cutoff or not entry.is_dir():
+                    continue
+                count, total = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs WHERE bucket = ?",
+                    (entry.name,),
+                ).fetchone()
+                for table in ("blob_refs", "blob_sources"):
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE digest IN (SELECT digest FROM blobs WHERE bucket = ?)",
+                        (entry.name,),
+                    )
+                connection.execute("DELETE FROM blobs WHERE bucket = ?", (entry.name,))
+                connection.commit()
+                shutil.rmtree(entry, ignore_errors=True)
+                self._blob_count -= int(count)
+                self._total_bytes -= int(total)
+                removed += int(count)
+        return removed
+
+    def reference_count(self, digest: str) -> int:
+        with self._lock:
+            row = self._open_locked().execute("SELECT COUNT(*) FROM blob_refs WHERE digest = ?", (digest,)).fetchone()
+        return int(row[0])
+
+    def _drop_unreferenced_locked(self, connection: sqlite3.Connection, digests: set[str]) -> int:
+        removed = 0
+        for digest in digests:
+            if connection.execute("SELECT 1 FROM blob_refs WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                continue
+            row = connection.execute("SELECT suffix, bucket, size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row is not None and self._unlink_blob_locked(connection, digest, str(row[0]), str(row[1]), int(row[2])):
+                removed += 1
+        return removed
+
+    def _move_blob(self, digest: str, suffix: str, old_bucket: str, new_bucket: str) -> None:
+        source = self.blob_path(digest, suffix, old_bucket)
+        target = self.blob_path(digest, suffix, new_bucket)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, target)
+        except FileNotFoundError:
+            pass
+
+    def _unlink_blob_locked(
+        self,
+        connection: sqlite3.Connection,
+        digest: str,
+        suffix: str,
+        bucket: str,
+        size: int,
+    ) -> bool:
+        try:
+            self.blob_path(digest, suffix, bucket).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return False
+        connection.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        connection.execute("DELETE FROM blob_sources WHERE digest = ?", (digest,))
+        self._blob_count -= 1
+        self._total_bytes -= size
+        return True
+
+    def _evict_over_budget_locked(self, connection: sqlite3.Connection, keep: str | None = None) -> None:
+        while self.max_bytes and self._total_bytes > self.max_bytes:
+            rows = connection.execute(
+                "SELECT digest, suffix, bucket, size FROM blobs WHERE digest != ? ORDER BY last_access LIMIT 50",
+                (keep or "",),
+            ).fetchall()
+            evicted = 0
+            for digest, suffix, bucket, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    return
+                if not self._unlink_blob_locked(connection, digest, suffix, bucket, int(size)):
+                    continue
+                connection.execute("DELETE FROM blob_refs WHERE digest = ?", (digest,))
+                self.evictions += 1
+                self.evicted_bytes += int(size)
+                evicted += 1
+            if not evicted:
+                return
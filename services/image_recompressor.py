@@ -0,0 +1,77 @@
+import io
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from services.gif_converter import MAX_PIXELS, RESAMPLE
+
+
+DEFAULT_QUALITY = 80
+MIN_DIMENSION = 64
+CONTENT_TYPES = {".webp": "image/webp", ".jpg": "image/jpeg"}
+
+
+@dataclass(frozen=True)
+class RecompressedImage:
+    data: bytes
+    width: int
+    height: int
+    content_type: str
+    suffix: str
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in {"RGBA", "LA", "PA"} or (image.mode == "P" and "transparency" in image.info)
+
+
+def _encode(image: Image.Image, *, quality: int) -> tuple[bytes, str] | None:
+    buffer = io.BytesIO()
+    if features.check("webp"):
+        image.convert("RGBA" if _has_alpha(image) else "RGB").save(buffer, format="WEBP", quality=quality, method=4)
+        return buffer.getvalue(), ".webp"
+    if _has_alpha(image):
+        return None
+    image.convert("RGB").save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue(), ".jpg"
+
+
+def recompress_image_bytes(
+    image_bytes: bytes,
+    *,
+    max_dimension: int,
+    quality: int = DEFAULT_QUALITY,
+) -> RecompressedImage | None:
+    """Returns a smaller WebP (or JPEG without WebP support) copy that fits in `max_dimension`.
+
+    Returns None when the original should be kept instead: unreadable, animated or oversized
+    images (including ones Pillow rejects as decompression bombs), and images that would not get
+    any smaller.
+    """
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        return None
+
+    width, height = image.size
+    if width <= 0 or height <= 0 or width * height > MAX_PIXELS:
+        return None
+    if getattr(image, "is_animated", False):
+        return None
+
+    try:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max(MIN_DIMENSION, int(max_dimension)),) * 2, RESAMPLE)
+        encoded = _encode(image, quality=max(1, min(int(quality), 100)))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+    if encoded is None or len(encoded[0]) >= len(image_bytes):
+        return None
+    data, suffix = encoded
+    return RecompressedImage(
+        data=data,
+        width=image.width,
+        height=image.height,
+        content_type=CONTENT_TYPES[suffix],
+        suffix=suffix,
+    )
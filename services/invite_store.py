@@ -56,12 +56,65 @@ def normalize_config(config: dict[str, Any] | None) -> dict[str, Any]:
     return normalized
 
 
+def collection_payloads(config: dict[str, Any]) -> dict[str, dict[str, dict[str, Any]]]:
+    return {
+        "invite_cache": {
+            str(code): {
+                "uses": int(data.get("uses", 0)),
+                "inviter_id": data.get("inviter_id"),
+                "channel_id": data.get("channel_id"),
+            }
+            for code, data in config.get("invite_cache", {}).items()
+            if isinstance(data, dict)
+        },
+        "member_invites": {
+            str(user_id): {"total": int(total or 0)}
+            for user_id, total in config.get("member_invites", {}).items()
+        },
+        "member_joins": {
+            str(member_id): {"inviter_id": inviter_id}
+            for member_id, inviter_id in config.get("member_joins", {}).items()
+        },
+    }
+
+
+def diff_documents(
+    previous: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    writes = {
+        document_id: data
+        for document_id, data in current.items()
+        if previous.get(document_id) != data
+    }
+    deletes = [document_id for document_id in previous if document_id not in current]
+    return writes, deletes
+
+
 class InviteTrackerStore:
+    """Invite tracker configs, with subcollections written as diffs against the last saved state.
+
+    `_persisted` and the full-rewrite requests are only touched on the event loop: a flush takes
+    its full-rewrite flags and previous payloads up front, and records the new payloads once the
+    write has succeeded, so a rewrite requested while a flush is in flight is kept for the next one.
+    """
+
+    def __init__(self):
+        self._persisted: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self._full_rewrite_pending: dict[str, int] = {}
+
+    def request_full_rewrite(self, guild_id: int | str) -> None:
+        guild_id = str(guild_id)
+        self._full_rewrite_pending[guild_id] = self._full_rewrite_pending.get(guild_id, 0) + 1
+
     def _tracker_ref(self, guild_id: int | str):
         return get_firestore_client().collection("invite_trackers").document(str(guild_id))
 
     async def load_all(self) -> dict[str, Any]:
-        return await run_firestore(self._load_all_sync)
+        data = await run_firestore(self._load_all_sync)
+        for guild_id, config in data["guilds"].items():
+            self._persisted[guild_id] = collection_payloads(config)
+        return data
 
     def _load_all_sync(self) -> dict[str, Any]:
         data = {"version": 1, "guilds": {}}
@@ -83,11 +136,50 @@ class InviteTrackerStore:
             data["guilds"][guild_id] = normalize_config(config)
         return data
 
-    async def save_guild(self, guild_id: int | str, config: dict[str, Any]) -> None:
+    async def save_guild(self, guild_id: int | str, config: dict[str, Any], *, full_rewrite: bool = False) -> None:
+        await self.save_guilds({str(guild_id): config}, full_rewrite=full_rewrite)
+
+    async def save_guilds(self, configs: dict[str, dict[str, Any]], *, full_rewrite: bool = False) -> None:
+        jobs = {
+            str(guild_id): self._prepare_save(str(guild_id), config, full_rewrite)
+            for guild_id, config in configs.items()
+        }
+        written: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        try:
+            await run_firestore(self._save_guilds_sync, jobs, written)
+        finally:
+            for guild_id, payloads in written.items():
+                self._persisted[guild_id] = payloads
+                taken = jobs[guild_id][3]
+                if taken and self._full_rewrite_pending.get(guild_id) == taken:
+                    del self._full_rewrite_pending[guild_id]
+
+    def _prepare_save(
+        self,
+        guild_id: str,
+        config: dict[str, Any],
+        full_rewrite: bool,
+    ) -> tuple[dict[str, Any], bool, dict[str, dict[str, dict[str, Any]]] | None, int]:
+        taken = self._full_rewrite_pending.get(guild_id, 0)
         snapshot = normalize_config(deepcopy(config))
-        await run_firestore(self._save_guild_sync, str(guild_id), snapshot)
+        return snapshot, full_rewrite or bool(taken), self._persisted.get(guild_id), taken
 
-    def _save_guild_sync(self, guild_id: str, config: dict[str, Any]) -> None:
+    def _save_guilds_sync(
+        self,
+        jobs: dict[str, tuple[dict[str, Any], bool, dict[str, dict[str, dict[str, Any]]] | None, int]],
+        written: dict[str, dict[str, dict[str, dict[str, Any]]]],
+    ) -> None:
+        for guild_id, (config, full_rewrite, previous, _taken) in jobs.items():
+            written[guild_id] = self._save_guild_sync(guild_id, config, full_rewrite, previous)
+
+    def _save_guild_sync(
+        self,
+        guild_id: str,
+        config: dict[str, Any],
+        full_rewrite: bool = False,
+        previous: dict[str, dict[str, dict[str, Any]]] | None = None,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Writes one guild and returns the subcollection payloads now stored in Firestore."""
         db = get_firestore_client()
         firestore = get_firestore_module()
         tracker_ref = self._tracker_ref(guild_id)
@@ -100,35 +192,14 @@ class InviteTrackerStore:
             },
             merge=True,
         )
-        self._replace_collection(
-            db,
-            tracker_ref.collection("invite_cache"),
-            {
-                code: {
-                    "uses": int(data.get("uses", 0)),
-                    "inviter_id": data.get("inviter_id"),
-                    "channel_id": data.get("channel_id"),
-                }
-                for code, data in config.get("invite_cache", {}).items()
-                if isinstance(data, dict)
-            },
-        )
-        self._replace_collection(
-            db,
-            tracker_ref.collection("member_invites"),
-            {
-                user_id: {"total": int(total or 0)}
-                for user_id, total in config.get("member_invites", {}).items()
-            },
-        )
-        self._replace_collection(
-            db,
-            tracker_ref.collection("member_joins"),
-            {
-                member_id: {"inviter_id": inviter_id}
-                for member_id, inviter_id in config.get("member_joins", {}).items()
-            },
-        )
+        payloads = collection_payloads(config)
+        for name, payload in payloads.items():
+            collection_ref = tracker_ref.collection(name)
+            if full_rewrite or previous is None:
+                self._replace_collection(db, collection_ref, payload)
+            else:
+                self._apply_collection_diff(db, collection_ref, previous.get(name, {}), payload)
+        return payloads
 
     @staticmethod
     def _replace_collection(db, collection_ref, payload: dict[str, dict[str, Any]]) -> None:
@@ -153,3 +224,36 @@ class InviteTrackerStore:
             commit_if_needed()
 
         commit_if_needed(force=True)
+
+    @staticmethod
+    def _apply_collection_diff(
+        db,
+        collection_ref,
+        previous: dict[str, dict[str, Any]],
+        payload: dict[str, dict[str, Any]],
+    ) -> None:
+        writes, deletes = diff_documents(previous, payload)
+        if not writes and not deletes:
+            return
+
+        batch = db.batch()
+        pending = 0
+
+        def commit_if_needed(force: bool = False) -> None:
+            nonlocal batch, pending
+            if pending and (force or pending >= 450):
+                batch.commit()
+                batch = db.batch()
+                pending = 0
+
+        for document_id in deletes:
+            batch.delete(collection_ref.document(document_id))
+            pending += 1
+            commit_if_needed()
+
+        for document_id, data in writes.items():
+            batch.set(collection_ref.document(document_id), data)
+            pending += 1
+            commit_if_needed()
+
+        commit_if_needed(force=True)
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_DATABASE_PATH = "hypixel_profile_cache.sqlite3"
+
+
+def profile_cache_database_path() -> Path:
+    raw_path = (os.getenv("HYPIXEL_PROFILE_CACHE_DB") or DEFAULT_DATABASE_PATH).strip().strip('"')
+    return Path(os.path.expandvars(os.path.expanduser(raw_path)))
+
+
+class MinecraftProfileDiskCache:
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else profile_cache_database_path()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.to_thread(func, *args)
+
+    def open(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                return
+            if self.path.parent != Path("."):
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS minecraft_profiles (
+                    username_key TEXT PRIMARY KEY,
+                    uuid TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS minecraft_profiles_expires_at ON minecraft_profiles (expires_at)"
+            )
+            connection.commit()
+            self._connection = connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.close()
+            self._connection = None
+
+    def load_fresh(self, limit: int, now: float | None = None) -> list[tuple[str, str, str, float]]:
+        current = time.time() if now is None else now
+        with self._lock:
+            connection = self._require_connection()
+            connection.execute("DELETE FROM minecraft_profiles WHERE expires_at <= ?", (current,))
+            connection.commit()
+            query = (
+                "SELECT username_key, uuid, name, expires_at FROM minecraft_profiles "
+                "WHERE expires_at > ? ORDER BY expires_at DESC"
+            )
+            if limit:
+                rows = connection.execute(f"{query} LIMIT ?", (current, int(limit))).fetchall()
+            else:
+                rows = connection.execute(query, (current,)).fetchall()
+        return [(str(key), str(uuid), str(name), float(expires_at)) for key, uuid, name, expires_at in rows]
+
+    def get(self, username_key: str, now: float | None = None) -> tuple[str, str, float] | None:
+        current = time.time() if now is None else now
+        with self._lock:
+            row = self._require_connection().execute(
+                "SELECT uuid, name, expires_at FROM minecraft_profiles WHERE username_key = ? AND expires_at > ?",
+                (username_key, current),
+            ).fetchone()
+        if row is None:
+            return None
+        return str(row[0]), str(row[1]), float(row[2])
+
+    def save_many(self, rows: list[tuple[str, str, str, float]]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            connection = self._require_connection()
+            connection.executemany(
+                """
+                INSERT INTO minecraft_profiles (username_key, uuid, name, expires_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(username_key) DO UPDATE SET
+                    uuid = excluded.uuid,
+                    name = excluded.name,
+                    expires_at = excluded.expires_at
+                """,
+                rows,
+            )
+            connection.commit()
+
+    def _require_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise RuntimeError("Minecraft profile disk cache is not open.")
+        return self._connection
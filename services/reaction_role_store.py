@@ -16,6 +16,12 @@ def normalize_panel(record: dict[str, Any] | None) -> dict[str, Any]:
         value = normalized.get(key)
         normalized[key] = int(value) if value is not None else None
 
+    backfill = normalized.get("backfill")
+    normalized["backfill"] = {
+        str(option_key): int(user_id)
+        for option_key, user_id in (backfill.items() if isinstance(backfill, dict) else ())
+        if user_id is not None
+    }
     normalized["status"] = str(normalized.get("status") or "active")
     normalized["panel_type"] = str(normalized.get("panel_type") or "notification_roles")
     return normalized
@@ -65,9 +71,24 @@ class ReactionRolePanelStore:
         firestore = get_firestore_module()
         self._panel_ref(guild_id).set(
             {
-                **record,
+                # Backfill checkpoints are written field by field in save_backfill_checkpoint.
+                **{key: value for key, value in record.items() if key != "backfill"},
                 "version": 1,
                 "updated_at": firestore.SERVER_TIMESTAMP,
             },
             merge=True,
         )
+
+    async def save_backfill_checkpoint(self, guild_id: int | str, option_key: str, last_user_id: int | None) -> None:
+        """Records the last reaction user handled for one option; None clears it once the option is done."""
+        await run_firestore(self._save_backfill_checkpoint_sync, str(guild_id), option_key, last_user_id)
+
+    def _save_backfill_checkpoint_sync(self, guild_id: str, option_key: str, last_user_id: int | None) -> None:
+        firestore = get_firestore_module()
+        self._panel_ref(guild_id).set(
+            {
+                "backfill": {option_key: firestore.DELETE_FIELD if last_user_id is None else int(last_user_id)},
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            },
+            merge=True,
+        )
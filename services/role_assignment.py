@@ -0,0 +1,159 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Sequence
+
+import discord
+
+
+DEFAULT_ASSIGN_CONCURRENCY = 4
+MEMBER_QUERY_CHUNK_SIZE = 100
+PROGRESS_EVERY = 100
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+@dataclass
+class AssignmentProgress:
+    total: int = 0
+    processed: int = 0
+    added: int = 0
+    failed: int = 0
+    # Every member with an id at or below this one has been handled; safe to resume after.
+    last_member_id: int | None = None
+
+
+ProgressCallback = Callable[[AssignmentProgress], Awaitable[None]]
+
+
+def retry_after_seconds(exc: discord.HTTPException) -> float | None:
+    """Seconds to back off for a 429 response, or None when the error is not a rate limit."""
+    if exc.status != 429:
+        return None
+    headers = getattr(exc.response, "headers", None) or {}
+    for header in ("Retry-After", "X-RateLimit-Reset-After"):
+        try:
+            return max(0.0, float(headers.get(header)))
+        except (TypeError, ValueError):
+            continue
+    return 1.0
+
+
+async def resolve_members(
+    guild: discord.Guild,
+    user_ids: Sequence[int],
+    *,
+    log_prefix: str = "[MEMBERS]",
+) -> dict[int, discord.Member]:
+    """Resolves members from the guild cache, chunking the guild once when many ids are missing.
+
+    A chunked guild's cache holds every member, so ids missing from it are not members. Only a
+    small miss set (or a failed chunk request) falls back to gateway queries of up to 100 ids.
+    """
+    members, missing = _cached_members(guild, user_ids)
+    if missing and not guild.chunked and len(missing) > MEMBER_QUERY_CHUNK_SIZE:
+        try:
+            await guild.chunk(cache=True)
+        except (asyncio.TimeoutError, discord.ClientException, discord.HTTPException) as exc:
+            print(f"{log_prefix} Member chunking failed: {exc}")
+        else:
+            found, missing = _cached_members(guild, missing)
+            members.update(found)
+    if not missing or guild.chunked:
+        return members
+
+    for start in range(0, len(missing), MEMBER_QUERY_CHUNK_SIZE):
+        chunk = missing[start : start + MEMBER_QUERY_CHUNK_SIZE]
+        try:
+            found = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=True)
+        except (asyncio.TimeoutError, discord.ClientException) as exc:
+            print(f"{log_prefix} Member query failed for {len(chunk)} user(s): {exc}")
+            continue
+        members.update((member.id, member) for member in found)
+    return members
+
+
+def _cached_members(guild: discord.Guild, user_ids: Sequence[int]) -> tuple[dict[int, discord.Member], list[int]]:
+    members: dict[int, discord.Member] = {}
+    missing: list[int] = []
+    for user_id in user_ids:
+        member = guild.get_member(user_id)
+        if member is None:
+            missing.append(user_id)
+        else:
+            members[user_id] = member
+    return members, missing
+
+
+async def assign_role_to_members(
+    members: Sequence[discord.Member],
+    role: discord.Role,
+    *,
+    reason: str,
+    concurrency: int = DEFAULT_ASSIGN_CONCURRENCY,
+    on_progress: ProgressCallback | None = None,
+    progress_every: int = PROGRESS_EVERY,
+) -> AssignmentProgress:
+    """Adds `role` to every member through a bounded pool of workers.
+
+    discord.py already holds each request until the route's rate-limit bucket (from the
+    X-RateLimit-* headers) has room, so the pool only bounds how many requests wait there. A 429
+    that still gets through pauses every worker for the response's Retry-After.
+    `on_progress` runs every `progress_every` members and once at the end.
+    """
+    ordered = sorted(members, key=lambda member: member.id)
+    progress = AssignmentProgress(total=len(ordered))
+    if not ordered:
+        return progress
+
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(len(ordered)):
+        queue.put_nowait(index)
+    handled = [False] * len(ordered)
+    watermark = 0
+    resume_at = 0.0
+    report_lock = asyncio.Lock()
+
+    async def add_role(member: discord.Member) -> bool:
+        nonlocal resume_at
+        for _attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            delay = resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await member.add_roles(role, reason=reason)
+                return True
+            except discord.HTTPException as exc:
+                retry_after = retry_after_seconds(exc)
+                if retry_after is None:
+                    return False
+                resume_at = max(resume_at, time.monotonic() + retry_after)
+        return False
+
+    async def report() -> None:
+        if on_progress is not None:
+            async with report_lock:
+                await on_progress(progress)
+
+    async def worker() -> None:
+        nonlocal watermark
+        while True:
+            try:
+                index = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if await add_role(ordered[index]):
+                progress.added += 1
+            else:
+                progress.failed += 1
+            progress.processed += 1
+            handled[index] = True
+            while watermark < len(ordered) and handled[watermark]:
+                watermark += 1
+            if watermark:
+                progress.last_member_id = ordered[watermark - 1].id
+            if progress.processed % max(1, progress_every) == 0 and progress.processed < progress.total:
+                await report()
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(ordered))))))
+    await report()
+    return progress
@@ -1,7 +1,12 @@
 from copy import deepcopy
 from typing import Any
 
-from services.firebase_client import get_firestore_client, get_firestore_module, run_firestore
+from services.firebase_client import (
+    get_firestore_client,
+    get_firestore_module,
+    run_firestore,
+    set_documents_in_batches,
+)
 
 
 REQUEST_COLLECTION = "subscriber_verifications"
@@ -83,16 +88,32 @@ class SubscriberVerificationStore:
         await run_firestore(self._save_request_sync, str(request_id), snapshot)
 
     def _save_request_sync(self, request_id: str, record: dict[str, Any]) -> None:
-        firestore = get_firestore_module()
-        self._request_ref(request_id).set(
-            {
-                **record,
-                "version": 1,
-                "updated_at": firestore.SERVER_TIMESTAMP,
-            },
+        self._request_ref(request_id).set(self._document_payload(record), merge=True)
+
+    async def save_requests(self, records: dict[str, dict[str, Any]]) -> None:
+        snapshots = {}
+        for record in records.values():
+            snapshot = normalize_request(record)
+            if snapshot.get("id"):
+                snapshots[str(snapshot["id"])] = snapshot
+        if snapshots:
+            await run_firestore(self._save_requests_sync, snapshots)
+
+    def _save_requests_sync(self, records: dict[str, dict[str, Any]]) -> None:
+        set_documents_in_batches(
+            ((self._request_ref(request_id), self._document_payload(record)) for request_id, record in records.items()),
             merge=True,
         )
 
+    @staticmethod
+    def _document_payload(record: dict[str, Any]) -> dict[str, Any]:
+        firestore = get_firestore_module()
+        return {
+            **record,
+            "version": 1,
+            "updated_at": firestore.SERVER_TIMESTAMP,
+        }
+
     async def delete_request(self, request_id: int | str) -> None:
         await run_firestore(self._delete_request_sync, str(request_id))
 
@@ -0,0 +1,113 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable
+
+
+DEFAULT_FLUSH_DELAY_MS = 500
+RETRY_DELAY_SECONDS = 5.0
+
+
+def flush_delay_seconds() -> float:
+    raw_value = os.getenv("WRITE_BEHIND_FLUSH_DELAY_MS")
+    if raw_value:
+        try:
+            return max(0, int(raw_value.strip().strip('"'))) / 1000
+        except ValueError:
+            pass
+    return DEFAULT_FLUSH_DELAY_MS / 1000
+
+
+class WriteBehindQueue:
+    """Coalesces saves for dirty keys and flushes them together after a short window.
+
+    `load` returns the live record for a key (or None when it no longer exists) and is
+    called right before a flush, so repeated saves of one key cost a single write.
+    `flush` receives every loaded record and must copy what it needs before its first await.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[str], Any | None],
+        flush: Callable[[dict[str, Any]], Awaitable[None]],
+        *,
+        delay: float | None = None,
+    ):
+        self.name = name
+        self.delay = flush_delay_seconds() if delay is None else max(0.0, float(delay))
+        self._load = load
+        self._flush = flush
+        self._dirty: set[str] = set()
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self.marked = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.written = 0
+        self.failures = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._dirty)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending": self.pending_count,
+            "marked": self.marked,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "written": self.written,
+            "failures": self.failures,
+        }
+
+    def mark_dirty(self, key: int | str) -> None:
+        key = str(key)
+        self.marked += 1
+        if key in self._dirty:
+            self.coalesced += 1
+        self._dirty.add(key)
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def discard(self, key: int | str) -> None:
+        self._dirty.discard(str(key))
+        async with self._flush_lock:
+            pass
+
+    async def flush(self) -> bool:
+        async with self._flush_lock:
+            if not self._dirty:
+                return True
+            keys = sorted(self._dirty)
+            self._dirty.clear()
+            records = {}
+            for key in keys:
+                record = self._load(key)
+                if record is not None:
+                    records[key] = record
+            if not records:
+                return True
+            try:
+                await self._flush(records)
+            except Exception as exc:
+                self._dirty.update(records)
+                self.failures += 1
+                print(f"[WRITE-BEHIND] {self.name} flush failed for {len(records)} record(s): {exc}")
+                return False
+            self.flushes += 1
+            self.written += len(records)
+            return True
+
+    async def close(self) -> None:
+        async with self._flush_lock:
+            timer = self._timer
+            self._timer = None
+            if timer and not timer.done() and timer is not asyncio.current_task():
+                timer.cancel()
+        await self.flush()
+
+    async def _run_timer(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(self.delay)
+            if not await self.flush():
+                await asyncio.sleep(max(self.delay, RETRY_DELAY_SECONDS))
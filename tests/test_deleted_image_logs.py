@@ -1,10 +1,68 @@
+import asyncio
+import io
 import os
 import tempfile
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from PIL import Image
 
 import commands.deleted_image_logs as deleted_image_logs
+from services.image_blob_store import ImageBlobStore
+from services.image_recompressor import recompress_image_bytes
+
+
+class ReadTracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+
+class FakeAttachment:
+    def __init__(self, attachment_id, data, filename="meme.png", delay=0.0, error=None, tracker=None):
+        self.id = attachment_id
+        self.filename = filename
+        self.content_type = "image/png"
+        self.size = len(data)
+        self.url = f"https://cdn.example/{attachment_id}"
+        self.proxy_url = self.url
+        self.data = data
+        self.delay = delay
+        self.error = error
+        self.tracker = tracker or ReadTracker()
+
+    async def read(self, *, use_cached=False):
+        self.tracker.active += 1
+        self.tracker.peak = max(self.tracker.peak, self.tracker.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker.active -= 1
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+def png_bytes(size):
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (size, size), os.urandom(size * size * 3)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def image_message(message_id, *attachments):
+    return SimpleNamespace(
+        id=message_id,
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=2),
+        author=SimpleNamespace(id=3),
+        content="",
+        attachments=list(attachments),
+    )
 
 
 class DeletedImageCacheCleanupTests(unittest.TestCase):
@@ -35,5 +93,210 @@ class DeletedImageCacheCleanupTests(unittest.TestCase):
         deleted_image_logs.CACHE_DIR = original_cache_dir
 
 
+class ImageBlobStoreTests(unittest.TestCase):
+    def test_duplicate_images_share_one_refcounted_blob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ImageBlobStore(tmp)
+            first = store.add(100, 1, b"same bytes", ".png")
+            second = store.add(200, 2, b"same bytes", ".png")
+            path = store.path_for(first)
+
+            self.assertEqual(first, second)
+            self.assertEqual(store.reference_count(first), 2)
+            self.assertEqual(len([item for item in Path(tmp).rglob("*.png")]), 1)
+
+            self.assertEqual(store.release(100), 0)
+            self.assertTrue(path.is_file())
+            self.assertEqual(store.release(200), 1)
+            self.assertFalse(path.exists())
+            self.assertIsNone(store.path_for(first))
+            store.close()
+
+    def test_byte_budget_evicts_least_recently_used_blob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ImageBlobStore(tmp, max_bytes=25)
+            oldest = store.add(1, 1, b"a" * 10, ".png")
+            recent = store.add(2, 2, b"b" * 10, ".png")
+            store.path_for(oldest)
+            newest = store.add(3, 3, b"c" * 10, ".png")
+
+            self.assertIsNone(store.path_for(recent))
+            self.assertIsNotNone(store.path_for(oldest))
+            self.assertIsNotNone(store.path_for(newest))
+            self.assertEqual(store.reference_count(recent), 0)
+            self.assertEqual(store.stats(), {"blobs": 2, "bytes": 20, "max_bytes": 25, "evictions": 1, "evicted_bytes": 10})
+            store.close()
+
+    def test_expiry_removes_whole_day_buckets(self):
+        day = 24 * 60 * 60
+        with tempfile.TemporaryDirectory() as tmp, patch("services.image_blob_store.time.time") as clock:
+            store = ImageBlobStore(tmp)
+            clock.return_value = 10 * day + 60
+            stale = store.add(1, 1, b"stale", ".png")
+            shared = store.add(1, 2, b"shared", ".png")
+            clock.return_value = 12 * day + 60
+            store.add(2, 3, b"shared", ".png")
+
+            self.assertEqual(store.path_for(shared).parent.parent.name, "1970-01-13")
+            self.assertEqual(store.expire_buckets(11 * day), 1)
+            self.assertFalse((Path(tmp) / "1970-01-11").exists())
+            self.assertIsNone(store.path_for(stale))
+            self.assertEqual(store.reference_count(shared), 2)
+            self.assertEqual(store.stats()["blobs"], 1)
+            self.assertEqual(store.expire_buckets(12 * day), 0)
+            self.assertTrue(store.path_for(shared).is_file())
+            store.close()
+
+
+class DeletedImageBlobCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.original_cache_dir = deleted_image_logs.CACHE_DIR
+        deleted_image_logs.CACHE_DIR = Path(self.tmp.name)
+        self.cog = deleted_image_logs.DeletedImageLogs(bot=None)
+        self.cog.store = SimpleNamespace(save_message=AsyncMock(), delete_message=AsyncMock())
+
+    async def asyncTearDown(self):
+        self.cog.cog_unload()
+        deleted_image_logs.CACHE_DIR = self.original_cache_dir
+        self.tmp.cleanup()
+
+    async def test_reposted_image_is_stored_once_and_kept_until_last_release(self):
+        first = image_message(100, FakeAttachment(1, b"meme"))
+        second = image_message(200, FakeAttachment(2, b"meme"), FakeAttachment(3, b"other"))
+
+        await self.cog._cache_message_images(first)
+        await self.cog._cache_message_images(second)
+
+        digest = self.cog._memory_cache[100]["images"][0]["blob"]
+        self.assertEqual(self.cog._memory_cache[200]["images"][0]["blob"], digest)
+        blob_files = [path for path in Path(self.tmp.name).rglob("*.png")]
+        self.assertEqual(len(blob_files), 2)
+
+        await self.cog._delete_cached_files(self.cog._memory_cache[100])
+        self.assertEqual(self.cog._image_paths(self.cog._memory_cache[200]["images"])[0], self.cog.blobs.path_for(digest))
+        self.assertIsNotNone(self.cog.blobs.path_for(digest))
+
+        await self.cog._delete_cached_files(self.cog._memory_cache[200])
+        self.assertEqual([path for path in Path(self.tmp.name).rglob("*.png")], [])
+
+    async def test_memory_cache_keeps_only_the_newest_payloads(self):
+        self.cog.memory_cache_max_entries = 2
+        for message_id in (1, 2, 3):
+            await self.cog._cache_message_images(image_message(message_id, FakeAttachment(message_id, b"x")))
+
+        self.assertEqual(list(self.cog._memory_cache), [2, 3])
+        self.assertEqual(self.cog.cache_stats()["memory_evictions"], 1)
+
+    async def test_message_attachments_download_concurrently(self):
+        tracker = ReadTracker()
+        attachments = [FakeAttachment(index, bytes([index]), delay=0.01, tracker=tracker) for index in range(10)]
+
+        images = await self.cog._cache_message_images(image_message(1, *attachments))
+
+        self.assertGreater(tracker.peak, 1)
+        self.assertEqual([image["attachment_id"] for image in images], [str(index) for index in range(10)])
+        self.assertTrue(all(image["cached"] for image in images))
+        self.cog.store.save_message.assert_awaited_once()
+
+    async def test_attachment_downloads_share_a_global_limit(self):
+        self.cog._download_slots = asyncio.Semaphore(2)
+        tracker = ReadTracker()
+        messages = [
+            image_message(
+                message_id,
+                *(FakeAttachment(message_id * 10 + index, b"x", delay=0.01, tracker=tracker) for index in range(5)),
+            )
+            for message_id in (1, 2, 3)
+        ]
+
+        await asyncio.gather(*(self.cog._cache_message_images(message) for message in messages))
+
+        self.assertEqual(tracker.peak, 2)
+
+    async def test_unexpected_attachment_failure_keeps_sibling_images(self):
+        broken = FakeAttachment(2, b"", error=RuntimeError("payload ended early"))
+        images = await self.cog._cache_message_images(image_message(1, FakeAttachment(1, b"ok"), broken))
+
+        self.assertEqual([image["cached"] for image in images], [True, False])
+        self.assertEqual(images[1]["error"], "Could not cache image.")
+        self.assertEqual(self.cog.store.save_message.await_args.args[1]["images"], images)
+
+    async def test_full_download_queue_drops_oldest_message(self):
+        self.cog.download_queue_size = 2
+        for message_id in (1, 2, 3):
+            self.cog._enqueue_download(image_message(message_id, FakeAttachment(message_id, bytes([message_id]))))
+
+        self.assertEqual(list(self.cog._download_queue), [2, 3])
+        self.assertEqual(self.cog.cache_stats()["download_drops"], 1)
+
+        for _ in range(50):
+            if not self.cog._download_queue and not self.cog._downloading:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(sorted(self.cog._memory_cache), [2, 3])
+        self.assertEqual(self.cog.store.save_message.await_count, 2)
+
+    async def test_large_images_are_recompressed_and_small_ones_kept(self):
+        self.cog.recompress_max_dimension = 128
+        self.cog.recompress_min_bytes = 4096
+        large, small = png_bytes(512), png_bytes(8)
+
+        images = await self.cog._cache_message_images(
+            image_message(1, FakeAttachment(1, large, "photo.png"), FakeAttachment(2, small, "icon.png"))
+        )
+
+        paths = self.cog._image_paths(images)
+        self.assertEqual(images[0]["stored_filename"], "photo.webp")
+        with Image.open(paths[0]) as stored:
+            self.assertEqual((stored.format, max(stored.size)), ("WEBP", 128))
+        self.assertLess(images[0]["stored_size"], len(large) // 10)
+        self.assertNotIn("stored_filename", images[1])
+        self.assertEqual(paths[1].read_bytes(), small)
+        self.assertGreater(self.cog.cache_stats()["recompressed_bytes_saved"], 0)
+
+    async def test_reposted_large_image_is_recompressed_once(self):
+        self.cog.recompress_max_dimension = 128
+        self.cog.recompress_min_bytes = 4096
+        large = png_bytes(256)
+
+        with patch.object(deleted_image_logs, "recompress_image_bytes", wraps=recompress_image_bytes) as encode:
+            first = await self.cog._cache_message_images(image_message(1, FakeAttachment(1, large, "photo.png")))
+            second = await self.cog._cache_message_images(image_message(2, FakeAttachment(2, large, "photo.png")))
+
+        self.assertEqual(encode.call_count, 1)
+        self.assertEqual(first[0]["blob"], second[0]["blob"])
+        self.assertEqual(second[0]["stored_filename"], "photo.webp")
+        self.assertEqual(self.cog.blobs.reference_count(first[0]["blob"]), 2)
+
+    async def test_recompression_runs_one_image_at_a_time(self):
+        self.cog.recompress_max_dimension = 128
+        self.cog.recompress_min_bytes = 0
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_encode(data, *, max_dimension):
+            with lock:
+                active.append(data)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(data)
+            return None
+
+        attachments = [FakeAttachment(index, bytes([index]) * 10) for index in range(4)]
+        with patch.object(deleted_image_logs, "recompress_image_bytes", slow_encode):
+            images = await self.cog._cache_message_images(image_message(1, *attachments))
+
+        self.assertEqual(max(peak), 1)
+        self.assertEqual(len(peak), 4)
+        self.assertTrue(all(image["cached"] and "stored_filename" not in image for image in images))
+
+    def test_decompression_bomb_keeps_the_original(self):
+        with patch.object(Image, "MAX_IMAGE_PIXELS", 100):
+            self.assertIsNone(recompress_image_bytes(png_bytes(64), max_dimension=32))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+import os
+import random
+import time
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+
+from commands.giveaway import Giveaway, weighted_sample
+from services.role_assignment import MEMBER_QUERY_CHUNK_SIZE
+
+
+def pool_draw(weighted_ids, count, rng):
+    """The previous ticket-pool draw, kept as the benchmark baseline."""
+    pool = []
+    for user_id, weight in weighted_ids:
+        pool.extend([user_id] * weight)
+    winners = []
+    while pool and len(winners) < count:
+        picked = rng.choice(pool)
+        winners.append(picked)
+        pool = [user_id for user_id in pool if user_id != picked]
+    return winners
+
+
+class FakeGuild:
+    def __init__(self, cached, uncached, bonus_role_id):
+        self.members = {user_id: self._member(user_id, bonus_role_id) for user_id in cached}
+        self.remote = {user_id: self._member(user_id, bonus_role_id) for user_id in uncached}
+        self.queries = []
+        self.chunked = False
+        self.chunks = 0
+
+    @staticmethod
+    def _member(user_id, bonus_role_id):
+        roles = [SimpleNamespace(id=bonus_role_id)] if user_id % 10 == 0 else []
+        return SimpleNamespace(id=user_id, roles=roles)
+
+    def get_member(self, user_id):
+        return self.members.get(user_id)
+
+    async def chunk(self, *, cache):
+        self.chunks += 1
+        self.members.update(self.remote)
+        self.chunked = True
+
+    async def query_members(self, *, user_ids, limit, cache):
+        self.queries.append(len(user_ids))
+        return [self.remote[user_id] for user_id in user_ids if user_id in self.remote]
+
+    async def fetch_member(self, user_id):
+        raise AssertionError("Entrants must be resolved through the member cache or member queries.")
+
+
+class WeightedSampleTests(unittest.TestCase):
+    def test_draws_distinct_ids_and_skips_zero_weights(self):
+        winners = weighted_sample([(1, 1), (2, 3), (3, 0), (4, 2)], 10, random.Random(7))
+
+        self.assertEqual(sorted(winners), [1, 2, 4])
+
+    def test_pick_probability_follows_weight(self):
+        rng = random.Random(42)
+        counts = Counter(weighted_sample([(1, 9), (2, 1)], 1, rng)[0] for _ in range(5000))
+
+        self.assertAlmostEqual(counts[1] / 5000, 0.9, delta=0.03)
+
+    def test_draws_20_distinct_winners_from_50k_entrants(self):
+        weighted_ids = [(user_id, 2 if user_id % 10 == 0 else 1) for user_id in range(50_000)]
+
+        winners = weighted_sample(weighted_ids, 20, random.Random(1))
+
+        self.assertEqual(len(set(winners)), 20)
+        self.assertTrue(all(0 <= user_id < 50_000 for user_id in winners))
+
+
+@unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "set RUN_BENCHMARKS=1 to run benchmarks")
+class WeightedSampleBenchmark(unittest.TestCase):
+    def test_50k_entrants_20_winners(self):
+        weighted_ids = [(user_id, 2 if user_id % 10 == 0 else 1) for user_id in range(50_000)]
+
+        started = time.perf_counter()
+        baseline = pool_draw(weighted_ids, 20, random.Random(1))
+        pool_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        winners = weighted_sample(weighted_ids, 20, random.Random(1))
+        sample_seconds = time.perf_counter() - started
+
+        self.assertEqual(len(set(baseline)), 20)
+        self.assertEqual(len(set(winners)), 20)
+        print(
+            f"\n50k entrants / 20 winners: ticket pool {pool_seconds * 1000:.1f} ms, "
+            f"weighted sample {sample_seconds * 1000:.1f} ms"
+        )
+
+
+class DrawWinnersTests(unittest.IsolatedAsyncioTestCase):
+    async def test_many_uncached_entrants_chunk_the_guild_once(self):
+        entrants = list(range(1, 50_001))
+        guild = FakeGuild(cached=entrants[:25_000], uncached=entrants[25_000:49_990], bonus_role_id=9)
+        bot = SimpleNamespace(get_guild=lambda guild_id: guild)
+        cog = Giveaway(bot)
+        record = {"guild_id": 1, "entrants": entrants, "winners_count": 20, "bonus_role_id": 9, "bonus_entries": 3}
+
+        winners = await cog._draw_winners(record, exclude={1, 2})
+
+        self.assertEqual(len(set(winners)), 20)
+        self.assertFalse({1, 2} & set(winners))
+        self.assertFalse(set(entrants[49_990:]) & set(winners))
+        self.assertEqual((guild.chunks, guild.queries), (1, []))
+
+    async def test_few_uncached_entrants_use_member_queries(self):
+        entrants = list(range(1, 301))
+        guild = FakeGuild(cached=entrants[:250], uncached=entrants[250:], bonus_role_id=9)
+        bot = SimpleNamespace(get_guild=lambda guild_id: guild)
+        record = {"guild_id": 1, "entrants": entrants, "winners_count": 300}
+
+        winners = await Giveaway(bot)._draw_winners(record)
+
+        self.assertEqual(len(winners), 300)
+        self.assertEqual((guild.chunks, guild.queries), (0, [50]))
+        self.assertTrue(all(size <= MEMBER_QUERY_CHUNK_SIZE for size in guild.queries))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from commands.giveaway import Giveaway, GiveawayIndex
+
+
+def record(giveaway_id, guild_id, message_id, status="active"):
+    return {"id": giveaway_id, "guild_id": guild_id, "message_id": message_id, "status": status}
+
+
+class GiveawayIndexTests(unittest.TestCase):
+    def test_tracks_message_guild_and_status(self):
+        index = GiveawayIndex()
+        index.rebuild({"a": record("a", 1, 100), "b": record("b", 1, 200, "ended"), "c": record("c", 2, 300)})
+
+        self.assertEqual(index.by_message[200], "b")
+        self.assertEqual(index.guild_ids(1), {"a", "b"})
+        self.assertEqual(index.guild_ids(1, "active"), {"a"})
+
+        index.update(record("a", 1, 100, "ended"))
+        self.assertEqual(index.guild_ids(1, "active"), set())
+        self.assertEqual(index.by_status["ended"], {"a", "b"})
+
+        index.remove("b")
+        self.assertNotIn(200, index.by_message)
+        self.assertEqual(index.guild_ids(1), {"a"})
+        self.assertNotIn("active", {status for status, ids in index.by_status.items() if "a" in ids})
+
+    def test_drops_empty_buckets(self):
+        index = GiveawayIndex()
+        index.update(record("a", 1, 100))
+        index.remove("a")
+
+        self.assertEqual((index.by_message, index.by_guild, index.by_status), ({}, {}, {}))
+
+
+class FindGiveawayTests(unittest.TestCase):
+    def test_finds_by_id_or_message_within_guild(self):
+        cog = Giveaway(bot=None)
+        cog._giveaways = {"a": record("a", 1, 100), "b": record("b", 2, 200)}
+        cog._index.rebuild(cog._giveaways)
+
+        self.assertIs(cog._find_giveaway("a", 1), cog._giveaways["a"])
+        self.assertIs(cog._find_giveaway(" 200 ", 2), cog._giveaways["b"])
+        self.assertIsNone(cog._find_giveaway("200", 1))
+        self.assertIsNone(cog._find_giveaway("999"))
+        self.assertIsNone(cog._find_giveaway("not-an-id"))
+
+
+if __name__ == "__main__":
+    unittest.main()
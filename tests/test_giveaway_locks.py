@@ -0,0 +1,155 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from commands.giveaway import Giveaway, now_ts
+from services.giveaway_store import normalize_record
+from services.keyed_locks import KeyedLocks
+
+
+class FakeResponse:
+    async def defer(self, **kwargs):
+        await asyncio.sleep(0)
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, content, **kwargs):
+        self.messages.append(content)
+
+
+class FakeMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        await asyncio.sleep(0)
+        self.edits.append(kwargs["embed"])
+
+
+class FakeGuild:
+    id = 1
+
+    def get_member(self, user_id):
+        return SimpleNamespace(id=user_id, roles=[])
+
+
+def click(message, user_id):
+    return SimpleNamespace(
+        guild=FakeGuild(),
+        message=message,
+        user=SimpleNamespace(id=user_id, bot=False),
+        response=FakeResponse(),
+        followup=FakeFollowup(),
+    )
+
+
+class KeyedLocksTests(unittest.IsolatedAsyncioTestCase):
+    async def test_drops_idle_locks(self):
+        locks = KeyedLocks()
+        async with locks.hold("a"):
+            self.assertTrue(locks.locked("a"))
+            self.assertEqual(len(locks), 1)
+        self.assertEqual(len(locks), 0)
+        self.assertFalse(locks.locked("a"))
+
+
+class GiveawayCogTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cog = Giveaway(bot=None)
+        self.messages = {}
+        for index in range(5):
+            giveaway_id = f"g{index}"
+            record = normalize_record(
+                {
+                    "id": giveaway_id,
+                    "guild_id": 1,
+                    "channel_id": 2,
+                    "message_id": 100 + index,
+                    "host_id": 3,
+                    "prize": "Nitro",
+                    "winners_count": 1,
+                    "created_at": now_ts(),
+                    "status": "active",
+                    "ends_at": now_ts() + 3600,
+                    "entrants": [],
+                }
+            )
+            self.cog._giveaways[giveaway_id] = record
+            self.cog._index.update(record)
+            self.messages[giveaway_id] = FakeMessage(100 + index)
+
+    async def asyncTearDown(self):
+        with patch.object(self.cog.store, "save_giveaways", AsyncMock()):
+            await self.cog.cog_unload()
+
+
+class GiveawayLockLoadTests(GiveawayCogTestCase):
+    async def test_concurrent_clicks_across_giveaways(self):
+        interactions = [
+            click(self.messages[f"g{index % 5}"], user_id)
+            for index, user_id in enumerate(range(1000, 2000))
+        ]
+
+        await asyncio.gather(*(self.cog.handle_entry(interaction) for interaction in interactions))
+
+        for giveaway_id in self.messages:
+            self.assertEqual(len(self.cog._giveaways[giveaway_id]["entrants"]), 200)
+            self.assertEqual(len(self.cog._entrant_changes[giveaway_id]), 200)
+        self.assertEqual(len(self.cog._locks), 0)
+        self.assertTrue(all(i.followup.messages == ["You are now entered in the giveaway."] for i in interactions))
+
+    async def test_busy_giveaway_does_not_block_others(self):
+        release = asyncio.Event()
+
+        async def hold_busy_giveaway():
+            async with self.cog._locks.hold("g0"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold_busy_giveaway())
+        await asyncio.sleep(0)
+        blocked = asyncio.create_task(self.cog.handle_entry(click(self.messages["g0"], 1)))
+        others = [click(self.messages[f"g{index}"], 2) for index in range(1, 5)]
+
+        await asyncio.wait_for(asyncio.gather(*(self.cog.handle_entry(interaction) for interaction in others)), 1)
+
+        self.assertFalse(blocked.done())
+        self.assertEqual(len(self.cog._giveaways["g0"]["entrants"]), 0)
+        release.set()
+        await asyncio.wait_for(asyncio.gather(holder, blocked), 1)
+        self.assertIn(1, self.cog._giveaways["g0"]["entrants"])
+
+
+class GiveawayEmbedRefreshTests(GiveawayCogTestCase):
+    async def test_entry_clicks_debounce_message_edits(self):
+        self.cog._refresh_interval = 0.05
+        message = self.messages["g0"]
+
+        await asyncio.gather(*(self.cog.handle_entry(click(message, user_id)) for user_id in range(1, 51)))
+        await asyncio.sleep(0.12)
+
+        self.assertLessEqual(len(message.edits), 3)
+        entries = next(field.value for field in message.edits[-1].fields if field.name == "Entries")
+        self.assertEqual(entries, "50")
+        self.assertNotIn("g0", self.cog._refresh_tasks)
+
+    async def test_ended_giveaway_cancels_pending_refresh(self):
+        self.cog._refresh_interval = 10
+        message = self.messages["g0"]
+        await self.cog.handle_entry(click(message, 1))
+        await self.cog.handle_entry(click(message, 2))
+        await asyncio.sleep(0)
+
+        self.cog._cancel_entry_refresh("g0")
+
+        self.assertEqual(len(message.edits), 1)
+        self.assertNotIn("g0", self.cog._refresh_tasks)
+        self.assertNotIn("g0", self.cog._refresh_pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
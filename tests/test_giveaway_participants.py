@@ -1,11 +1,17 @@
 import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from commands.giveaway import (
     PARTICIPANT_PREVIEW_LIMIT,
+    Giveaway,
+    GiveawayParticipantsView,
+    ParticipantPageIndex,
     format_participants_preview,
     normalize_entrant_ids,
     participant_pages,
 )
+from services.giveaway_store import normalize_record
 
 
 class GiveawayParticipantsTests(unittest.TestCase):
@@ -37,5 +43,90 @@ class GiveawayParticipantsTests(unittest.TestCase):
         self.assertIn(f"`{PARTICIPANT_PREVIEW_LIMIT + 2}.`", pages[1])
 
 
+class ParticipantPageIndexTests(unittest.TestCase):
+    def test_reuses_pages_until_entrants_change(self):
+        index = ParticipantPageIndex()
+        record = normalize_record({"id": "a", "prize": "Nitro", "entrants": list(range(1, 120))})
+
+        with patch("commands.giveaway.participant_pages", wraps=participant_pages) as build:
+            first = index.get("a", record)
+            self.assertIs(index.get("a", record), first)
+            self.assertEqual(build.call_count, 1)
+
+            record["entrants"].add(500)
+            index.invalidate("a")
+            rebuilt = index.get("a", record)
+
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual((len(rebuilt.pages), rebuilt.total), (3, 120))
+        self.assertIs(index.get("a"), rebuilt)
+
+    def test_evicts_least_recently_viewed(self):
+        index = ParticipantPageIndex(max_entries=2)
+        for giveaway_id in ("a", "b", "c"):
+            index.get(giveaway_id, {"id": giveaway_id, "entrants": [1]})
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.get("a"))
+
+
+class GiveawayParticipantsViewTests(unittest.IsolatedAsyncioTestCase):
+    async def test_view_slices_cached_pages_by_id(self):
+        cog = Giveaway(bot=None)
+        cog._giveaways["a"] = normalize_record({"id": "a", "prize": "Nitro", "entrants": list(range(1, 120))})
+        view = GiveawayParticipantsView(cog, "a", requester_id=1)
+
+        embed, paginated = view.render()
+        self.assertTrue(paginated)
+        self.assertTrue(view.previous_page.disabled)
+        self.assertEqual(embed.footer.text, "Page 1/3")
+
+        view.page_index = 5
+        embed, _ = view.render()
+        self.assertEqual(view.page_index, 2)
+        self.assertIn("`119.`", embed.description)
+        self.assertFalse(hasattr(view, "record"))
+
+        cog._queue_entrant_change("a", 999, True)
+        cog._giveaways["a"]["entrants"].add(999)
+        embed, _ = view.render()
+        self.assertIn("`120.`", embed.description)
+        await cog._writer.discard("a")
+
+    async def test_archived_participants_load_once_per_message(self):
+        cog = Giveaway(bot=None)
+        archived = normalize_record(
+            {"id": "old", "guild_id": 1, "message_id": 55, "prize": "Nitro", "status": "ended", "entrants": [1, 2]}
+        )
+
+        def click(guild_id=1):
+            return SimpleNamespace(
+                guild=SimpleNamespace(id=guild_id),
+                message=SimpleNamespace(id=55),
+                user=SimpleNamespace(id=9),
+                response=SimpleNamespace(send_message=AsyncMock(), defer=AsyncMock()),
+                followup=SimpleNamespace(send=AsyncMock()),
+            )
+
+        with patch.object(cog.store, "load_archived", AsyncMock(return_value=archived)) as load:
+            first = click()
+            await cog.handle_participants(first)
+            first.response.defer.assert_awaited_once_with(ephemeral=True, thinking=True)
+            self.assertIn("<@2>", first.followup.send.await_args.kwargs["embed"].description)
+            first.response.send_message.assert_not_awaited()
+
+            for _ in range(2):
+                interaction = click()
+                await cog.handle_participants(interaction)
+            self.assertEqual(load.await_count, 1)
+            interaction.response.defer.assert_not_awaited()
+            self.assertIn("<@2>", interaction.response.send_message.await_args.kwargs["embed"].description)
+
+            load.return_value = None
+            missing = click(guild_id=2)
+            await cog.handle_participants(missing)
+            self.assertEqual(load.await_count, 2)
+            missing.followup.send.assert_awaited_once_with("I could not find this giveaway.", ephemeral=True)
+
 if __name__ == "__main__":
     unittest.main()
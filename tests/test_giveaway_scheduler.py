@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from commands.giveaway import Giveaway, now_ts
+
+
+class FakeBot:
+    def __init__(self):
+        self.closed = False
+
+    async def wait_until_ready(self):
+        return None
+
+    def is_closed(self):
+        return self.closed
+
+
+def active_record(giveaway_id, ends_at):
+    return {
+        "id": giveaway_id,
+        "guild_id": 1,
+        "channel_id": 2,
+        "status": "active",
+        "ends_at": ends_at,
+        "entrants": [],
+    }
+
+
+class GiveawaySchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bot = FakeBot()
+        self.cog = Giveaway(self.bot)
+        self.finished = []
+
+        async def finish(giveaway_id, **kwargs):
+            self.finished.append(giveaway_id)
+            record = self.cog._giveaways[giveaway_id]
+            record["status"] = "ended"
+            record["winner_announcement_sent"] = True
+            await self.cog._save_giveaway(record)
+
+        self.cog._finish_giveaway = finish
+
+    async def asyncTearDown(self):
+        self.bot.closed = True
+        with patch.object(self.cog.store, "save_giveaways", AsyncMock()):
+            await self.cog.cog_unload()
+
+    async def test_runner_sleeps_until_a_deadline_is_armed(self):
+        await self.cog._save_giveaway(active_record("later", now_ts() + 3600))
+        self.cog.start_runner()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.finished, [])
+        self.assertEqual(self.cog._next_wake_at(), float(self.cog._giveaways["later"]["ends_at"]))
+
+        await self.cog._save_giveaway(active_record("due", now_ts()))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.finished, ["due"])
+        self.assertNotIn("due", self.cog._scheduled)
+
+    async def test_cancelled_giveaway_deadline_is_skipped(self):
+        record = active_record("cancelled", now_ts())
+        await self.cog._save_giveaway(record)
+        record = self.cog._giveaways["cancelled"]
+        record["status"] = "cancelled"
+        await self.cog._save_giveaway(record)
+
+        self.assertEqual(self.cog._pop_due_deadlines(now_ts()), [])
+        self.assertIsNone(self.cog._next_wake_at())
+
+    async def test_failed_announcement_is_retried_later(self):
+        record = {**active_record("ended", now_ts()), "status": "ended", "winner_announcement_sent": False}
+        await self.cog._save_giveaway(record)
+        self.cog._pending_announcements["ended"] = 0
+        self.cog._announce_winners = AsyncMock(return_value=False)
+
+        await self.cog._retry_missing_announcements()
+
+        self.cog._announce_winners.assert_awaited_once()
+        self.assertGreater(self.cog._pending_announcements["ended"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from commands.giveaway import Giveaway, now_ts
+from services.giveaway_store import EntrantSet, GiveawayStore, archive_summary, normalize_record
+
+
+class FakeRef:
+    def __init__(self, document_id, collection="giveaways"):
+        self.id = document_id
+        self.collection = collection
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+
+    def set(self, ref, data, merge=False):
+        self.db.operations.append(("set", ref.id, data, merge))
+
+    def update(self, ref, data):
+        self.db.operations.append(("update", ref.id, data))
+
+    def delete(self, ref):
+        self.db.operations.append(("delete", ref.collection, ref.id))
+
+    def commit(self):
+        self.db.commits.append(len(self.db.operations))
+
+
+class FakeDb:
+    def __init__(self):
+        self.operations = []
+        self.commits = []
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+class FakeFirestoreModule:
+    SERVER_TIMESTAMP = object()
+
+    @staticmethod
+    def ArrayUnion(values):
+        return ("union", list(values))
+
+    @staticmethod
+    def ArrayRemove(values):
+        return ("remove", list(values))
+
+
+class EntrantSetTests(unittest.TestCase):
+    def test_keeps_join_order_and_skips_duplicates(self):
+        entrants = EntrantSet(["12", 12, "34", None, "bad"])
+
+        self.assertEqual(entrants.to_list(), [12, 34])
+        self.assertTrue(entrants.add(56))
+        self.assertFalse(entrants.add(12))
+        self.assertTrue(entrants.discard(12))
+        self.assertFalse(entrants.discard(12))
+        self.assertEqual(list(entrants), [34, 56])
+        self.assertIn(34, entrants)
+        self.assertEqual(len(entrants), 2)
+
+    def test_normalize_record_shares_existing_entrant_set(self):
+        entrants = EntrantSet([1, 2])
+        normalized = normalize_record({"id": 5, "entrants": entrants})
+
+        self.assertIs(normalized["entrants"], entrants)
+        self.assertEqual(normalize_record({"id": 5, "entrants": ["3"]})["entrants"], EntrantSet([3]))
+
+
+class GiveawayStoreTests(unittest.TestCase):
+    def test_save_giveaways_applies_entrant_changes_without_rewriting_list(self):
+        store = GiveawayStore()
+        db = FakeDb()
+        record = normalize_record({"id": "abc", "prize": "Nitro", "entrants": list(range(10_000))})
+
+        with (
+            patch("services.firebase_client.get_firestore_client", return_value=db),
+            patch("services.giveaway_store.get_firestore_module", return_value=FakeFirestoreModule),
+            patch.object(store, "_giveaway_ref", side_effect=FakeRef),
+        ):
+            store._save_giveaways_sync({"abc": record}, {"abc": {7: True, 8: False}})
+
+        document_write, union, remove = db.operations
+        self.assertEqual(document_write[0], "set")
+        self.assertNotIn("entrants", document_write[2])
+        self.assertEqual(union, ("update", "abc", {"entrants": ("union", [7])}))
+        self.assertEqual(remove, ("update", "abc", {"entrants": ("remove", [8])}))
+
+    def test_archive_moves_entrants_to_side_document_and_deletes_live_doc(self):
+        store = GiveawayStore()
+        db = FakeDb()
+        record = normalize_record(
+            {"id": "abc", "guild_id": 1, "status": "ended", "winner_ids": [5], "entrants": list(range(1000))}
+        )
+
+        with (
+            patch("services.firebase_client.get_firestore_client", return_value=db),
+            patch("services.giveaway_store.get_firestore_module", return_value=FakeFirestoreModule),
+            patch.object(store, "_archive_ref", side_effect=lambda i: FakeRef(i, "giveaway_archive")),
+            patch.object(store, "_archive_entrants_ref", side_effect=lambda i: FakeRef(i, "giveaway_archive_entrants")),
+            patch.object(store, "_giveaway_ref", side_effect=FakeRef),
+        ):
+            store._archive_giveaways_sync([(archive_summary(record), record["entrants"].to_list())])
+
+        summary, entrants, delete = db.operations
+        self.assertEqual(summary[2]["winner_ids"], [5])
+        self.assertEqual(summary[2]["entry_count"], 1000)
+        self.assertNotIn("entrants", summary[2])
+        self.assertEqual(entrants[2], {"entrants": list(range(1000))})
+        self.assertEqual(delete, ("delete", "giveaways", "abc"))
+
+    def test_archive_batches_never_split_a_giveaway(self):
+        store = GiveawayStore()
+        db = FakeDb()
+        archived = [(archive_summary(normalize_record({"id": str(i)})), []) for i in range(4)]
+
+        with (
+            # A write limit that is not a multiple of three would split a giveaway across batches.
+            patch("services.firebase_client.FIRESTORE_BATCH_LIMIT", 10),
+            patch("services.giveaway_store.ARCHIVE_BATCH_SIZE", 3),
+            patch("services.firebase_client.get_firestore_client", return_value=db),
+            patch("services.giveaway_store.get_firestore_module", return_value=FakeFirestoreModule),
+            patch.object(store, "_archive_ref", side_effect=lambda i: FakeRef(i, "giveaway_archive")),
+            patch.object(store, "_archive_entrants_ref", side_effect=lambda i: FakeRef(i, "giveaway_archive_entrants")),
+            patch.object(store, "_giveaway_ref", side_effect=FakeRef),
+        ):
+            store._archive_giveaways_sync(archived)
+
+        self.assertEqual(db.commits, [9, 12])
+
+
+class GiveawayEntrantQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_flush_requeues_changes_behind_newer_clicks(self):
+        cog = Giveaway(bot=None)
+        cog._giveaways["abc"] = normalize_record({"id": "abc", "entrants": [1]})
+        cog._entrant_changes["abc"] = {1: True, 2: True}
+
+        async def fail_after_new_click(records, changes):
+            cog._entrant_changes.setdefault("abc", {})[2] = False
+            raise RuntimeError("offline")
+
+        with patch.object(cog.store, "save_giveaways", AsyncMock(side_effect=fail_after_new_click)):
+            with self.assertRaises(RuntimeError):
+                await cog._flush_giveaways({"abc": cog._giveaways["abc"]})
+
+        self.assertEqual(cog._entrant_changes["abc"], {2: False, 1: True})
+
+        save = AsyncMock()
+        with patch.object(cog.store, "save_giveaways", save):
+            await cog._flush_giveaways({"abc": cog._giveaways["abc"]})
+        self.assertEqual(save.await_args.args[1], {"abc": {2: False, 1: True}})
+        self.assertNotIn("abc", cog._entrant_changes)
+
+
+class GiveawayArchiveTests(unittest.IsolatedAsyncioTestCase):
+    async def test_archives_only_settled_giveaways_past_retention(self):
+        cog = Giveaway(bot=None)
+        cog._archive_after = 3600
+        old = now_ts() - 7200
+        records = {
+            "old-ended": {"status": "ended", "ended_at": old, "winner_announcement_sent": True},
+            "old-cancelled": {"status": "cancelled", "ended_at": old},
+            "unannounced": {"status": "ended", "ended_at": old, "winner_announcement_sent": False},
+            "recent": {"status": "ended", "ended_at": now_ts(), "winner_announcement_sent": True},
+            "active": {"status": "active", "ends_at": now_ts() + 60},
+        }
+        for giveaway_id, fields in records.items():
+            await cog._save_giveaway({"id": giveaway_id, "guild_id": 1, "message_id": len(giveaway_id), **fields})
+
+        archive = AsyncMock()
+        with patch.object(cog.store, "archive_giveaways", archive):
+            self.assertEqual(await cog._archive_expired(), 2)
+
+        self.assertEqual({record["id"] for record in archive.await_args.args[0]}, {"old-ended", "old-cancelled"})
+        self.assertEqual(set(cog._giveaways), {"unannounced", "recent", "active"})
+        self.assertEqual(cog._index.guild_ids(1), {"unannounced", "recent", "active"})
+        self.assertEqual(len(cog._locks), 0)
+
+        with patch.object(cog.store, "save_giveaways", AsyncMock()) as save:
+            await cog.cog_unload()
+        self.assertNotIn("old-ended", save.await_args.args[0])
+
+    async def test_reroll_after_archive_keeps_embed_display_fields(self):
+        cog = Giveaway(bot=None)
+        live = normalize_record(
+            {
+                "id": "g1",
+                "guild_id": 1,
+                "message_id": 5,
+                "prize": "Nitro",
+                "description": "Monthly giveaway",
+                "image_url": "https://cdn.example/banner.png",
+                "thumbnail_url": "https://cdn.example/icon.png",
+                "host_id": 7,
+                "status": "ended",
+                "created_at": 1_000,
+                "ends_at": 2_000,
+                "ended_at": 2_000,
+                "winners_count": 1,
+                "winner_ids": [2],
+                "entrants": [1, 2, 3],
+            }
+        )
+        archived = normalize_record({**archive_summary(live), "entrants": live["entrants"].to_list()})
+
+        with (
+            patch.object(cog.store, "save_archived", AsyncMock()),
+            patch.object(cog, "_update_message", AsyncMock()) as update,
+            patch.object(cog, "_announce_winners", AsyncMock(return_value=False)),
+        ):
+            await cog._reroll_archived(archived, [3], rerolled_by=9)
+
+        embed = cog._build_embed(update.await_args.args[0])
+        self.assertEqual(embed.description, "Monthly giveaway")
+        self.assertEqual(embed.image.url, "https://cdn.example/banner.png")
+        self.assertEqual(embed.thumbnail.url, "https://cdn.example/icon.png")
+        self.assertIn("<@3>", next(field.value for field in embed.fields if field.name == "Winners"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,19 +1,49 @@
+import asyncio
+import copy
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import web
 
 from services.hypixel_client import (
+    HTTP_POOL_PER_HOST_LIMIT,
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    FrozenDict,
     HypixelRateLimit,
+    HypixelRateLimiter,
+    _TTLCache,
     MinecraftPlayerNotFound,
     bedwars_pro_score,
     choose_skyblock_profile,
     clean_username,
     clear_hypixel_cache,
+    close_profile_disk_cache,
+    create_hypixel_session,
+    fetch_hypixel_player,
+    fetch_hypixel_players,
     fetch_player_data,
     fetch_skyblock_profiles,
     format_hypixel_error,
+    freeze_value,
+    hypixel_cache_stats,
+    hypixel_http_stats,
     last_game_name,
+    open_profile_disk_cache,
     parse_rate_limit_headers,
+    project_skyblock_profiles,
+    reset_hypixel_http_stats,
+    _RateLimitHeaders,
+    _session_closers,
+    _session_scope,
+    _single_flight,
     resolve_minecraft_profile,
+    resolve_minecraft_profiles,
     skywars_pro_score,
+    unique_usernames,
 )
 
 
@@ -24,6 +54,7 @@ class FakeResponse:
         self.headers = headers or {}
 
     async def __aenter__(self):
+        await asyncio.sleep(0)
         return self
 
     async def __aexit__(self, exc_type, exc, traceback):
@@ -34,6 +65,8 @@ class FakeResponse:
 
 
 class FakeSession:
+    closed = False
+
     def __init__(self, *responses):
         self.responses = list(responses)
         self.calls = []
@@ -44,12 +77,16 @@ class FakeSession:
             raise AssertionError("No fake response queued.")
         return self.responses.pop(0)
 
+    def post(self, url, **kwargs):
+        return self.get(url, **kwargs)
+
 
 class HypixelClientTests(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         clear_hypixel_cache()
 
-    def tearDown(self):
+    async def asyncTearDown(self):
+        await close_profile_disk_cache()
         clear_hypixel_cache()
 
     def test_clean_username_rejects_invalid_input(self):
@@ -71,6 +108,89 @@ class HypixelClientTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(second, ("abc123", "KerevizMax"))
         self.assertEqual(len(session.calls), 1)
 
+    async def test_bulk_profile_lookup_chunks_names_and_skips_cached(self):
+        await resolve_minecraft_profile(FakeSession(FakeResponse(200, {"id": "cached", "name": "Cached"})), "Cached")
+        names = [f"Player{index}" for index in range(12)]
+        session = FakeSession(
+            FakeResponse(200, [{"id": f"uuid{index}", "name": name} for index, name in enumerate(names[:10])]),
+            FakeResponse(200, [{"id": "uuid10", "name": "Player10"}]),
+        )
+
+        profiles = await resolve_minecraft_profiles(session, ["cached", *names])
+
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual(session.calls[0][1]["json"], names[:10])
+        self.assertEqual(session.calls[1][1]["json"], names[10:])
+        self.assertEqual(profiles["cached"], ("cached", "Cached"))
+        self.assertEqual(profiles["player3"], ("uuid3", "Player3"))
+        self.assertNotIn("player11", profiles)
+        self.assertEqual(await resolve_minecraft_profile(FakeSession(), "player3"), ("uuid3", "Player3"))
+
+    async def test_fetch_hypixel_players_reports_missing_players_individually(self):
+        session = FakeSession(
+            FakeResponse(200, [{"id": "abc123", "name": "KerevizMax"}]),
+            FakeResponse(200, {"success": True, "player": {"displayname": "KerevizMax"}}),
+        )
+
+        results = await fetch_hypixel_players("key", ["KerevizMax", "Nobody", "bad name"], session=session)
+
+        self.assertEqual(results[0].uuid, "abc123")
+        self.assertIsInstance(results[1], MinecraftPlayerNotFound)
+        self.assertIsInstance(results[2], MinecraftPlayerNotFound)
+        self.assertEqual(session.calls[0][1]["json"], ["KerevizMax", "Nobody"])
+
+    async def test_fallback_session_outlives_its_caller_while_a_flight_is_shared(self):
+        release = asyncio.Event()
+        sessions = []
+
+        class OwnedSession:
+            closed = False
+
+            def __init__(self, **kwargs):
+                sessions.append(self)
+
+            async def close(self):
+                self.closed = True
+
+        async def request(session):
+            await release.wait()
+            return "closed" if session.closed else "ok"
+
+        async def caller():
+            async with _session_scope(None) as session:
+                return await _single_flight(("test", "shared"), lambda: request(session), session=session)
+
+        with patch("services.hypixel_client.aiohttp.ClientSession", OwnedSession):
+            first = asyncio.create_task(caller())
+            await asyncio.sleep(0)
+            second = asyncio.create_task(caller())
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+
+            self.assertFalse(sessions[0].closed)
+            release.set()
+            self.assertEqual(await second, "ok")
+            await asyncio.gather(*_session_closers)
+
+        self.assertTrue(all(session.closed for session in sessions))
+
+    def test_unique_usernames_dedupes_case_insensitively(self):
+        self.assertEqual(unique_usernames(["Kereviz", "kereviz", " Other ", ""]), ["Kereviz", "Other"])
+
+    async def test_profile_disk_cache_survives_restart(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "profiles.sqlite3"
+            self.assertEqual(await open_profile_disk_cache(path), 0)
+            session = FakeSession(FakeResponse(200, {"id": "abc123", "name": "KerevizMax"}))
+            await resolve_minecraft_profile(session, "KerevizMax")
+            await close_profile_disk_cache()
+            clear_hypixel_cache()
+
+            self.assertEqual(await open_profile_disk_cache(path), 1)
+            self.assertEqual(await resolve_minecraft_profile(FakeSession(), "kerevizmax"), ("abc123", "KerevizMax"))
+            await close_profile_disk_cache()
+
     async def test_caches_hypixel_player_data(self):
         session = FakeSession(
             FakeResponse(
@@ -84,10 +204,73 @@ class HypixelClientTests(unittest.IsolatedAsyncioTestCase):
         second = await fetch_player_data(session, "api-key", "abc123")
 
         self.assertEqual(first["displayname"], "KerevizMax")
-        self.assertEqual(second["displayname"], "KerevizMax")
-        self.assertIsNot(first, second)
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["displayname"] = "Changed"
         self.assertEqual(len(session.calls), 1)
 
+    async def test_fetch_player_uses_injected_session(self):
+        session = FakeSession(
+            FakeResponse(200, {"id": "abc123", "name": "KerevizMax"}),
+            FakeResponse(200, {"success": True, "player": {"displayname": "KerevizMax"}}),
+        )
+
+        bundle = await fetch_hypixel_player("api-key", "KerevizMax", session=session)
+
+        self.assertEqual(bundle.uuid, "abc123")
+        self.assertEqual(len(session.calls), 2)
+
+    async def test_shared_session_reuses_pooled_connections(self):
+        async def handler(_request):
+            return web.json_response({"success": True})
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        reset_hypixel_http_stats()
+
+        session = create_hypixel_session()
+        try:
+            self.assertEqual(session.connector.limit_per_host, HTTP_POOL_PER_HOST_LIMIT)
+            for _ in range(3):
+                async with session.get(f"http://127.0.0.1:{port}/") as response:
+                    await response.json()
+        finally:
+            await session.close()
+            await runner.cleanup()
+
+        stats = hypixel_http_stats()
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.reused_connections, 2)
+
+    async def test_concurrent_player_lookups_share_one_request(self):
+        session = FakeSession(
+            FakeResponse(200, {"success": True, "player": {"displayname": "KerevizMax"}}),
+        )
+
+        results = await asyncio.gather(*(fetch_player_data(session, "api-key", "abc123") for _ in range(3)))
+
+        self.assertEqual(len(session.calls), 1)
+        self.assertTrue(all(result["displayname"] == "KerevizMax" for result in results))
+
+    async def test_concurrent_lookups_share_rate_limit_error(self):
+        session = FakeSession(
+            FakeResponse(429, {"success": False}, {"RateLimit-Reset": "30"}),
+        )
+
+        results = await asyncio.gather(
+            *(fetch_player_data(session, "api-key", "abc123") for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(len(session.calls), 1)
+        self.assertTrue(all(isinstance(result, HypixelRateLimit) for result in results))
+
     async def test_rate_limit_uses_retry_header(self):
         session = FakeSession(
             FakeResponse(
@@ -108,6 +291,90 @@ class HypixelClientTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(raised.exception.limit, 300)
         self.assertEqual(format_hypixel_error(raised.exception), "Hypixel API is rate-limiting requests. Try again in about 30s.")
 
+    def test_frozen_values_keep_dict_and_list_types(self):
+        frozen, size = freeze_value({"stats": {"Bedwars": {"wins": 1}}, "pets": [{"active": True}]})
+
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen["stats"], dict)
+        self.assertIsInstance(frozen["pets"], list)
+        self.assertGreater(size, 0)
+        with self.assertRaises(TypeError):
+            frozen["stats"]["Bedwars"]["wins"] = 2
+        copied = copy.deepcopy(frozen)
+        copied["stats"]["Bedwars"]["wins"] = 2
+        self.assertEqual(frozen["stats"]["Bedwars"]["wins"], 1)
+
+    def test_cache_evicts_least_recently_used_entries(self):
+        cache = _TTLCache("test", max_entries=2, max_bytes=0)
+        cache.set("a", {"value": 1}, 60)
+        cache.set("b", {"value": 2}, 60)
+        cache.get("a")
+        cache.set("c", {"value": 3}, 60)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_cache_enforces_byte_budget(self):
+        _, entry_size = freeze_value({"value": "x" * 100})
+        cache = _TTLCache("test", max_entries=0, max_bytes=entry_size * 2)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"value": "x" * 100}, 60)
+
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.total_bytes, entry_size * 2)
+        self.assertNotIn("a", cache)
+
+    def test_cache_sweeps_expired_entries(self):
+        cache = _TTLCache("test", max_entries=10, max_bytes=0)
+        cache.set("a", {"value": 1}, 1)
+        cache.set("b", {"value": 2}, 600)
+
+        self.assertEqual(cache.sweep(time.monotonic() + 5), 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_cache_stats_cover_every_hypixel_cache(self):
+        self.assertEqual(set(hypixel_cache_stats()), {"profiles", "players", "skyblock_profiles"})
+
+    async def test_rate_limiter_rejects_when_quota_is_exhausted(self):
+        limiter = HypixelRateLimiter(burst=5, max_wait=10)
+        limiter.update(_RateLimitHeaders(limit=300, remaining=0, reset_after=30))
+
+        with self.assertRaises(HypixelRateLimit) as raised:
+            await limiter.acquire()
+
+        self.assertEqual(raised.exception.retry_after, 30)
+        self.assertEqual(limiter.status()["rejected"], 1)
+
+    async def test_rate_limiter_spreads_requests_over_reset_window(self):
+        limiter = HypixelRateLimiter(burst=1, max_wait=10)
+        limiter.update(_RateLimitHeaders(limit=300, remaining=10, reset_after=10))
+
+        await limiter.acquire()
+
+        self.assertAlmostEqual(limiter.wait_seconds(), 10 / 9, delta=0.1)
+        self.assertEqual(limiter.status()["remaining"], 9)
+
+    async def test_rate_limiter_serves_interactive_requests_first(self):
+        limiter = HypixelRateLimiter(burst=1, max_wait=10, window_seconds=1)
+        limiter.update(_RateLimitHeaders(limit=100, remaining=100, reset_after=1))
+        await limiter.acquire()
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        background = asyncio.create_task(request("background", PRIORITY_BACKGROUND))
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.queue_depth, 1)
+        interactive = asyncio.create_task(request("interactive", PRIORITY_INTERACTIVE))
+        await asyncio.gather(background, interactive)
+
+        self.assertEqual(order, ["interactive", "background"])
+
     def test_parses_rate_limit_headers(self):
         headers = parse_rate_limit_headers(
             {
@@ -184,10 +451,29 @@ class HypixelClientTests(unittest.IsolatedAsyncioTestCase):
         second = await fetch_skyblock_profiles(session, "api-key", "abc123")
 
         self.assertEqual(first[0]["cute_name"], "Apple")
-        self.assertEqual(second[0]["cute_name"], "Apple")
-        self.assertIsNot(first, second)
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first.append({})
         self.assertEqual(len(session.calls), 1)
 
+    def test_projects_skyblock_profiles_to_requested_member(self):
+        profiles = [
+            {
+                "profile_id": "profile-1",
+                "banking": {"balance": 10},
+                "members": {
+                    "abc123": {"leveling": {"experience": 1200}, "inventory": {"inv_contents": "blob"}},
+                    "def456": {"leveling": {"experience": 9000}, "collection": {"WHEAT": 1}},
+                },
+            }
+        ]
+
+        projected = project_skyblock_profiles(profiles, "abc123")
+
+        self.assertEqual(projected[0]["banking"], {"balance": 10})
+        self.assertEqual(projected[0]["members"], {"abc123": {"leveling": {"experience": 1200}}, "def456": {}})
+        self.assertIn("inventory", profiles[0]["members"]["abc123"])
+
     def test_chooses_selected_skyblock_profile_first(self):
         profiles = [
             {
@@ -1,8 +1,20 @@
+import contextlib
 import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from commands.bedwars import Bedwars
-from commands.skyblock import SkyBlock
+from commands.skyblock import SkyBlock, SkyBlockView
 from commands.skywars import Skywars
+from services.hypixel_client import PRIORITY_BACKGROUND, HypixelPlayerBundle, SkyBlockProfileBundle
+
+
+class FakeContext:
+    def __init__(self):
+        self.send = AsyncMock()
+
+    def typing(self):
+        return contextlib.nullcontext()
 
 
 class HypixelCommandTests(unittest.TestCase):
@@ -14,10 +26,55 @@ class HypixelCommandTests(unittest.TestCase):
         command = next(command for command in Skywars(bot=None).get_commands() if command.name == "skywars")
         self.assertIn("sw", command.aliases)
 
+    def test_compare_commands_have_short_aliases(self):
+        bedwars = next(command for command in Bedwars(bot=None).get_commands() if command.name == "bwcompare")
+        skywars = next(command for command in Skywars(bot=None).get_commands() if command.name == "swcompare")
+        self.assertIn("bwc", bedwars.aliases)
+        self.assertIn("swc", skywars.aliases)
+
     def test_skyblock_has_short_alias(self):
         command = next(command for command in SkyBlock(bot=None).get_commands() if command.name == "skyblock")
         self.assertIn("sb", command.aliases)
 
 
+class CompareCommandTests(unittest.IsolatedAsyncioTestCase):
+    async def test_compares_queue_behind_single_player_lookups(self):
+        bot = SimpleNamespace(HYPIXEL_API_KEY="key", hypixel_session=None)
+        players = [
+            HypixelPlayerBundle(username=name, uuid=name, player={"displayname": name})
+            for name in ("Alpha", "Beta")
+        ]
+        for cog in (Bedwars(bot), Skywars(bot)):
+            command = next(command for command in cog.get_commands() if command.name.endswith("compare"))
+            ctx = FakeContext()
+            with patch("commands.hypixel_compare.fetch_hypixel_players", AsyncMock(return_value=players)) as fetch:
+                await command.callback(cog, ctx, "Alpha", "Beta")
+
+            self.assertEqual(fetch.await_args.kwargs["priority"], PRIORITY_BACKGROUND)
+            self.assertEqual(len(ctx.send.await_args.kwargs["embed"].fields), 2)
+
+
+class SkyBlockViewTests(unittest.IsolatedAsyncioTestCase):
+    async def test_view_keeps_page_summaries_instead_of_raw_profile(self):
+        member = {"leveling": {"experience": 1234}, "slayer_bosses": {"zombie": {"xp": 500}}}
+        bundle = SkyBlockProfileBundle(
+            username="KerevizMax",
+            uuid="abc123",
+            profile={"profile_id": "profile-1", "cute_name": "Apple", "selected": True, "members": {"abc123": member}},
+            member=member,
+        )
+
+        view = SkyBlockView(owner_id=1, bundle=bundle)
+        view.page = "slayer"
+        embed = view.build_embed()
+
+        self.assertFalse(hasattr(view, "bundle"))
+        self.assertEqual(set(view.pages), {"overview", "skills", "slayer", "dungeons", "mining", "collections"})
+        self.assertFalse(hasattr(view.pages["slayer"], "__dict__"))
+        self.assertEqual(embed.title, "KerevizMax | SkyBlock - Slayer")
+        self.assertIn("SkyBlock Level: `12.34`", embed.description)
+        self.assertEqual(embed.fields[-1].value, "500")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from unittest.mock import patch
+
+from services.invite_store import InviteTrackerStore, collection_payloads, diff_documents, normalize_config
+
+
+class FakeDocument:
+    def __init__(self, collection, document_id):
+        self.collection = collection
+        self.id = document_id
+
+
+class FakeCollection:
+    def __init__(self, name):
+        self.name = name
+        self.streamed = 0
+
+    def document(self, document_id):
+        return FakeDocument(self, document_id)
+
+    def collection(self, name):
+        return FakeCollection(name)
+
+    def stream(self):
+        self.streamed += 1
+        return []
+
+
+class FakeTrackerRef:
+    def __init__(self):
+        self.collections = {}
+
+    def set(self, data, merge=False):
+        pass
+
+    def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection(name))
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+
+    def set(self, ref, data):
+        self.db.operations.append(("set", ref.collection.name, ref.id))
+
+    def delete(self, ref):
+        self.db.operations.append(("delete", ref.collection.name, ref.id))
+
+    def commit(self):
+        pass
+
+
+class FakeDb:
+    def __init__(self):
+        self.operations = []
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+class FakeFirestoreModule:
+    SERVER_TIMESTAMP = object()
+
+
+class InviteTrackerStoreTests(unittest.TestCase):
+    def test_diff_documents_only_returns_changes(self):
+        previous = {"1": {"total": 1}, "2": {"total": 2}, "3": {"total": 3}}
+        current = {"1": {"total": 1}, "2": {"total": 5}, "4": {"total": 1}}
+
+        writes, deletes = diff_documents(previous, current)
+
+        self.assertEqual(writes, {"2": {"total": 5}, "4": {"total": 1}})
+        self.assertEqual(deletes, ["3"])
+
+    def test_collection_payloads_normalize_ids(self):
+        payloads = collection_payloads(
+            normalize_config(
+                {
+                    "member_invites": {1: "3"},
+                    "member_joins": {2: 1},
+                    "invite_cache": {"abc": {"uses": "4", "inviter_id": 1}},
+                }
+            )
+        )
+
+        self.assertEqual(payloads["member_invites"], {"1": {"total": 3}})
+        self.assertEqual(payloads["member_joins"], {"2": {"inviter_id": 1}})
+        self.assertEqual(payloads["invite_cache"]["abc"]["uses"], 4)
+
+
+class InviteTrackerStoreSaveTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.store = InviteTrackerStore()
+        self.db = FakeDb()
+        self.tracker_ref = FakeTrackerRef()
+        patches = (
+            patch("services.invite_store.get_firestore_client", return_value=self.db),
+            patch("services.invite_store.get_firestore_module", return_value=FakeFirestoreModule),
+            patch.object(self.store, "_tracker_ref", return_value=self.tracker_ref),
+        )
+        for item in patches:
+            item.start()
+            self.addCleanup(item.stop)
+
+    async def test_incremental_save_writes_only_changed_documents(self):
+        config = normalize_config({"member_invites": {"1": 1, "2": 2}, "member_joins": {"10": 1}})
+        await self.store.save_guilds({"1": config})
+        self.db.operations.clear()
+
+        config["member_invites"]["1"] = 2
+        config["member_joins"]["11"] = 1
+        config["member_joins"].pop("10")
+        await self.store.save_guilds({"1": config})
+
+        self.assertEqual(
+            sorted(self.db.operations),
+            [
+                ("delete", "member_joins", "10"),
+                ("set", "member_invites", "1"),
+                ("set", "member_joins", "11"),
+            ],
+        )
+        self.assertEqual(self.tracker_ref.collections["member_invites"].streamed, 1)
+
+    async def test_full_rewrite_streams_existing_documents(self):
+        config = normalize_config({"member_invites": {"1": 1}})
+        await self.store.save_guild("1", config)
+        await self.store.save_guild("1", config, full_rewrite=True)
+
+        self.assertEqual(self.tracker_ref.collections["member_invites"].streamed, 2)
+
+    async def test_rewrite_requested_during_flush_is_kept_for_the_next_one(self):
+        config = normalize_config({"member_invites": {"1": 1}})
+        await self.store.save_guilds({"1": config})
+        self.store.request_full_rewrite("1")
+
+        async def request_again_while_writing(func, *args):
+            self.store.request_full_rewrite("1")
+            return func(*args)
+
+        with patch("services.invite_store.run_firestore", request_again_while_writing):
+            await self.store.save_guilds({"1": config})
+        self.assertEqual(self.tracker_ref.collections["member_invites"].streamed, 2)
+
+        await self.store.save_guilds({"1": config})
+        self.assertEqual(self.tracker_ref.collections["member_invites"].streamed, 3)
+        await self.store.save_guilds({"1": config})
+        self.assertEqual(self.tracker_ref.collections["member_invites"].streamed, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,12 @@ class ReactionRoleStoreTests(unittest.TestCase):
         self.assertEqual(panel["status"], "active")
         self.assertEqual(panel["panel_type"], "notification_roles")
 
+    def test_normalizes_backfill_checkpoints(self):
+        panel = normalize_panel({"guild_id": "1", "backfill": {"youtube": "42", "giveaway": None}})
+
+        self.assertEqual(panel["backfill"], {"youtube": 42})
+        self.assertEqual(normalize_panel({"guild_id": "1"})["backfill"], {})
+
     def test_ignores_empty_panel(self):
         self.assertEqual(normalize_panel(None), {})
 
@@ -0,0 +1,157 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import discord
+
+from commands.auto_role import BACKFILL_BATCH_SIZE, YOUTUBE_EMOJI, YOUTUBE_PING_ROLE_ID, AutoRole
+from services.role_assignment import assign_role_to_members, retry_after_seconds
+
+
+def http_error(status, headers=None):
+    response = SimpleNamespace(status=status, reason="error", headers=headers or {})
+    return discord.HTTPException(response, "error")
+
+
+class FakeMember:
+    def __init__(self, member_id, *, roles=(), bot=False, errors=(), delay=0.0):
+        self.id = member_id
+        self.roles = list(roles)
+        self.bot = bot
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = 0
+
+    async def add_roles(self, role, *, reason=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.roles.append(role)
+
+
+class AssignRolePoolTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bounded_pool_beats_sequential_delay(self):
+        members = [FakeMember(member_id, delay=0.01) for member_id in range(200, 0, -1)]
+        reports = []
+
+        async def on_progress(progress):
+            reports.append((progress.processed, progress.last_member_id))
+
+        started = time.perf_counter()
+        progress = await assign_role_to_members(
+            members, "role", reason="test", concurrency=8, on_progress=on_progress, progress_every=50
+        )
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual((progress.added, progress.failed, progress.last_member_id), (200, 0, 200))
+        self.assertLess(elapsed, 200 * 0.01 / 2)
+        self.assertEqual([processed for processed, _ in reports], [50, 100, 150, 200])
+        self.assertTrue(all(last_id is not None and last_id <= processed for processed, last_id in reports))
+
+    async def test_rate_limit_pauses_and_retries(self):
+        limited = FakeMember(1, errors=[http_error(429, {"Retry-After": "0.05"})])
+        forbidden = FakeMember(2, errors=[http_error(403)])
+
+        started = time.perf_counter()
+        progress = await assign_role_to_members([limited, forbidden], "role", reason="test")
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+        self.assertEqual((progress.added, progress.failed), (1, 1))
+        self.assertEqual((limited.calls, forbidden.calls), (2, 1))
+
+    def test_retry_after_only_for_rate_limits(self):
+        self.assertEqual(retry_after_seconds(http_error(429, {"X-RateLimit-Reset-After": "2.5"})), 2.5)
+        self.assertIsNone(retry_after_seconds(http_error(500)))
+
+
+class SyncGuildTests(unittest.IsolatedAsyncioTestCase):
+    async def test_resumes_after_checkpoint_and_clears_it(self):
+        role = SimpleNamespace(id=9)
+        members = [
+            FakeMember(1),
+            FakeMember(2, roles=[role]),
+            FakeMember(3, bot=True),
+            FakeMember(4),
+            FakeMember(5),
+        ]
+        guild = SimpleNamespace(id=7, name="Guild", chunked=True, members=members)
+        cog = AutoRole(bot=None)
+        cog._ensure_member_role = AsyncMock(return_value=(role, None))
+        checkpoint = {"guild_id": 7, "role_id": 9, "last_member_id": 4, "added": 3, "failed": 1}
+
+        with (
+            patch.object(cog._sync_store, "load_checkpoint", AsyncMock(return_value=checkpoint)),
+            patch.object(cog._sync_store, "save_checkpoint", AsyncMock()) as save,
+            patch.object(cog._sync_store, "clear_checkpoint", AsyncMock()) as clear,
+        ):
+            result = await cog.sync_guild(guild, reason="test")
+
+        self.assertEqual((result.checked, result.added, result.failed), (5, 1, 0))
+        self.assertEqual((result.already_had_role, result.skipped_bots, result.skipped_checkpoint), (0, 1, 3))
+        self.assertEqual((result.resumed_added, result.resumed_failed), (3, 1))
+        self.assertEqual(
+            result.checked,
+            result.skipped_bots + result.skipped_checkpoint + result.already_had_role + result.added + result.failed,
+        )
+        self.assertEqual([member.calls for member in members], [0, 0, 0, 0, 1])
+        self.assertEqual(save.await_args.args[0]["last_member_id"], 5)
+        self.assertEqual((save.await_args.args[0]["added"], save.await_args.args[0]["failed"]), (4, 1))
+        clear.assert_awaited_once_with(7)
+
+
+class FakeReaction:
+    def __init__(self, emoji, user_ids):
+        self.emoji = emoji
+        self.user_ids = user_ids
+        self.after = None
+
+    async def users(self, *, limit=None, after=None):
+        self.after = after
+        for user_id in self.user_ids:
+            if after is None or user_id > after.id:
+                yield SimpleNamespace(id=user_id, bot=False)
+
+
+class ReactionBackfillTests(unittest.IsolatedAsyncioTestCase):
+    async def test_resumes_from_checkpoint_and_resolves_members_in_bulk(self):
+        role = SimpleNamespace(id=YOUTUBE_PING_ROLE_ID, name="YouTube Ping")
+        cached = {user_id: FakeMember(user_id) for user_id in range(1, 151)}
+        remote = {user_id: FakeMember(user_id) for user_id in range(151, 251)}
+        queries = []
+
+        async def query_members(*, user_ids, limit, cache):
+            queries.append(len(user_ids))
+            return [remote[user_id] for user_id in user_ids if user_id in remote]
+
+        guild = SimpleNamespace(
+            id=7,
+            chunked=False,
+            get_role=lambda role_id: role,
+            get_member=cached.get,
+            query_members=query_members,
+        )
+        reaction = FakeReaction(YOUTUBE_EMOJI, list(range(1, 261)))
+        cog = AutoRole(bot=SimpleNamespace(user=SimpleNamespace(id=999)))
+        cog._can_manage_role = lambda guild, role: True
+        cog._panel_records[7] = {"guild_id": 7, "backfill": {"youtube": 50}}
+
+        with patch.object(cog._panel_store, "save_backfill_checkpoint", AsyncMock()) as save:
+            result = await cog._sync_members_from_reactions(guild, SimpleNamespace(reactions=[reaction]))
+
+        self.assertEqual(reaction.after.id, 50)
+        self.assertEqual((result.added, result.missing_members), (200, 10))
+        self.assertEqual(sum(queries), 110)
+        self.assertTrue(all(size <= BACKFILL_BATCH_SIZE for size in queries))
+        self.assertEqual(cached[50].calls, 0)
+        self.assertEqual(
+            [call.args for call in save.await_args_list],
+            [(7, "youtube", 150), (7, "youtube", 250), (7, "youtube", None)],
+        )
+        self.assertEqual(cog._panel_records[7]["backfill"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
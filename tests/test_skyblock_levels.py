@@ -0,0 +1,105 @@
+import os
+import time
+import unittest
+
+from commands.skyblock import (
+    CORE_SKILLS,
+    DUNGEON_XP_STEPS,
+    DUNGEON_XP_TABLE,
+    EXTRA_SKILLS,
+    SKILL_XP_STEPS,
+    SKILL_XP_TABLE,
+    level_from_xp,
+    skill_experience,
+    skill_rows,
+    slayer_level,
+)
+
+
+def linear_level_from_xp(xp, steps, cap=None):
+    remaining = float(xp)
+    level = 0
+    max_level = cap or len(steps)
+    for required in steps[:max_level]:
+        if remaining < required:
+            return round(level + (remaining / required), 2)
+        remaining -= required
+        level += 1
+    return float(max_level)
+
+
+def realistic_member():
+    experience = {
+        "SKILL_FARMING": 111_672_425,
+        "SKILL_MINING": 55_172_425,
+        "SKILL_COMBAT": 48_200_310,
+        "SKILL_FORAGING": 9_400_000,
+        "SKILL_FISHING": 12_800_000,
+        "SKILL_ENCHANTING": 111_672_425,
+        "SKILL_ALCHEMY": 55_000_000,
+        "SKILL_TAMING": 47_000_000,
+        "SKILL_CARPENTRY": 30_000_000,
+        "SKILL_RUNECRAFTING": 94_450,
+        "SKILL_SOCIAL": 120_000,
+    }
+    return {"player_data": {"experience": experience}}
+
+
+class SkyBlockLevelTableTests(unittest.TestCase):
+    def test_table_matches_linear_walk(self):
+        samples = [-10, 0, 49, 50, 174, 175, 12_345, 1_000_000, 55_172_425, 111_672_425, 500_000_000]
+        for xp in samples:
+            with self.subTest(xp=xp):
+                self.assertEqual(level_from_xp(xp, SKILL_XP_TABLE, 60), linear_level_from_xp(xp, SKILL_XP_STEPS, 60))
+                self.assertEqual(level_from_xp(xp, SKILL_XP_TABLE, 50), linear_level_from_xp(xp, SKILL_XP_STEPS, 50))
+                self.assertEqual(level_from_xp(xp, DUNGEON_XP_TABLE, 50), linear_level_from_xp(xp, DUNGEON_XP_STEPS, 50))
+
+    def test_slayer_level_falls_back_to_xp_table(self):
+        self.assertEqual(slayer_level({"claimed_levels": {"level_1": True, "level_2": True}}, "zombie"), 2)
+        self.assertEqual(slayer_level({"xp": 20_000}, "zombie"), 6)
+        self.assertEqual(slayer_level({"xp": 19_999}, "wolf"), 5)
+        self.assertEqual(slayer_level({"xp": 5_000}, "vampire"), 5)
+        self.assertEqual(slayer_level({"xp": 5_000}), 0)
+
+    def test_realistic_member_levels_match_linear_walk(self):
+        member = realistic_member()
+        skills = CORE_SKILLS + EXTRA_SKILLS
+        xps = [skill_experience(member, legacy_name, api_name) for _label, legacy_name, api_name in skills]
+
+        self.assertEqual(len(skill_rows(member, skills)), len(skills))
+        for xp in xps:
+            with self.subTest(xp=xp):
+                self.assertEqual(level_from_xp(xp, SKILL_XP_TABLE, 60), linear_level_from_xp(xp, SKILL_XP_STEPS, 60))
+
+
+@unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "set RUN_BENCHMARKS=1 to run benchmarks")
+class SkyBlockLevelBenchmark(unittest.TestCase):
+    def test_bisect_lookup_vs_linear_walk(self):
+        member = realistic_member()
+        skills = CORE_SKILLS + EXTRA_SKILLS
+        xps = [skill_experience(member, legacy_name, api_name) for _label, legacy_name, api_name in skills]
+        iterations = 2000
+
+        def run_linear():
+            for _ in range(iterations):
+                for xp in xps:
+                    linear_level_from_xp(xp, SKILL_XP_STEPS, 60)
+
+        def run_table():
+            for _ in range(iterations):
+                for xp in xps:
+                    level_from_xp(xp, SKILL_XP_TABLE, 60)
+
+        linear = min(_timed(run_linear) for _ in range(3))
+        table = min(_timed(run_table) for _ in range(3))
+        print(f"\nskill levels x{iterations * len(xps)}: linear {linear * 1000:.1f} ms, table {table * 1000:.1f} ms")
+
+
+def _timed(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    unittest.main()
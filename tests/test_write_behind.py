@@ -0,0 +1,76 @@
+import unittest
+
+from services.write_behind import WriteBehindQueue
+
+
+class WriteBehindQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.records = {}
+        self.flushed = []
+        self.fail_next = False
+
+        async def flush(records):
+            if self.fail_next:
+                self.fail_next = False
+                raise RuntimeError("boom")
+            self.flushed.append({key: dict(value) for key, value in records.items()})
+
+        self.queue = WriteBehindQueue("test", self.records.get, flush, delay=60)
+
+    async def asyncTearDown(self):
+        await self.queue.close()
+
+    async def test_coalesces_repeated_saves_into_one_write(self):
+        self.records["1"] = {"value": 1}
+        self.queue.mark_dirty(1)
+        self.records["1"]["value"] = 2
+        self.queue.mark_dirty("1")
+        self.records["2"] = {"value": 3}
+        self.queue.mark_dirty(2)
+
+        self.assertTrue(await self.queue.flush())
+
+        self.assertEqual(self.flushed, [{"1": {"value": 2}, "2": {"value": 3}}])
+        self.assertEqual(self.queue.coalesced, 1)
+        self.assertEqual(self.queue.pending_count, 0)
+
+    async def test_failed_flush_keeps_records_dirty(self):
+        self.records["1"] = {"value": 1}
+        self.queue.mark_dirty(1)
+        self.fail_next = True
+
+        self.assertFalse(await self.queue.flush())
+        self.assertEqual(self.queue.pending_count, 1)
+        self.assertTrue(await self.queue.flush())
+        self.assertEqual(self.flushed, [{"1": {"value": 1}}])
+
+    async def test_skips_discarded_and_missing_records(self):
+        self.records["1"] = {"value": 1}
+        self.queue.mark_dirty(1)
+        self.queue.mark_dirty(2)
+        await self.queue.discard(1)
+
+        await self.queue.flush()
+
+        self.assertEqual(self.flushed, [])
+
+    async def test_close_flushes_pending_records(self):
+        self.records["1"] = {"value": 1}
+        self.queue.mark_dirty(1)
+
+        await self.queue.close()
+
+        self.assertEqual(self.flushed, [{"1": {"value": 1}}])
+
+    async def test_timer_flushes_after_delay(self):
+        self.queue.delay = 0
+        self.records["1"] = {"value": 1}
+        self.queue.mark_dirty(1)
+
+        await self.queue._timer
+
+        self.assertEqual(self.flushed, [{"1": {"value": 1}}])
+
+
+if __name__ == "__main__":
+    unittest.main()